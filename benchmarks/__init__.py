@@ -0,0 +1,8 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Gammapy benchmarks.
+
+The benchmarks are run with `airspeed velocity <https://asv.readthedocs.io>`__,
+see ``asv.conf.json`` at the root of the repository, or without asv using
+``dev/run_benchmarks.py``. All inputs are synthetic and created in-process,
+so that no ``$GAMMAPY_DATA`` download is needed.
+"""
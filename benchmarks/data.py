@@ -0,0 +1,31 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Benchmarks of event list I/O."""
+import shutil
+import tempfile
+from pathlib import Path
+from astropy.io import fits
+from gammapy.data import EventList
+from .utils import make_events
+
+
+class EventListRead:
+    """Reading an event list from a FITS file."""
+
+    params = [10_000, 1_000_000]
+    param_names = ["n_events"]
+
+    def setup(self, n_events):
+        self.path = Path(tempfile.mkdtemp())
+        self.filename = self.path / "events.fits"
+        events = make_events(n_events=n_events)
+        hdulist = fits.HDUList([fits.PrimaryHDU(), events.to_table_hdu()])
+        hdulist.writeto(self.filename)
+
+    def teardown(self, n_events):
+        shutil.rmtree(self.path)
+
+    def time_read(self, n_events):
+        EventList.read(self.filename)
+
+    def peakmem_read(self, n_events):
+        EventList.read(self.filename)
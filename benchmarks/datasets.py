@@ -0,0 +1,66 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Benchmarks of model evaluation and fitting."""
+from gammapy.datasets import Datasets
+from gammapy.modeling import Fit
+from gammapy.modeling.models import Models
+from .utils import make_map_dataset
+
+
+class ComputeNpred:
+    """Predicted counts of all sources of a map dataset."""
+
+    params = ([100, 400], [5, 20], [1, 10])
+    param_names = ["npix", "nbin", "n_sources"]
+
+    def setup(self, npix, nbin, n_sources):
+        self.dataset = make_map_dataset(npix=npix, nbin=nbin, n_sources=n_sources)
+        # prepare the evaluators, so that only the evaluation is measured
+        self.dataset.npred()
+
+        for evaluator in self.dataset.evaluators.values():
+            evaluator.use_cache = False
+
+    def _compute_npred(self):
+        for evaluator in self.dataset.evaluators.values():
+            evaluator.compute_npred()
+
+    def time_compute_npred(self, npix, nbin, n_sources):
+        self._compute_npred()
+
+    def peakmem_compute_npred(self, npix, nbin, n_sources):
+        self._compute_npred()
+
+
+class FitRun:
+    """Joint likelihood fit of sources over several map datasets."""
+
+    params = ([1, 4], [1, 3])
+    param_names = ["n_datasets", "n_sources"]
+    timeout = 300
+
+    def setup(self, n_datasets, n_sources):
+        datasets = Datasets()
+
+        for idx in range(n_datasets):
+            dataset = make_map_dataset(
+                npix=100, nbin=5, n_sources=n_sources, name=f"dataset-{idx}", seed=idx
+            )
+            datasets.append(dataset)
+
+        # share the source models between datasets
+        models = datasets[0].models[:n_sources]
+        for dataset in datasets:
+            dataset.models = Models(models + [dataset.background_model])
+
+        self.datasets = datasets
+        self.parameters = datasets.models.parameters.copy()
+
+    def _run(self):
+        self.datasets.models.parameters.value = self.parameters.value
+        Fit().run(self.datasets)
+
+    def time_run(self, n_datasets, n_sources):
+        self._run()
+
+    def peakmem_run(self, n_datasets, n_sources):
+        self._run()
@@ -0,0 +1,207 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Benchmarks of flux estimators."""
+
+import numpy as np
+import astropy.units as u
+from astropy.convolution import Gaussian2DKernel
+from gammapy.estimators import (
+    ASmoothMapEstimator,
+    ExcessMapEstimator,
+    FluxPointsEstimator,
+    FluxProfileEstimator,
+    ImageProfileEstimator,
+    TSMapEstimator,
+)
+from gammapy.modeling.models import (
+    GaussianSpatialModel,
+    PointSpatialModel,
+    PowerLawSpectralModel,
+    SkyModel,
+)
+from gammapy.estimators.utils import combine_flux_maps
+from gammapy.maps import Map
+from gammapy.utils.regions import make_orthogonal_rectangle_sky_regions
+from .utils import SKYDIR, make_geom, make_map_dataset
+
+
+class TSMapEstimatorRun:
+    """TS map of a point source hypothesis."""
+
+    params = ([50, 100], [1, 5])
+    param_names = ["npix", "nbin"]
+    timeout = 300
+
+    def setup(self, npix, nbin):
+        self.dataset = make_map_dataset(npix=npix, nbin=nbin, n_sources=2)
+        self.estimator = TSMapEstimator(
+            kernel_width="0.2 deg", selection_optional=[], sum_over_energy_groups=True
+        )
+
+    def time_run(self, npix, nbin):
+        self.estimator.run(self.dataset)
+
+    def peakmem_run(self, npix, nbin):
+        self.estimator.run(self.dataset)
+
+
+class TSMapEstimatorRunModels:
+    """TS maps of several source sizes in several energy bands."""
+
+    params = [False, True]
+    param_names = ["shared"]
+    timeout = 300
+
+    def setup(self, shared):
+        self.dataset = make_map_dataset(npix=50, nbin=10, n_sources=2)
+        spectral_model = PowerLawSpectralModel()
+        self.models = [
+            SkyModel(spectral_model, PointSpatialModel(), name="point"),
+        ]
+        for sigma in [0.05, 0.1, 0.2]:
+            spatial_model = GaussianSpatialModel(sigma=f"{sigma} deg")
+            self.models.append(
+                SkyModel(spectral_model, spatial_model, name=f"gauss-{sigma}")
+            )
+
+        self.estimator = TSMapEstimator(
+            kernel_width="0.6 deg",
+            energy_edges=np.geomspace(1, 100, 6) * u.TeV,
+            selection_optional=[],
+        )
+
+    def time_run(self, shared):
+        if shared:
+            self.estimator.run_models(self.dataset, self.models)
+        else:
+            for model in self.models:
+                self.estimator.model = model
+                self.estimator.run(self.dataset)
+
+
+class ExcessMapEstimatorRun:
+    """Correlated significance maps at several correlation radii."""
+
+    params = ([200, 500], [1, 4])
+    param_names = ["npix", "n_radii"]
+    timeout = 300
+
+    def setup(self, npix, n_radii):
+        self.dataset = make_map_dataset(npix=npix, nbin=4, n_sources=4)
+        self.radii = np.linspace(0.05, 0.3, n_radii) * u.deg
+        self.estimator = ExcessMapEstimator(energy_edges=[1, 10, 100] * u.TeV)
+
+    def time_run_radii(self, npix, n_radii):
+        self.estimator.run_radii(self.dataset, self.radii)
+
+    def peakmem_run_radii(self, npix, n_radii):
+        self.estimator.run_radii(self.dataset, self.radii)
+
+
+class ASmoothMapEstimatorRun:
+    """Adaptively smoothed maps, exact and using an image pyramid."""
+
+    params = ([200, 500], [None, 4])
+    param_names = ["npix", "pyramid_min_width"]
+    timeout = 300
+
+    def setup(self, npix, pyramid_min_width):
+        self.dataset = make_map_dataset(npix=npix, nbin=1, n_sources=4)
+        scales = ASmoothMapEstimator.get_scales(n_scales=9, kernel=Gaussian2DKernel)
+        self.estimator = ASmoothMapEstimator(
+            scales=scales * 0.04 * u.deg,
+            kernel=Gaussian2DKernel,
+            pyramid_min_width=pyramid_min_width,
+        )
+
+    def time_run(self, npix, pyramid_min_width):
+        self.estimator.run(self.dataset)
+
+    def peakmem_run(self, npix, pyramid_min_width):
+        self.estimator.run(self.dataset)
+
+
+class FluxPointsEstimatorRun:
+    """Flux points of a source in a map dataset."""
+
+    params = ([2, 8], [[], ["errn-errp", "ul"]])
+    param_names = ["n_flux_points", "selection_optional"]
+    timeout = 300
+
+    def setup(self, n_flux_points, selection_optional):
+        self.dataset = make_map_dataset(npix=50, nbin=16, n_sources=1)
+        energy_edges = np.geomspace(1, 100, n_flux_points + 1) * u.TeV
+        self.estimator = FluxPointsEstimator(
+            energy_edges=energy_edges,
+            source="source-0",
+            selection_optional=selection_optional,
+        )
+
+    def time_run(self, n_flux_points, selection_optional):
+        self.estimator.run(self.dataset)
+
+    def peakmem_run(self, n_flux_points, selection_optional):
+        self.estimator.run(self.dataset)
+
+
+class CombineFluxMaps:
+    """Combination of the flux maps of many runs."""
+
+    params = ([10, 100], ["gaussian_errors", "distrib"])
+    param_names = ["n_maps", "method"]
+    timeout = 300
+
+    def setup(self, n_maps, method):
+        dataset = make_map_dataset(npix=20, nbin=1, n_sources=4)
+        estimator = TSMapEstimator(
+            kernel_width="0.2 deg",
+            selection_optional=["errn-errp"],
+            sum_over_energy_groups=True,
+        )
+        self.maps = n_maps * [estimator.run(dataset)]
+
+    def time_combine(self, n_maps, method):
+        combine_flux_maps(self.maps, method=method)
+
+    def peakmem_combine(self, n_maps, method):
+        combine_flux_maps(self.maps, method=method)
+
+
+class FluxProfileEstimatorRun:
+    """Flux profile along rectangular boxes."""
+
+    params = [10, 50]
+    param_names = ["n_regions"]
+    timeout = 300
+
+    def setup(self, n_regions):
+        self.dataset = make_map_dataset(npix=100, nbin=3, n_sources=4)
+        wcs = self.dataset.counts.geom.wcs
+        regions = make_orthogonal_rectangle_sky_regions(
+            start_pos=SKYDIR.directional_offset_by(-90 * u.deg, 0.8 * u.deg),
+            end_pos=SKYDIR.directional_offset_by(90 * u.deg, 0.8 * u.deg),
+            wcs=wcs,
+            height=0.5 * u.deg,
+            nbin=n_regions,
+        )
+        self.estimator = FluxProfileEstimator(
+            regions=regions, energy_edges=[1, 100] * u.TeV, selection_optional=[]
+        )
+
+    def time_run(self, n_regions):
+        self.estimator.run(self.dataset)
+
+
+class ImageProfileEstimatorRun:
+    """Mean profile of a large image."""
+
+    params = ["lon", "radial"]
+    param_names = ["axis"]
+
+    def setup(self, axis):
+        geom = make_geom(npix=(3000, 500), nbin=1).to_image()
+        rng = np.random.default_rng(0)
+        self.image = Map.from_geom(geom, data=rng.normal(size=geom.data_shape))
+        self.estimator = ImageProfileEstimator(axis=axis, method="mean", center=SKYDIR)
+
+    def time_run(self, axis):
+        self.estimator.run(self.image, image_err=self.image)
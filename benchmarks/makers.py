@@ -0,0 +1,29 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Benchmarks of data reduction."""
+from gammapy.datasets import MapDataset
+from gammapy.makers import MapDatasetMaker
+from gammapy.maps import MapAxis
+from .utils import make_geom, make_observation
+
+
+class MapDatasetMakerRun:
+    """Reduction of an observation to a map dataset."""
+
+    params = ([100, 250], [5, 20])
+    param_names = ["npix", "nbin"]
+    timeout = 300
+
+    def setup(self, npix, nbin):
+        self.observation = make_observation(n_events=100_000)
+        geom = make_geom(npix=npix, nbin=nbin)
+        energy_axis_true = MapAxis.from_energy_bounds(
+            "0.5 TeV", "200 TeV", nbin=2 * nbin, name="energy_true"
+        )
+        self.dataset = MapDataset.create(geom, energy_axis_true=energy_axis_true)
+        self.maker = MapDatasetMaker()
+
+    def time_run(self, npix, nbin):
+        self.maker.run(self.dataset, self.observation)
+
+    def peakmem_run(self, npix, nbin):
+        self.maker.run(self.dataset, self.observation)
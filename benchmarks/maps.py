@@ -0,0 +1,26 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Benchmarks of map operations."""
+import numpy as np
+from gammapy.maps import Map, WcsGeom
+from .utils import SKYDIR, make_geom
+
+
+class ReprojectToGeom:
+    """Reprojection of a cube onto an image geometry in another frame."""
+
+    params = ([100, 400], [1, 10], [False, True])
+    param_names = ["npix", "nbin", "preserve_counts"]
+
+    def setup(self, npix, nbin, preserve_counts):
+        geom = make_geom(npix=npix, nbin=nbin)
+        data = np.random.default_rng(0).random(geom.data_shape)
+        self.map = Map.from_geom(geom, data=data)
+        self.geom_out = WcsGeom.create(
+            skydir=SKYDIR.icrs, npix=npix // 2, binsz=0.03, frame="icrs", proj="TAN"
+        )
+
+    def time_reproject_to_geom(self, npix, nbin, preserve_counts):
+        self.map.reproject_to_geom(self.geom_out, preserve_counts=preserve_counts)
+
+    def peakmem_reproject_to_geom(self, npix, nbin, preserve_counts):
+        self.map.reproject_to_geom(self.geom_out, preserve_counts=preserve_counts)
@@ -0,0 +1,262 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Synthetic inputs shared by the benchmarks."""
+import numpy as np
+import astropy.units as u
+from astropy.coordinates import SkyCoord
+from astropy.table import Table
+from astropy.time import Time
+from gammapy.data import EventList, FixedPointingInfo, Observation
+from gammapy.datasets import MapDataset
+from gammapy.irf import (
+    PSF3D,
+    Background3D,
+    EffectiveAreaTable2D,
+    EnergyDispersion2D,
+    PSFMap,
+)
+from gammapy.maps import MapAxis, WcsGeom
+from gammapy.modeling.models import (
+    FoVBackgroundModel,
+    GaussianSpatialModel,
+    Models,
+    PointSpatialModel,
+    PowerLawSpectralModel,
+    SkyModel,
+)
+
+__all__ = [
+    "BINSZ",
+    "SKYDIR",
+    "make_events",
+    "make_geom",
+    "make_map_dataset",
+    "make_models",
+    "make_observation",
+]
+
+SKYDIR = SkyCoord(0, 0, unit="deg", frame="galactic")
+
+BINSZ = 0.02 * u.deg
+
+REFERENCE_TIME = Time("2000-01-01 00:00:00")
+
+
+def make_geom(npix, nbin, binsz=BINSZ, name="energy"):
+    """Make a WCS cube geometry centered on `SKYDIR`.
+
+    Parameters
+    ----------
+    npix : int
+        Number of pixels along each spatial axis.
+    nbin : int
+        Number of energy bins between 1 and 100 TeV.
+    binsz : `~astropy.units.Quantity`, optional
+        Pixel size. Default is `BINSZ`.
+    name : {"energy", "energy_true"}, optional
+        Name of the energy axis. Default is "energy".
+
+    Returns
+    -------
+    geom : `~gammapy.maps.WcsGeom`
+        Geometry.
+    """
+    axis = MapAxis.from_energy_bounds("1 TeV", "100 TeV", nbin=nbin, name=name)
+    return WcsGeom.create(
+        skydir=SKYDIR, npix=npix, binsz=binsz, frame="galactic", axes=[axis]
+    )
+
+
+def make_models(n_sources, seed=0):
+    """Make point and Gaussian sources scattered around `SKYDIR`.
+
+    Parameters
+    ----------
+    n_sources : int
+        Number of sources, every second one is a Gaussian.
+    seed : int, optional
+        Random seed for the source positions. Default is 0.
+
+    Returns
+    -------
+    models : `~gammapy.modeling.models.Models`
+        Source models.
+    """
+    rng = np.random.default_rng(seed)
+    models = []
+
+    for idx in range(n_sources):
+        lon, lat = rng.uniform(-0.5, 0.5, size=2)
+
+        if idx % 2:
+            spatial_model = GaussianSpatialModel(
+                lon_0=f"{lon} deg",
+                lat_0=f"{lat} deg",
+                sigma="0.1 deg",
+                frame="galactic",
+            )
+        else:
+            spatial_model = PointSpatialModel(
+                lon_0=f"{lon} deg", lat_0=f"{lat} deg", frame="galactic"
+            )
+
+        spectral_model = PowerLawSpectralModel(
+            index=2.5, amplitude="1e-12 cm-2 s-1 TeV-1", reference="1 TeV"
+        )
+        models.append(
+            SkyModel(
+                spatial_model=spatial_model,
+                spectral_model=spectral_model,
+                name=f"source-{idx}",
+            )
+        )
+
+    return Models(models)
+
+
+def make_map_dataset(npix, nbin, n_sources=1, name="dataset", seed=0):
+    """Make a map dataset with IRFs and counts simulated from sources.
+
+    Parameters
+    ----------
+    npix : int
+        Number of pixels along each spatial axis.
+    nbin : int
+        Number of reconstructed energy bins.
+    n_sources : int, optional
+        Number of sources, see `make_models`. Default is 1.
+    name : str, optional
+        Dataset name. Default is "dataset".
+    seed : int, optional
+        Random seed. Default is 0.
+
+    Returns
+    -------
+    dataset : `~gammapy.datasets.MapDataset`
+        Map dataset with models set.
+    """
+    geom = make_geom(npix=npix, nbin=nbin)
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.5 TeV", "200 TeV", nbin=2 * nbin, name="energy_true"
+    )
+
+    dataset = MapDataset.create(geom, energy_axis_true=energy_axis_true, name=name)
+    dataset.exposure.data += 1e12
+    dataset.background.data += 0.1
+    dataset.psf = PSFMap.from_gauss(
+        energy_axis_true=energy_axis_true, sigma=0.05 * u.deg
+    )
+    dataset.mask_safe.data[...] = True
+
+    models = make_models(n_sources=n_sources, seed=seed)
+    models.append(FoVBackgroundModel(dataset_name=name))
+    dataset.models = models
+    dataset.fake(random_state=seed)
+    return dataset
+
+
+def make_events(n_events, seed=0):
+    """Make an event list uniformly distributed around `SKYDIR`.
+
+    Parameters
+    ----------
+    n_events : int
+        Number of events.
+    seed : int, optional
+        Random seed. Default is 0.
+
+    Returns
+    -------
+    events : `~gammapy.data.EventList`
+        Event list.
+    """
+    rng = np.random.default_rng(seed)
+    center = SKYDIR.icrs
+
+    table = Table()
+    table["EVENT_ID"] = np.arange(n_events, dtype=np.int64)
+    table["TIME"] = np.sort(rng.uniform(0, 3600, n_events)) * u.s
+    table["RA"] = (center.ra.deg + rng.uniform(-2, 2, n_events)) * u.deg
+    table["DEC"] = (center.dec.deg + rng.uniform(-2, 2, n_events)) * u.deg
+    table["ENERGY"] = 10 ** rng.uniform(0, 2, n_events) * u.TeV
+
+    table.meta["MJDREFI"] = int(REFERENCE_TIME.mjd)
+    table.meta["MJDREFF"] = REFERENCE_TIME.mjd % 1
+    table.meta["TIMESYS"] = "tt"
+    table.meta["TIMEUNIT"] = "s"
+    table.meta["TSTART"] = 0.0
+    table.meta["TSTOP"] = 3600.0
+    table.meta["RA_PNT"] = center.ra.deg
+    table.meta["DEC_PNT"] = center.dec.deg
+    table.meta["OBS_ID"] = 1
+    return EventList(table)
+
+
+def make_observation(n_events=100_000, seed=0):
+    """Make a one hour observation pointing at `SKYDIR` with synthetic IRFs.
+
+    Parameters
+    ----------
+    n_events : int, optional
+        Number of events. Default is 100000.
+    seed : int, optional
+        Random seed. Default is 0.
+
+    Returns
+    -------
+    observation : `~gammapy.data.Observation`
+        Observation with effective area, energy dispersion, PSF, background
+        and events.
+    """
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.1 TeV", "300 TeV", nbin=30, name="energy_true"
+    )
+    energy_axis = MapAxis.from_energy_bounds("0.1 TeV", "300 TeV", nbin=20)
+    offset_axis = MapAxis.from_bounds(0, 5, nbin=5, unit="deg", name="offset")
+    migra_axis = MapAxis.from_bounds(0.2, 5, nbin=100, node_type="edges", name="migra")
+    rad_axis = MapAxis.from_bounds(0, 1, nbin=100, unit="deg", name="rad")
+    fov_lon_axis = MapAxis.from_bounds(-5, 5, nbin=10, unit="deg", name="fov_lon")
+    fov_lat_axis = MapAxis.from_bounds(-5, 5, nbin=10, unit="deg", name="fov_lat")
+
+    aeff = EffectiveAreaTable2D.from_parametrization(
+        energy_axis_true=energy_axis_true, instrument="CTAO"
+    )
+    aeff = EffectiveAreaTable2D(
+        axes=[energy_axis_true, offset_axis],
+        data=aeff.quantity[:, :1] * np.ones(offset_axis.nbin),
+    )
+
+    edisp = EnergyDispersion2D.from_gauss(
+        energy_axis_true=energy_axis_true,
+        migra_axis=migra_axis,
+        offset_axis=offset_axis,
+        bias=0,
+        sigma=0.1,
+    )
+
+    sigma = 0.1
+    rad = rad_axis.center.to_value("deg")
+    data = np.exp(-0.5 * rad**2 / sigma**2) / (2 * np.pi * np.radians(sigma) ** 2)
+    psf = PSF3D(
+        axes=[energy_axis_true, offset_axis, rad_axis],
+        data=data * np.ones((energy_axis_true.nbin, offset_axis.nbin, 1)),
+        unit="sr-1",
+    )
+
+    energy = energy_axis.center.to_value("TeV")
+    data = 1e-3 * energy[:, np.newaxis, np.newaxis] ** -2.7
+    bkg = Background3D(
+        axes=[energy_axis, fov_lon_axis, fov_lat_axis],
+        data=data * np.ones((1, fov_lon_axis.nbin, fov_lat_axis.nbin)),
+        unit="s-1 MeV-1 sr-1",
+    )
+
+    pointing = FixedPointingInfo(fixed_icrs=SKYDIR.icrs)
+    observation = Observation.create(
+        pointing=pointing,
+        obs_id=1,
+        livetime="1 h",
+        irfs={"aeff": aeff, "edisp": edisp, "psf": psf, "bkg": bkg},
+        reference_time=REFERENCE_TIME,
+    )
+    observation._events = make_events(n_events=n_events, seed=seed)
+    return observation
@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Run the Gammapy benchmarks and compare them to a baseline.
+
+The benchmarks in ``benchmarks/`` follow the airspeed velocity conventions
+and are preferably run with asv, e.g. to compare the current branch to main::
+
+    asv continuous --factor 1.2 main HEAD
+
+This script runs the same benchmarks in the current environment, without asv.
+Timings and peak memory (as traced by `tracemalloc`) are written to a JSON
+file, which can be used as a baseline for a later run::
+
+    git checkout main
+    python dev/run_benchmarks.py --output baseline.json
+    git checkout my-branch
+    python dev/run_benchmarks.py --output new.json --compare baseline.json
+
+The exit code is 1 if any benchmark got slower or used more memory than the
+baseline by more than the given factor.
+"""
+import argparse
+import importlib
+import inspect
+import itertools
+import json
+import logging
+import pkgutil
+import re
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+log = logging.getLogger(__name__)
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def get_benchmark_classes():
+    """Get the benchmark classes defined in the ``benchmarks`` package."""
+    sys.path.insert(0, str(ROOT))
+    import benchmarks
+
+    for module_info in pkgutil.iter_modules(benchmarks.__path__):
+        if module_info.name == "utils":
+            continue
+
+        module = importlib.import_module(f"benchmarks.{module_info.name}")
+
+        for name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ == module.__name__:
+                yield f"{module_info.name}.{name}", cls
+
+
+def get_params(cls, quick=False):
+    """Get all parameter combinations of a benchmark class."""
+    params = getattr(cls, "params", [])
+
+    if not params:
+        return [()]
+
+    if not getattr(cls, "param_names", None) or len(cls.param_names) == 1:
+        params = [params]
+
+    if quick:
+        params = [values[:1] for values in params]
+
+    return list(itertools.product(*params))
+
+
+def measure(method, kind, repeat):
+    """Measure run time in seconds or peak memory in bytes of a method."""
+    if kind == "time":
+        return min(timeit.repeat(method, number=1, repeat=repeat))
+
+    tracemalloc.start()
+    try:
+        method()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def run_benchmarks(pattern=None, quick=False, repeat=3):
+    """Run the benchmarks.
+
+    Parameters
+    ----------
+    pattern : str, optional
+        Regular expression selecting the benchmarks by name. Default is None.
+    quick : bool, optional
+        Only run the first parameter combination of each benchmark.
+        Default is False.
+    repeat : int, optional
+        Number of repetitions of timing benchmarks, the minimum is kept.
+        Default is 3.
+
+    Returns
+    -------
+    results : dict
+        Measured values by benchmark name.
+    """
+    results = {}
+
+    for class_name, cls in get_benchmark_classes():
+        methods = [
+            name
+            for name in dir(cls)
+            if name.startswith(("time_", "peakmem_"))
+            and (pattern is None or re.search(pattern, f"{class_name}.{name}"))
+        ]
+
+        if not methods:
+            continue
+
+        for params in get_params(cls, quick=quick):
+            bench = cls()
+            if hasattr(bench, "setup"):
+                bench.setup(*params)
+
+            try:
+                for name in methods:
+                    key = f"{class_name}.{name}({', '.join(map(repr, params))})"
+                    kind = name.split("_")[0]
+                    method = getattr(bench, name)
+                    value = measure(lambda: method(*params), kind=kind, repeat=repeat)
+                    results[key] = {"kind": kind, "value": value}
+                    print(f"{key:<80} {format_value(kind, value)}")
+            finally:
+                if hasattr(bench, "teardown"):
+                    bench.teardown(*params)
+
+    return results
+
+
+def format_value(kind, value):
+    """Format a measured value."""
+    if kind == "time":
+        return f"{value * 1e3:10.2f} ms"
+    return f"{value / 1024**2:10.2f} MB"
+
+
+def compare(results, baseline, factor=1.2):
+    """Print the ratio of the results to the baseline.
+
+    Parameters
+    ----------
+    results : dict
+        Measured values by benchmark name.
+    baseline : dict
+        Baseline values by benchmark name.
+    factor : float, optional
+        Ratio above which a benchmark is reported as a regression.
+        Default is 1.2.
+
+    Returns
+    -------
+    regressions : list of str
+        Names of the benchmarks that regressed.
+    """
+    regressions = []
+
+    print(f"\n{'benchmark':<80} {'baseline':>13} {'new':>13} {'ratio':>7}")
+
+    for key, result in results.items():
+        if key not in baseline:
+            continue
+
+        kind = result["kind"]
+        value, value_ref = result["value"], baseline[key]["value"]
+        ratio = value / value_ref if value_ref else float("inf")
+
+        flag = ""
+        if ratio > factor:
+            flag = " +"
+            regressions.append(key)
+        elif ratio < 1 / factor:
+            flag = " -"
+
+        print(
+            f"{key:<80} {format_value(kind, value_ref)} "
+            f"{format_value(kind, value)} {ratio:7.2f}{flag}"
+        )
+
+    return regressions
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "-b", "--bench", help="Regular expression selecting the benchmarks to run"
+    )
+    parser.add_argument(
+        "--quick",
+        action="store_true",
+        help="Only run the first parameter combination of each benchmark",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of repetitions of timings"
+    )
+    parser.add_argument("-o", "--output", help="JSON file to write the results to")
+    parser.add_argument("-c", "--compare", help="JSON file with baseline results")
+    parser.add_argument(
+        "-f",
+        "--factor",
+        type=float,
+        default=1.2,
+        help="Ratio to the baseline above which a result is a regression",
+    )
+    args = parser.parse_args(args)
+
+    results = run_benchmarks(pattern=args.bench, quick=args.quick, repeat=args.repeat)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(results, baseline, factor=args.factor)
+
+        if regressions:
+            log.error(f"{len(regressions)} benchmark(s) regressed: {regressions}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    sys.exit(main())
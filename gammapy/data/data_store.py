@@ -1,6 +1,8 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import hashlib
 import html
 import logging
+import os
 import subprocess
 from copy import copy
 from pathlib import Path
@@ -8,7 +10,11 @@ import numpy as np
 from astropy import units as u
 from astropy.coordinates import SkyCoord
 from astropy.io import fits
+from astropy.table import vstack
+from astropy.table.meta import get_header_from_yaml, get_yaml_from_table
+from astropy.time import Time
 import gammapy.utils.time as tu
+from gammapy.utils import parallel as parallel
 from gammapy.utils.pbar import progress_bar
 from gammapy.utils.scripts import make_path
 from gammapy.utils.testing import Checker
@@ -35,6 +41,108 @@ log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
 
+def _get_index_cache_filename(filename):
+    """Filename of the binary cache file of an index table."""
+    return filename.parent / f"{filename.name}.cache.npz"
+
+
+def _get_file_checksum(filename):
+    """MD5 checksum of a file."""
+    md5 = hashlib.md5()
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(2**20), b""):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def _read_index_table_cache(table_class, filename, stat, checksum):
+    """Read index table from cache file, return None if the cache is not valid."""
+    cache_filename = _get_index_cache_filename(filename)
+
+    if not cache_filename.exists():
+        return None
+
+    try:
+        with np.load(cache_filename, allow_pickle=False) as cache:
+            valid = (
+                int(cache["mtime"]) == stat.st_mtime_ns
+                and int(cache["size"]) == stat.st_size
+                and str(cache["checksum"]) == checksum
+            )
+            if not valid:
+                log.debug(f"Outdated index cache {cache_filename}")
+                return None
+
+            data = cache["data"]
+            header = get_header_from_yaml(str(cache["header"]).splitlines())
+    except (OSError, ValueError, KeyError) as error:
+        log.warning(f"Could not read index cache {cache_filename}: {error}")
+        return None
+
+    table = table_class(data, meta=header.get("meta", {}))
+
+    for info in header["datatype"]:
+        column = table[info["name"]]
+        column.unit = info.get("unit")
+        column.description = info.get("description")
+        column.format = info.get("format")
+        column.meta = info.get("meta", {})
+
+    log.debug(f"Read index cache {cache_filename}")
+    return table
+
+
+def _write_index_table_cache(table, filename, stat, checksum):
+    """Write index table to a cache file next to the index file."""
+    cache_filename = _get_index_cache_filename(filename)
+
+    if table.has_masked_columns:
+        log.debug(f"Index table {filename} has masked columns, not caching.")
+        return
+
+    tmp_filename = cache_filename.parent / f"{cache_filename.name}.{os.getpid()}.tmp"
+
+    try:
+        header = "\n".join(get_yaml_from_table(table))
+        with open(tmp_filename, "wb") as f:
+            np.savez(
+                f,
+                data=table.as_array(),
+                header=np.array(header),
+                mtime=np.array(stat.st_mtime_ns),
+                size=np.array(stat.st_size),
+                checksum=np.array(checksum),
+            )
+        os.replace(tmp_filename, cache_filename)
+    except (OSError, ValueError, TypeError) as error:
+        log.warning(f"Could not write index cache {cache_filename}: {error}")
+        tmp_filename.unlink(missing_ok=True)
+        return
+
+    log.debug(f"Wrote index cache {cache_filename}")
+
+
+def _read_index_table(table_class, filename, cache=False):
+    """Read index table, optionally using a binary cache file.
+
+    The cache file is written next to the index file and is only used if the
+    modification time, size and checksum of the index file did not change.
+    """
+    if not cache:
+        return table_class.read(filename, format="fits")
+
+    stat = filename.stat()
+    checksum = _get_file_checksum(filename)
+
+    table = _read_index_table_cache(table_class, filename, stat, checksum)
+
+    if table is None:
+        table = table_class.read(filename, format="fits")
+        _write_index_table_cache(table, filename, stat, checksum)
+
+    return table
+
+
 class DataStore:
     """IACT data store.
 
@@ -127,7 +235,9 @@ class DataStore:
         return cls(hdu_table=hdu_table, obs_table=obs_table)
 
     @classmethod
-    def from_dir(cls, base_dir, hdu_table_filename=None, obs_table_filename=None):
+    def from_dir(
+        cls, base_dir, hdu_table_filename=None, obs_table_filename=None, cache=False
+    ):
         """Create from a directory.
 
         Parameters
@@ -140,6 +250,11 @@ class DataStore:
         obs_table_filename : str or `~pathlib.Path`, optional
             Filename of the observation index file. May be specified either relative
             to `base_dir` or as an absolute path. If None, default is obs-index.fits.gz.
+        cache : bool, optional
+            Use a binary cache of the index tables. The cache files are written
+            next to the index files (e.g. "hdu-index.fits.gz.cache.npz") on first
+            use and are only read if the modification time, size and checksum
+            of the index files are unchanged. Default is False.
 
         Returns
         -------
@@ -172,7 +287,7 @@ class DataStore:
         if not hdu_table_filename.exists():
             raise OSError(f"File not found: {hdu_table_filename}")
         log.debug(f"Reading {hdu_table_filename}")
-        hdu_table = HDUIndexTable.read(hdu_table_filename, format="fits")
+        hdu_table = _read_index_table(HDUIndexTable, hdu_table_filename, cache=cache)
         hdu_table.meta["BASE_DIR"] = str(base_dir)
 
         if not obs_table_filename.exists():
@@ -180,12 +295,21 @@ class DataStore:
             obs_table = None
         else:
             log.debug(f"Reading {obs_table_filename}")
-            obs_table = ObservationTable.read(obs_table_filename, format="fits")
+            obs_table = _read_index_table(
+                ObservationTable, obs_table_filename, cache=cache
+            )
 
         return cls(hdu_table=hdu_table, obs_table=obs_table)
 
     @classmethod
-    def from_events_files(cls, events_paths, irfs_paths=None):
+    def from_events_files(
+        cls,
+        events_paths,
+        irfs_paths=None,
+        n_jobs=None,
+        parallel_backend=None,
+        data_store=None,
+    ):
         """Create from a list of event filenames.
 
         HDU and observation index tables will be created from the EVENTS header.
@@ -206,6 +330,16 @@ class DataStore:
             as `events_paths`. If None the events files have to contain CALDB and
             IRF header keywords to locate the IRF files, otherwise the IRFs are
             assumed to be contained in the events files.
+        n_jobs : int, optional
+            Number of processes used to read the events file headers.
+            Default is one, unless `~gammapy.utils.parallel.N_JOBS_DEFAULT` was modified.
+        parallel_backend : {'multiprocessing', 'ray'}, optional
+            Which backend to use for multiprocessing. Default is None.
+        data_store : `DataStore`, optional
+            Existing data store, created with `DataStore.from_events_files`, to
+            update. Only the events files which are not indexed yet, or which
+            were modified after the index tables were created, are read. The other
+            observations of the existing data store are kept. Default is None.
 
         Returns
         -------
@@ -242,8 +376,20 @@ class DataStore:
 
         >>> data_store.hdu_table.write("hdu-index.fits.gz") # doctest: +SKIP
         >>> data_store.obs_table.write("obs-index.fits.gz") # doctest: +SKIP
+
+        The index tables can later be updated with new events files, only the new
+        files are read::
+
+        >>> data_store = DataStore.from_dir(".") # doctest: +SKIP
+        >>> data_store = DataStore.from_events_files(paths, data_store=data_store) # doctest: +SKIP
         """
-        return DataStoreMaker(events_paths, irfs_paths).run()
+        maker = DataStoreMaker(
+            events_paths,
+            irfs_paths,
+            n_jobs=n_jobs,
+            parallel_backend=parallel_backend,
+        )
+        return maker.run(data_store=data_store)
 
     def info(self, show=True):
         """Print some info."""
@@ -543,14 +689,30 @@ class DataStoreChecker(Checker):
             yield from ObservationChecker(obs).run()
 
 
-class DataStoreMaker:
+class DataStoreMaker(parallel.ParallelMixin):
     """Create data store index tables.
 
     This is a multistep process coded as a class.
     Users will usually call this via `DataStore.from_events_files`.
+
+    Only the headers of the events files are read, optionally in parallel.
+
+    Parameters
+    ----------
+    events_paths : list of str or `~pathlib.Path`
+        List of paths to the events files.
+    irfs_paths : str or `~pathlib.Path`, or list of str or list of `~pathlib.Path`, optional
+        Path to the IRFs file. Default is None.
+    n_jobs : int, optional
+        Number of processes used to read the events file headers.
+        Default is one, unless `~gammapy.utils.parallel.N_JOBS_DEFAULT` was modified.
+    parallel_backend : {'multiprocessing', 'ray'}, optional
+        Which backend to use for multiprocessing. Default is None.
     """
 
-    def __init__(self, events_paths, irfs_paths=None):
+    def __init__(
+        self, events_paths, irfs_paths=None, n_jobs=None, parallel_backend=None
+    ):
         if isinstance(events_paths, (str, Path)):
             raise TypeError("Need list of paths, not a single string or Path object.")
 
@@ -562,13 +724,129 @@ class DataStoreMaker:
 
         # Cache for EVENTS file header information, to avoid multiple reads
         self._events_info = {}
+        self._date = Time.now().utc.isot
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
+
+    def run(self, data_store=None):
+        """Run all steps.
+
+        Parameters
+        ----------
+        data_store : `DataStore`, optional
+            Existing data store to update. Only events files which are not
+            indexed yet or which were modified after the creation of the index
+            tables are read. Default is None.
 
-    def run(self):
-        """Run all steps."""
+        Returns
+        -------
+        data_store : `DataStore`
+            Data store.
+        """
+        if data_store is not None:
+            self._select_outdated_events_paths(data_store.obs_table)
+
+            if len(self.events_paths) == 0:
+                log.info("All events files are already indexed.")
+                return DataStore(
+                    hdu_table=data_store.hdu_table.copy(),
+                    obs_table=data_store.obs_table.copy(),
+                )
+
+        self.read_all_events_info()
         hdu_table = self.make_hdu_table()
         obs_table = self.make_obs_table()
+
+        if data_store is not None:
+            hdu_table, obs_table = self._merge_tables(
+                data_store, hdu_table=hdu_table, obs_table=obs_table
+            )
+
         return DataStore(hdu_table=hdu_table, obs_table=obs_table)
 
+    def _select_outdated_events_paths(self, obs_table):
+        """Keep only events files not indexed or modified since the index creation."""
+        if obs_table is None or "EVENTS_FILENAME" not in obs_table.colnames:
+            raise ValueError(
+                "Updating requires an observation table with an 'EVENTS_FILENAME'"
+                " column, as created by `DataStore.from_events_files`."
+            )
+
+        indexed = set(obs_table["EVENTS_FILENAME"])
+        date = obs_table.meta.get("DATE")
+        time_created = Time(date).unix if date else np.inf
+
+        events_paths, irfs_paths = [], []
+        for events_path, irf_path in zip(self.events_paths, self.irfs_paths):
+            if (
+                str(events_path) not in indexed
+                or events_path.stat().st_mtime > time_created
+            ):
+                events_paths.append(events_path)
+                irfs_paths.append(irf_path)
+
+        log.info(
+            f"Indexing {len(events_paths)} new or modified events files out of"
+            f" {len(self.events_paths)}."
+        )
+        self.events_paths, self.irfs_paths = events_paths, irfs_paths
+
+    @staticmethod
+    def _merge_tables(data_store, hdu_table, obs_table):
+        """Merge new index tables into the ones of an existing data store."""
+        time_rows = [tu.extract_time_info(data_store.obs_table.meta)]
+        time_rows.append(tu.extract_time_info(obs_table.meta))
+
+        if not tu.unique_time_info(time_rows):
+            raise RuntimeError(
+                "The time information in the EVENT header are not consistent"
+                " with the existing observation table"
+            )
+
+        obs_table_old = data_store.obs_table
+        hdu_table_old = data_store.hdu_table
+
+        # replace observations with the same OBS_ID or from the same events file
+        is_replaced = np.isin(obs_table_old["OBS_ID"], obs_table["OBS_ID"])
+        is_replaced |= np.isin(
+            obs_table_old["EVENTS_FILENAME"], obs_table["EVENTS_FILENAME"]
+        )
+        obs_id_replaced = obs_table_old["OBS_ID"][is_replaced]
+
+        obs_table = vstack(
+            [obs_table_old[~is_replaced], obs_table], metadata_conflicts="silent"
+        )
+
+        selection = ~np.isin(hdu_table_old["OBS_ID"], obs_id_replaced)
+        hdu_table = vstack(
+            [hdu_table_old[selection], hdu_table], metadata_conflicts="silent"
+        )
+        return hdu_table, obs_table
+
+    def read_all_events_info(self):
+        """Read header information of all events files, optionally in parallel."""
+        inputs = [
+            (events_path, irf_path)
+            for events_path, irf_path in zip(self.events_paths, self.irfs_paths)
+            if events_path not in self._events_info
+        ]
+
+        if len(inputs) == 0:
+            return
+
+        n_jobs = min(self.n_jobs, len(inputs))
+
+        infos = parallel.run_multiprocessing(
+            self.read_events_info,
+            inputs,
+            backend=self.parallel_backend,
+            pool_kwargs=dict(processes=n_jobs),
+            task_name="Read events headers",
+        )
+
+        for (events_path, _), info in zip(inputs, infos):
+            self._events_info[events_path] = info
+
     def get_events_info(self, events_path, irf_path=None):
         """Read events header information."""
         if events_path not in self._events_info:
@@ -585,11 +863,13 @@ class DataStoreMaker:
 
     @staticmethod
     def read_events_info(events_path, irf_path=None):
-        """Read mandatory events header information."""
+        """Read mandatory events header information.
+
+        Only the header of the EVENTS HDU is read, not the event data.
+        """
         log.debug(f"Reading {events_path}")
 
-        with fits.open(events_path, memmap=False) as hdu_list:
-            header = hdu_list["EVENTS"].header
+        header = fits.getheader(events_path, extname="EVENTS", memmap=False)
 
         na_int, na_str = -1, "NOT AVAILABLE"
 
@@ -671,6 +951,7 @@ class DataStoreMaker:
         m["HDUVERS"] = "0.2"
         m["HDUCLAS1"] = "INDEX"
         m["HDUCLAS2"] = "OBS"
+        m["DATE"] = self._date
 
         return table
 
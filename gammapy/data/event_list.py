@@ -19,6 +19,7 @@ from gammapy.utils.scripts import make_path
 from gammapy.utils.testing import Checker
 from gammapy.utils.time import time_ref_from_dict
 from .metadata import EventListMetaData
+from .pointing import ALTAZ_TIME_RESOLUTION_DEFAULT, altaz_transform_context
 
 __all__ = ["EventList"]
 
@@ -711,7 +712,25 @@ class EventList:
     @property
     def altaz(self):
         """ALT / AZ position computed from RA / DEC as a `~astropy.coordinates.SkyCoord` object."""
-        return self.radec.transform_to(self.altaz_frame)
+        return self.get_altaz()
+
+    def get_altaz(self, time_resolution=ALTAZ_TIME_RESOLUTION_DEFAULT):
+        """ALT / AZ position computed from RA / DEC.
+
+        Parameters
+        ----------
+        time_resolution : `~astropy.units.Quantity`, optional
+            Time resolution of the astrometry used for the transformation,
+            see `~gammapy.data.pointing.altaz_transform_context`. If None the
+            exact transformation is computed for every event. Default is 1 min.
+
+        Returns
+        -------
+        altaz : `~astropy.coordinates.SkyCoord`
+            ALT / AZ position of the events.
+        """
+        with altaz_transform_context(time_resolution):
+            return self.radec.transform_to(self.altaz_frame)
 
     @property
     def altaz_from_table(self):
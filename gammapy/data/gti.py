@@ -416,26 +416,34 @@ class GTI:
         """
         # Algorithm to merge overlapping intervals is well-known,
         # see e.g. https://stackoverflow.com/a/43600953/498873
-
+        # It is vectorized here: an interval starts a new group if it does not
+        # overlap the maximum stop time of all the previous intervals.
         table = self.table.copy()
         table.sort("START")
 
         compare = lt if merge_equal else le
 
-        # We use Python dict instead of astropy.table.Row objects,
-        # because on some versions modifying Row entries doesn't behave as expected
-        merged = [{"START": table[0]["START"], "STOP": table[0]["STOP"]}]
-        for row in table[1:]:
-            interval = {"START": row["START"], "STOP": row["STOP"]}
-            if compare(merged[-1]["STOP"], interval["START"]):
-                merged.append(interval)
-            else:
-                if not overlap_ok:
-                    raise ValueError("Overlapping time bins")
+        start, stop = table["START"], table["STOP"]
+
+        # exact ordering of the stop times, using the normalised Julian dates
+        rank = np.empty(len(table), dtype=int)
+        rank[np.lexsort((stop.jd2, stop.jd1))] = np.arange(len(table))
+        rank_max = np.maximum.accumulate(rank)
+        idx_stop_max = np.argsort(rank)[rank_max]
 
-                merged[-1]["STOP"] = max(interval["STOP"], merged[-1]["STOP"])
+        is_new = np.ones(len(table), dtype=bool)
+        is_new[1:] = compare(stop[idx_stop_max[:-1]], start[1:])
 
-        merged = Table(rows=merged, names=["START", "STOP"], meta=self.table.meta)
+        if not overlap_ok and not np.all(is_new):
+            raise ValueError("Overlapping time bins")
+
+        idx_start = np.flatnonzero(is_new)
+        idx_last = np.append(idx_start[1:] - 1, len(table) - 1)
+
+        merged = Table(
+            {"START": start[idx_start], "STOP": stop[idx_stop_max[idx_last]]},
+            meta=self.table.meta,
+        )
         return self.__class__(merged, reference_time=self.time_ref)
 
     def group_table(self, time_intervals, atol="1e-6 s"):
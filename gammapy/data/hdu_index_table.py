@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
+import zlib
 import numpy as np
 from astropy.table import Table
 from astropy.utils import lazyproperty
@@ -15,6 +16,11 @@ class HDUIndexTable(Table):
     """HDU index table.
 
     See :ref:`gadf:hdu-index`.
+
+    Row lookups by ``OBS_ID``, ``HDU_TYPE`` and ``HDU_CLASS`` use an index
+    which is built lazily on first access and rebuilt automatically when the
+    table is modified. Modifications of the indexed columns are detected with
+    a checksum of their data.
     """
 
     VALID_HDU_TYPE = [
@@ -131,7 +137,7 @@ class HDUIndexTable(Table):
                 f"Invalid hdu_class: {hdu_class}. Valid values are: {valid}"
             )
 
-        if obs_id not in self["OBS_ID"]:
+        if obs_id not in self._index:
             raise IndexError(f"No entry available with OBS_ID = {obs_id}")
 
     def row_idx(self, obs_id, hdu_type=None, hdu_class=None):
@@ -151,18 +157,18 @@ class HDUIndexTable(Table):
         idx : list of int
             List of row indices matching the selection.
         """
-        selection = self["OBS_ID"] == obs_id
-
-        if hdu_class:
-            is_hdu_class = self._hdu_class_stripped == hdu_class
-            selection &= is_hdu_class
+        hdu_class_stripped = self._hdu_class_stripped
+        hdu_type_stripped = self._hdu_type_stripped
 
-        if hdu_type:
-            is_hdu_type = self._hdu_type_stripped == hdu_type
-            selection &= is_hdu_type
+        idx = []
+        for row in self._index.get(obs_id, []):
+            if hdu_class and hdu_class_stripped[row] != hdu_class:
+                continue
+            if hdu_type and hdu_type_stripped[row] != hdu_type:
+                continue
+            idx.append(row)
 
-        idx = np.where(selection)[0]
-        return list(idx)
+        return idx
 
     def location_info(self, idx):
         """Create `HDULocation` for a given row index."""
@@ -175,13 +181,78 @@ class HDUIndexTable(Table):
             hdu_name=row["HDU_NAME"].strip(),
         )
 
-    @lazyproperty
+    _INDEX_COLUMNS = ("OBS_ID", "HDU_TYPE", "HDU_CLASS")
+
+    @staticmethod
+    def _get_checksum(columns):
+        """CRC32 checksum of the data of the indexed columns."""
+        checksum = 0
+        for column in columns:
+            checksum = zlib.crc32(np.ascontiguousarray(column), checksum)
+        return checksum
+
+    def _get_index_cache(self):
+        """Index cache, rebuilt if the indexed columns changed."""
+        columns = tuple(self.columns[name] for name in self._INDEX_COLUMNS)
+        cache = self.__dict__.get("_index_cache")
+
+        if (
+            cache is None
+            or cache["n_rows"] != len(self)
+            or any(a is not b for a, b in zip(cache["columns"], columns))
+            or cache["checksum"] != self._get_checksum(columns)
+        ):
+            cache = self._make_index_cache(columns)
+            self.__dict__["_index_cache"] = cache
+
+        return cache
+
+    def _make_index_cache(self, columns):
+        obs_id = np.asarray(columns[0])
+        order = np.argsort(obs_id, kind="stable")
+        obs_id_unique, start = np.unique(obs_id[order], return_index=True)
+        rows = np.split(order, start[1:])
+
+        index = {
+            key: value.tolist() for key, value in zip(obs_id_unique.tolist(), rows)
+        }
+
+        return {
+            "n_rows": len(self),
+            "columns": columns,
+            "checksum": self._get_checksum(columns),
+            "index": index,
+            "hdu_type_stripped": np.array([_.strip() for _ in columns[1]]),
+            "hdu_class_stripped": np.array([_.strip() for _ in columns[2]]),
+        }
+
+    def _reset_index_cache(self):
+        self.__dict__.pop("_index_cache", None)
+
+    @property
+    def _index(self):
+        """Row indices per observation ID (`dict`)."""
+        return self._get_index_cache()["index"]
+
+    @property
     def _hdu_class_stripped(self):
-        return np.array([_.strip() for _ in self["HDU_CLASS"]])
+        return self._get_index_cache()["hdu_class_stripped"]
 
-    @lazyproperty
+    @property
     def _hdu_type_stripped(self):
-        return np.array([_.strip() for _ in self["HDU_TYPE"]])
+        return self._get_index_cache()["hdu_type_stripped"]
+
+    def __setitem__(self, item, value):
+        super().__setitem__(item, value)
+        self._reset_index_cache()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._reset_index_cache()
+
+    def reverse(self):
+        super().reverse()
+        self._reset_index_cache()
 
     @lazyproperty
     def obs_id_unique(self):
@@ -1,9 +1,11 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import zlib
 from collections import namedtuple
 import numpy as np
 from astropy.coordinates import Angle, SkyCoord
 from astropy.table import Table
 from astropy.units import Quantity, Unit
+from scipy.spatial import cKDTree
 from gammapy.utils.regions import SphericalCircleSkyRegion
 from gammapy.utils.scripts import make_path
 from gammapy.utils.testing import Checker
@@ -12,10 +14,98 @@ from gammapy.utils.time import time_ref_from_dict
 __all__ = ["ObservationTable"]
 
 
+class _ObservationTableIndex:
+    """Spatial and temporal lookup index for an `ObservationTable`.
+
+    The pointing positions are stored as unit vectors in a KD-tree and the
+    observation intervals are sorted by start time. Both only return candidate
+    rows, which are then checked exactly by the selection methods. A checksum
+    of the indexed columns is stored to detect modifications of the table.
+
+    Parameters
+    ----------
+    obs_table : `~gammapy.data.ObservationTable`
+        Observation table.
+    """
+
+    # padding used for the candidate search, the exact selection is
+    # applied to the candidates afterwards
+    _pad_angle = 1e-6
+    _pad_time = 1e-3
+
+    def __init__(self, obs_table):
+        self.stale = False
+        self.n_rows = len(obs_table)
+        self.columns = obs_table._selection_index_columns
+        self.checksum = self.get_checksum(self.columns)
+
+        self.kdtree = None
+        if "RA_PNT" in obs_table.colnames and "DEC_PNT" in obs_table.colnames:
+            lon = Quantity(obs_table["RA_PNT"], "deg").to_value("rad")
+            lat = Quantity(obs_table["DEC_PNT"], "deg").to_value("rad")
+            self.kdtree = cKDTree(self._unit_vector(lon, lat))
+
+        self.time_order = None
+        if "TSTART" in obs_table.colnames and "TSTOP" in obs_table.colnames:
+            tstart = Quantity(obs_table["TSTART"], "s").value
+            tstop = Quantity(obs_table["TSTOP"], "s").value
+            self.time_order = np.argsort(tstart, kind="stable")
+            self.tstart_sorted = tstart[self.time_order]
+            duration = tstop - tstart
+            self.max_duration = np.max(duration) if len(duration) else 0.0
+
+    @staticmethod
+    def get_checksum(columns):
+        """CRC32 checksum of the data of the indexed columns."""
+        checksum = 0
+        for column in columns:
+            if column is not None:
+                checksum = zlib.crc32(np.ascontiguousarray(column), checksum)
+        return checksum
+
+    @staticmethod
+    def _unit_vector(lon, lat):
+        cos_lat = np.cos(lat)
+        return np.stack(
+            [cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)], axis=-1
+        )
+
+    def sky_circle_candidates(self, center, radius):
+        """Row indices with pointing positions possibly within the cone."""
+        center = center.icrs
+        vector = self._unit_vector(center.ra.rad, center.dec.rad)
+        angle = Angle(radius).rad + self._pad_angle
+
+        if angle >= np.pi:
+            return np.arange(self.n_rows)
+
+        idx = self.kdtree.query_ball_point(vector, r=2 * np.sin(angle / 2))
+        return np.sort(np.asarray(idx, dtype=int))
+
+    def time_range_candidates(self, tmin, tmax, partial_overlap=False):
+        """Row indices with observations possibly within the time range.
+
+        Times are given in seconds with respect to the table time reference.
+        """
+        tmin = tmin - self._pad_time
+        tmax = tmax + self._pad_time
+
+        if partial_overlap:
+            tmin = tmin - self.max_duration
+
+        idx_min = np.searchsorted(self.tstart_sorted, tmin, side="left")
+        idx_max = np.searchsorted(self.tstart_sorted, tmax, side="right")
+        return np.sort(self.time_order[idx_min:idx_max])
+
+
 class ObservationTable(Table):
     """Observation table.
 
     Data format specification: :ref:`gadf:obs-index`.
+
+    For large tables a spatial and temporal index can be built with
+    `~gammapy.data.ObservationTable.add_selection_index` to speed up
+    repeated selections.
     """
 
     @classmethod
@@ -34,7 +124,7 @@ class ObservationTable(Table):
     @property
     def pointing_radec(self):
         """Pointing positions in ICRS as a `~astropy.coordinates.SkyCoord` object."""
-        return SkyCoord(self["RA_PNT"], self["DEC_PNT"], unit="deg", frame="icrs")
+        return self._pointing_radec()
 
     @property
     def pointing_galactic(self):
@@ -51,12 +141,12 @@ class ObservationTable(Table):
     @property
     def time_start(self):
         """Observation start time as a `~astropy.time.Time` object."""
-        return self.time_ref + Quantity(self["TSTART"], "second")
+        return self._time_start()
 
     @property
     def time_stop(self):
         """Observation stop time as a `~astropy.time.Time` object."""
-        return self.time_ref + Quantity(self["TSTOP"], "second")
+        return self._time_stop()
 
     def select_obs_id(self, obs_id):
         """Get `~gammapy.data.ObservationTable` containing only ``obs_id``.
@@ -74,6 +164,77 @@ class ObservationTable(Table):
             self.add_index("OBS_ID")
         return self.__class__(self.loc["OBS_ID", obs_id])
 
+    @property
+    def _selection_index_columns(self):
+        names = ["RA_PNT", "DEC_PNT", "TSTART", "TSTOP"]
+        return tuple(self.columns.get(name) for name in names)
+
+    def add_selection_index(self):
+        """Build a spatial and temporal index used by the selection methods.
+
+        The pointing positions are indexed with a KD-tree on unit vectors
+        and the observation time intervals are sorted by start time. The
+        index is reused by `~gammapy.data.ObservationTable.select_sky_circle`,
+        `~gammapy.data.ObservationTable.select_time_range` and
+        `~gammapy.data.ObservationTable.select_observations`. It is rebuilt
+        automatically if rows are added or removed or if the indexed columns
+        are replaced or modified, which is detected with a checksum of the
+        column data computed at each selection. The selection results are
+        identical to the ones obtained without index.
+        """
+        self.__dict__["_selection_index"] = _ObservationTableIndex(self)
+
+    def remove_selection_index(self):
+        """Remove the spatial and temporal index."""
+        self.__dict__.pop("_selection_index", None)
+
+    @property
+    def _index(self):
+        """Spatial and temporal index, `None` if not enabled."""
+        index = self.__dict__.get("_selection_index")
+
+        if index is None:
+            return None
+
+        columns = self._selection_index_columns
+        if (
+            index.stale
+            or index.n_rows != len(self)
+            or any(a is not b for a, b in zip(index.columns, columns))
+            or index.checksum != index.get_checksum(columns)
+        ):
+            self.add_selection_index()
+
+        return self.__dict__["_selection_index"]
+
+    def _invalidate_selection_index(self):
+        index = self.__dict__.get("_selection_index")
+        if index is not None:
+            index.stale = True
+
+    def __setitem__(self, item, value):
+        super().__setitem__(item, value)
+        self._invalidate_selection_index()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self._invalidate_selection_index()
+
+    def reverse(self):
+        super().reverse()
+        self._invalidate_selection_index()
+
+    def _time_start(self, idx=Ellipsis):
+        return self.time_ref + Quantity(self["TSTART"][idx], "second")
+
+    def _time_stop(self, idx=Ellipsis):
+        return self.time_ref + Quantity(self["TSTOP"][idx], "second")
+
+    def _pointing_radec(self, idx=Ellipsis):
+        return SkyCoord(
+            self["RA_PNT"][idx], self["DEC_PNT"][idx], unit="deg", frame="icrs"
+        )
+
     def summary(self):
         """Summary information string."""
         obs_name = self.meta.get(
@@ -161,8 +322,19 @@ class ObservationTable(Table):
         obs_table : `~gammapy.data.ObservationTable`
             Observation table after selection.
         """
-        tstart = self.time_start
-        tstop = self.time_stop
+        index = self._index
+
+        if index is not None and index.time_order is not None:
+            tmin = (time_range[0] - self.time_ref).to_value("s")
+            tmax = (time_range[1] - self.time_ref).to_value("s")
+            idx = index.time_range_candidates(
+                tmin=tmin, tmax=tmax, partial_overlap=partial_overlap
+            )
+        else:
+            idx = Ellipsis
+
+        tstart = self._time_start(idx)
+        tstop = self._time_stop(idx)
 
         if not partial_overlap:
             mask1 = time_range[0] <= tstart
@@ -171,13 +343,22 @@ class ObservationTable(Table):
             mask1 = time_range[0] <= tstop
             mask2 = time_range[1] >= tstart
 
-        mask = mask1 & mask2
+        mask = self._candidate_mask(idx, mask1 & mask2)
 
         if inverted:
             mask = np.invert(mask)
 
         return self[mask]
 
+    def _candidate_mask(self, idx, mask):
+        """Expand a selection mask evaluated on candidate rows to the full table."""
+        if idx is Ellipsis:
+            return mask
+
+        full_mask = np.zeros(len(self), dtype=bool)
+        full_mask[idx[mask]] = True
+        return full_mask
+
     def select_sky_circle(self, center, radius, inverted=False):
         """Make an observation table, applying a cone selection.
 
@@ -202,8 +383,16 @@ class ObservationTable(Table):
         obs_table : `~gammapy.data.ObservationTable`
             Observation table after selection.
         """
+        index = self._index
+
+        if index is not None and index.kdtree is not None:
+            idx = index.sky_circle_candidates(center=center, radius=radius)
+        else:
+            idx = Ellipsis
+
         region = SphericalCircleSkyRegion(center=center, radius=radius)
-        mask = region.contains(self.pointing_radec)
+        mask = self._candidate_mask(idx, region.contains(self._pointing_radec(idx)))
+
         if inverted:
             mask = np.invert(mask)
         return self[mask]
@@ -2,9 +2,9 @@
 import html
 import logging
 import warnings
+from contextlib import nullcontext
 from enum import Enum, auto
 import numpy as np
-import scipy.interpolate
 import astropy.units as u
 from astropy.coordinates import (
     ICRS,
@@ -14,6 +14,7 @@ from astropy.coordinates import (
     SkyCoord,
     UnitSphericalRepresentation,
 )
+from astropy.coordinates.erfa_astrom import ErfaAstromInterpolator, erfa_astrom
 from astropy.io import fits
 from astropy.table import Table
 from astropy.units import Quantity
@@ -28,6 +29,37 @@ log = logging.getLogger(__name__)
 
 __all__ = ["FixedPointingInfo", "PointingInfo", "PointingMode"]
 
+ALTAZ_TIME_RESOLUTION_DEFAULT = 1 * u.min
+"""Default time resolution of the astrometry used for alt-az transformations."""
+
+
+def altaz_transform_context(time_resolution=ALTAZ_TIME_RESOLUTION_DEFAULT):
+    """Context for alt-az transformations with astrometry interpolated in time.
+
+    Within the context, the time dependent astrometry parameters (precession,
+    nutation, Earth orientation, aberration) are computed once per
+    ``time_resolution`` over the time range of the transformation and
+    interpolated for the individual times. This makes transformations of many
+    event or pointing times much faster, with a negligible loss of precision
+    (below one micro-arcsecond for the default resolution of one minute).
+
+    Parameters
+    ----------
+    time_resolution : `~astropy.units.Quantity`, optional
+        Time resolution of the astrometry. If None, the exact astrometry is
+        computed for every time. Default is 1 min.
+
+    Returns
+    -------
+    context : context manager
+        Context for alt-az transformations.
+    """
+    if time_resolution is None:
+        return nullcontext()
+
+    interpolator = ErfaAstromInterpolator(u.Quantity(time_resolution, "s"))
+    return erfa_astrom.set(interpolator)
+
 
 def _check_coord_frame(coord_or_frame, expected_frame, name):
     """Check if a skycoord or frame is given in expected_frame."""
@@ -407,7 +439,12 @@ class FixedPointingInfo:
 
         raise ValueError(f"Unsupported pointing mode: {self.mode}.")
 
-    def get_altaz(self, obstime=None, location=None) -> SkyCoord:
+    def get_altaz(
+        self,
+        obstime=None,
+        location=None,
+        time_resolution=ALTAZ_TIME_RESOLUTION_DEFAULT,
+    ) -> SkyCoord:
         """
         Get the pointing position in alt-az frame for a given time.
 
@@ -425,6 +462,10 @@ class FixedPointingInfo:
         location : `astropy.coordinates.EarthLocation`, optional
             Observatory location, only needed for pointing observations to transform
             from ICRS to horizontal coordinates. Default is None.
+        time_resolution : `~astropy.units.Quantity`, optional
+            Time resolution of the astrometry used for the transformation,
+            see `~gammapy.data.pointing.altaz_transform_context`. If None the
+            exact transformation is computed for every time. Default is 1 min.
 
         Returns
         -------
@@ -436,7 +477,8 @@ class FixedPointingInfo:
         frame = AltAz(location=location, obstime=obstime)
 
         if self.mode == PointingMode.POINTING:
-            return self.fixed_icrs.transform_to(frame)
+            with altaz_transform_context(time_resolution):
+                return self.fixed_icrs.transform_to(frame)
 
         if self.mode == PointingMode.DRIFT:
             # see https://github.com/astropy/astropy/issues/12965
@@ -599,7 +641,8 @@ class PointingInfo:
     @lazyproperty
     def altaz(self):
         """ALT / AZ position computed from RA / DEC as a`~astropy.coordinates.SkyCoord`."""
-        return self.radec.transform_to(self.altaz_frame)
+        with altaz_transform_context():
+            return self.radec.transform_to(self.altaz_frame)
 
     @lazyproperty
     def altaz_from_table(self):
@@ -610,10 +653,20 @@ class PointingInfo:
 
     @staticmethod
     def _interpolate_cartesian(mjd_support, coord_support, mjd):
-        xyz = coord_support.cartesian
-        x_new = scipy.interpolate.interp1d(mjd_support, xyz.x)(mjd)
-        y_new = scipy.interpolate.interp1d(mjd_support, xyz.y)(mjd)
-        z_new = scipy.interpolate.interp1d(mjd_support, xyz.z)(mjd)
+        mjd_min, mjd_max = mjd_support.min(), mjd_support.max()
+
+        if np.any((mjd < mjd_min) | (mjd > mjd_max)):
+            raise ValueError(
+                f"Time out of range of the pointing table: {mjd_min} -- {mjd_max} MJD"
+            )
+
+        order = np.argsort(mjd_support)
+        mjd_support = mjd_support[order]
+        xyz = coord_support.cartesian[order]
+
+        x_new = np.interp(mjd, mjd_support, xyz.x.value)
+        y_new = np.interp(mjd, mjd_support, xyz.y.value)
+        z_new = np.interp(mjd, mjd_support, xyz.z.value)
         return CartesianRepresentation(x_new, y_new, z_new).represent_as(
             UnitSphericalRepresentation
         )
@@ -622,7 +675,7 @@ class PointingInfo:
         """Interpolate pointing for a given time."""
         altaz_frame = AltAz(obstime=time, location=self.location)
         return SkyCoord(
-            self._interpolate_cartesian(self.time.mjd, self.altaz, time.mjd),
+            self._interpolate_cartesian(self.time.mjd, self.altaz, time.tt.mjd),
             frame=altaz_frame,
         )
 
@@ -641,7 +694,7 @@ class PointingInfo:
             Pointing position in ICRS frame.
         """
         return SkyCoord(
-            self._interpolate_cartesian(self.time.mjd, self.radec, obstime.mjd),
+            self._interpolate_cartesian(self.time.mjd, self.radec, obstime.tt.mjd),
             obstime=obstime,
             frame="icrs",
         )
@@ -668,11 +721,11 @@ class PointingInfo:
             Pointing position in alt-az frame.
         """
         # give precedence to ALT_PNT / AZ_PNT if present
-        if "ALT_PNT" in self.table and "AZ_PNT" in self.table:
+        if "ALT_PNT" in self.table.colnames and "AZ_PNT" in self.table.colnames:
             altaz = self.altaz_from_table
             frame = AltAz(obstime=obstime, location=self.location)
             return SkyCoord(
-                self._interpolate_cartesian(self.time.mjd, altaz, obstime.mjd),
+                self._interpolate_cartesian(self.time.mjd, altaz, obstime.tt.mjd),
                 frame=frame,
             )
 
@@ -4,10 +4,11 @@ import os
 from pathlib import Path
 import pytest
 import numpy as np
-from numpy.testing import assert_allclose
+from numpy.testing import assert_allclose, assert_equal
 import astropy.units as u
 from astropy.io import fits
-from gammapy.data import DataStore
+from astropy.time import Time
+from gammapy.data import DataStore, HDUIndexTable, ObservationTable
 from gammapy.irf import (
     Background3D,
     EffectiveAreaTable2D,
@@ -100,7 +101,6 @@ def test_broken_links_data_store(data_store):
     hdu_table = data_store.hdu_table
     index = np.where(hdu_table["OBS_ID"] == 23526)[0][0]
     hdu_table.remove_row(index)
-    hdu_table._hdu_type_stripped = np.array([_.strip() for _ in hdu_table["HDU_TYPE"]])
     observations = data_store.get_observations(
         [23523, 23526], required_irf=["aeff", "edisp"]
     )
@@ -330,3 +330,119 @@ def test_data_store_no_events():
     for obs in observations:
         assert not obs.events
         assert not obs.gti
+
+
+def test_data_store_from_dir_cache(tmp_path, caplog):
+    hdu_table = HDUIndexTable(
+        rows=[
+            [1, "events", "events", "data", "obs_1.fits", "EVENTS"],
+            [1, "gti", "gti", "data", "obs_1.fits", "GTI"],
+            [2, "events", "events", "data", "obs_2.fits", "EVENTS"],
+        ],
+        names=["OBS_ID", "HDU_TYPE", "HDU_CLASS", "FILE_DIR", "FILE_NAME", "HDU_NAME"],
+    )
+    hdu_table.meta["HDUCLAS1"] = "INDEX"
+    hdu_table.write(tmp_path / "hdu-index.fits.gz")
+
+    obs_table = ObservationTable({"OBS_ID": [1, 2], "TSTART": [0, 10] * u.s})
+    obs_table["TSTART"].description = "Start time"
+    obs_table.meta["MJDREFI"] = 51910
+    obs_table.write(tmp_path / "obs-index.fits.gz")
+
+    data_store = DataStore.from_dir(tmp_path, cache=True)
+    assert (tmp_path / "hdu-index.fits.gz.cache.npz").exists()
+    assert (tmp_path / "obs-index.fits.gz.cache.npz").exists()
+
+    cached = DataStore.from_dir(tmp_path, cache=True)
+    assert isinstance(cached.hdu_table, HDUIndexTable)
+    assert isinstance(cached.obs_table, ObservationTable)
+
+    for actual, desired in zip(
+        [cached.hdu_table, cached.obs_table],
+        [data_store.hdu_table, data_store.obs_table],
+    ):
+        assert actual.colnames == desired.colnames
+        assert actual.meta == desired.meta
+        for name in desired.colnames:
+            assert_equal(actual[name], desired[name])
+            assert actual[name].unit == desired[name].unit
+            assert actual[name].description == desired[name].description
+
+    assert cached.hdu_table.hdu_location(obs_id=1, hdu_type="gti").hdu_name == "GTI"
+
+    # modify the index file, the cache must not be used
+    obs_table["OBS_ID"] = [3, 4]
+    obs_table.write(tmp_path / "obs-index.fits.gz", overwrite=True)
+
+    updated = DataStore.from_dir(tmp_path, cache=True)
+    assert_equal(updated.obs_table["OBS_ID"], [3, 4])
+
+    # broken cache files are ignored
+    (tmp_path / "hdu-index.fits.gz.cache.npz").write_bytes(b"broken")
+    with caplog.at_level(logging.WARNING):
+        data_store = DataStore.from_dir(tmp_path, cache=True)
+
+    assert "Could not read index cache" in caplog.text
+    assert len(data_store.hdu_table) == 3
+
+
+def make_test_events_file(filename, obs_id):
+    header = fits.Header()
+    header["EXTNAME"] = "EVENTS"
+    header["OBS_ID"] = obs_id
+    header["TSTART"] = 100.0 * obs_id
+    header["TSTOP"] = 100.0 * obs_id + 50
+    header["ONTIME"] = 50.0
+    header["LIVETIME"] = 45.0
+    header["DEADC"] = 0.9
+    header["RA_PNT"] = 83.6
+    header["DEC_PNT"] = 22.0
+    header["MJDREFI"] = 51910
+    header["MJDREFF"] = 7.428703703703703e-4
+    header["TIMEUNIT"] = "s"
+    header["TIMESYS"] = "TT"
+    header["TIMEREF"] = "LOCAL"
+
+    columns = [fits.Column(name="TIME", format="D", array=np.arange(3.0))]
+    hdu = fits.BinTableHDU.from_columns(columns, header=header)
+    hdu.writeto(filename)
+    return filename
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_data_store_from_events_files_update(tmp_path, n_jobs):
+    paths = [
+        make_test_events_file(tmp_path / f"events_{obs_id}.fits", obs_id)
+        for obs_id in [1, 2, 3]
+    ]
+
+    data_store = DataStore.from_events_files(paths[:2], n_jobs=n_jobs)
+    assert_equal(data_store.obs_table["OBS_ID"], [1, 2])
+    assert_equal(data_store.obs_table["EVENT_COUNT"], [3, 3])
+    assert len(data_store.hdu_table) == 12
+    assert "DATE" in data_store.obs_table.meta
+
+    data_store.hdu_table.write(tmp_path / "hdu-index.fits.gz")
+    data_store.obs_table.write(tmp_path / "obs-index.fits.gz")
+    data_store = DataStore.from_dir(tmp_path)
+
+    updated = DataStore.from_events_files(paths, data_store=data_store)
+    assert_equal(updated.obs_table["OBS_ID"], [1, 2, 3])
+    assert len(updated.hdu_table) == 18
+    assert updated.hdu_table.hdu_location(obs_id=3, hdu_type="events") is not None
+
+    unchanged = DataStore.from_events_files(paths, data_store=updated)
+    assert_equal(unchanged.obs_table["OBS_ID"], [1, 2, 3])
+
+    # replace observation 1 by observation 4 in a newer file
+    paths[0].unlink()
+    make_test_events_file(paths[0], obs_id=4)
+    mtime = Time(updated.obs_table.meta["DATE"]).unix + 10
+    os.utime(paths[0], (mtime, mtime))
+
+    updated = DataStore.from_events_files(paths, data_store=updated)
+    assert_equal(updated.obs_table["OBS_ID"], [2, 3, 4])
+    assert_equal(np.unique(updated.hdu_table["OBS_ID"]), [2, 3, 4])
+
+    with pytest.raises(ValueError):
+        DataStore.from_events_files(paths, data_store=DataStore(hdu_table=None))
@@ -229,6 +229,21 @@ def test_gti_union():
     assert_allclose(gti.met_stop.value, [4, 8])
 
 
+def test_gti_union_merge_equal():
+    gti = make_gti({"START": [2, 0, 3, 0.5] * u.s, "STOP": [3, 1, 5, 1.5] * u.s})
+
+    gti_union = gti.union()
+    assert_allclose(gti_union.met_start.value, [0, 2])
+    assert_allclose(gti_union.met_stop.value, [1.5, 5])
+
+    gti_union = gti.union(merge_equal=False)
+    assert_allclose(gti_union.met_start.value, [0, 2, 3])
+    assert_allclose(gti_union.met_stop.value, [1.5, 3, 5])
+
+    with pytest.raises(ValueError):
+        gti.union(overlap_ok=False)
+
+
 def test_gti_create():
     start = u.Quantity([1, 2], "min")
     stop = u.Quantity([1.5, 2.5], "min")
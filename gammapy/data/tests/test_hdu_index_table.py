@@ -48,6 +48,62 @@ def test_hdu_index_table(hdu_index_table):
     assert hdu_index_table.summary().startswith("HDU index table")
 
 
+def test_hdu_index_table_row_idx_mutation():
+    table = HDUIndexTable(
+        rows=[
+            [1, "events ", "events", "a", "b", "EVENTS"],
+            [2, "events", "events", "a", "c", "EVENTS"],
+            [1, "aeff", "aeff_2d", "a", "b", "AEFF"],
+        ],
+        names=["OBS_ID", "HDU_TYPE", "HDU_CLASS", "FILE_DIR", "FILE_NAME", "HDU_NAME"],
+    )
+
+    assert table.row_idx(obs_id=1, hdu_type="events") == [0]
+    assert table.row_idx(obs_id=1, hdu_class="aeff_2d") == [2]
+    assert table.row_idx(obs_id=2, hdu_type="aeff") == []
+    assert table.row_idx(obs_id=3, hdu_type="events") == []
+
+    table.add_row([2, "aeff", "aeff_2d", "a", "c", "AEFF"])
+    assert table.row_idx(obs_id=2, hdu_type="aeff") == [3]
+
+    table.remove_row(0)
+    assert table.row_idx(obs_id=1, hdu_type="events") == []
+    assert table.row_idx(obs_id=1, hdu_type="aeff") == [1]
+
+    table.sort("OBS_ID")
+    assert table.row_idx(obs_id=2, hdu_type="events") == [1]
+    assert table.row_idx(obs_id=2, hdu_type="aeff") == [2]
+
+    table[1] = [3, "events", "events", "a", "d", "EVENTS"]
+    assert table.row_idx(obs_id=2, hdu_type="events") == []
+    assert table.hdu_location(obs_id=3, hdu_type="events").file_name == "d"
+
+    with pytest.raises(IndexError):
+        table.hdu_location(obs_id=42, hdu_type="events")
+
+
+def test_hdu_index_table_row_idx_column_edit():
+    table = HDUIndexTable(
+        rows=[
+            [1, "events", "events", "a", "b", "EVENTS"],
+            [2, "events", "events", "a", "c", "EVENTS"],
+        ],
+        names=["OBS_ID", "HDU_TYPE", "HDU_CLASS", "FILE_DIR", "FILE_NAME", "HDU_NAME"],
+    )
+    assert table.row_idx(obs_id=1) == [0]
+
+    table["OBS_ID"][0] = 5
+    assert table.row_idx(obs_id=5) == [0]
+    assert table.row_idx(obs_id=1) == []
+    assert table.hdu_location(obs_id=5, hdu_type="events").file_name == "b"
+
+    table["HDU_TYPE"][1] = "gti"
+    table["HDU_CLASS"][1] = "gti"
+    assert table.row_idx(obs_id=2, hdu_type="events") == []
+    assert table.row_idx(obs_id=2, hdu_class="gti") == [1]
+    assert table.hdu_location(obs_id=2, hdu_type="gti").file_name == "c"
+
+
 @requires_data()
 def test_hdu_index_table_hd_hap(capfd):
     """Test HESS HAP-HD data access."""
@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
 import numpy as np
+from numpy.testing import assert_equal
 from astropy.coordinates import AltAz, Angle, SkyCoord
 from astropy.time import Time, TimeDelta
 from astropy.units import Quantity
@@ -321,3 +322,84 @@ def test_observation_table_checker():
 
     records = list(checker.run())
     assert len(records) == 1
+
+
+@pytest.mark.parametrize("inverted", [False, True])
+def test_select_with_selection_index(inverted):
+    random_state = np.random.RandomState(seed=0)
+    obs_table = make_test_observation_table(n_obs=200, random_state=random_state)
+
+    obs_table_index = obs_table.copy()
+    obs_table_index.add_selection_index()
+
+    selections = [
+        dict(type="sky_circle", frame="galactic", lon="0 deg", lat="0 deg"),
+        dict(type="sky_circle", frame="icrs", lon="83 deg", lat="22 deg"),
+    ]
+
+    for selection in selections:
+        for radius in ["1 deg", "10 deg", "50 deg", "179 deg", "180 deg"]:
+            selection.update(radius=radius, inverted=inverted)
+            actual = obs_table_index.select_observations(selection)
+            expected = obs_table.select_observations(selection)
+            assert_equal(actual["OBS_ID"], expected["OBS_ID"])
+
+    time_ranges = [
+        Time(["2011-01-01", "2012-01-01"]),
+        Time(["2009-01-01", "2016-01-01"]),
+        Time(["2016-01-01", "2017-01-01"]),
+        obs_table.time_start[[3, 10]],
+    ]
+
+    for time_range in time_ranges:
+        for partial_overlap in [False, True]:
+            selection = dict(
+                type="time_box",
+                time_range=time_range,
+                partial_overlap=partial_overlap,
+                inverted=inverted,
+            )
+            actual = obs_table_index.select_observations(selection)
+            expected = obs_table.select_observations(selection)
+            assert_equal(actual["OBS_ID"], expected["OBS_ID"])
+
+
+def test_selection_index_update():
+    random_state = np.random.RandomState(seed=0)
+    obs_table = make_test_observation_table(n_obs=10, random_state=random_state)
+    obs_table.add_selection_index()
+
+    center = SkyCoord(obs_table["RA_PNT"][0], obs_table["DEC_PNT"][0], unit="deg")
+    selected = obs_table.select_sky_circle(center, radius=Angle("0.1 deg"))
+    assert_equal(selected["OBS_ID"], [1])
+
+    obs_table["RA_PNT"] = obs_table["RA_PNT"][::-1]
+    obs_table["DEC_PNT"] = obs_table["DEC_PNT"][::-1]
+    selected = obs_table.select_sky_circle(center, radius=Angle("0.1 deg"))
+    assert_equal(selected["OBS_ID"], [10])
+
+    obs_table.sort("OBS_ID", reverse=True)
+    selected = obs_table.select_sky_circle(center, radius=Angle("0.1 deg"))
+    assert_equal(selected["OBS_ID"], [10])
+
+    time_range = Time([obs_table.time_start[0], obs_table.time_stop[0]])
+    selected = obs_table.select_time_range(time_range)
+    assert_equal(selected["OBS_ID"], [10])
+
+    obs_table.remove_selection_index()
+    assert obs_table._index is None
+
+
+def test_selection_index_element_update():
+    obs_table = ObservationTable()
+    obs_table["OBS_ID"] = [1, 2]
+    obs_table["RA_PNT"] = Quantity([10.0, 50.0], "deg")
+    obs_table["DEC_PNT"] = Quantity([0.0, 0.0], "deg")
+    obs_table.add_selection_index()
+
+    center = SkyCoord(10, 0, unit="deg")
+    assert len(obs_table.select_sky_circle(center, Angle("1 deg"))) == 1
+
+    obs_table["RA_PNT"][1] = 10
+    selected = obs_table.select_sky_circle(center, Angle("1 deg"))
+    assert_equal(selected["OBS_ID"], [1, 2])
@@ -4,6 +4,7 @@ import numpy as np
 from numpy.testing import assert_allclose
 import astropy.units as u
 from astropy.coordinates import ICRS, AltAz, SkyCoord
+from astropy.table import Table
 from astropy.time import Time
 from gammapy.data import FixedPointingInfo, PointingInfo, observatory_locations
 from gammapy.data.pointing import PointingMode
@@ -59,6 +60,45 @@ def test_fixed_pointing_icrs():
     assert header["DEC_PNT"] == fixed_icrs.dec.deg
 
 
+def test_fixed_pointing_icrs_altaz_time_resolution():
+    location = observatory_locations["cta_south"]
+    fixed_icrs = SkyCoord(ra=83.28 * u.deg, dec=21.78 * u.deg)
+    pointing = FixedPointingInfo(fixed_icrs=fixed_icrs, location=location)
+
+    obstimes = Time("2020-11-01T03:00:00") + np.linspace(0, 2, 1000) * u.hour
+    altaz = pointing.get_altaz(obstimes)
+    altaz_exact = pointing.get_altaz(obstimes, time_resolution=None)
+
+    assert np.all(altaz.obstime == obstimes)
+    assert_allclose(altaz.separation(altaz_exact).to_value("arcsec"), 0, atol=1e-6)
+
+
+def test_pointing_info_interpolate():
+    location = observatory_locations["cta_south"]
+    time_ref = Time("2020-11-01T03:00:00")
+
+    table = Table()
+    table["TIME"] = np.linspace(0, 3600, 11) * u.s
+    table["RA_PNT"] = 83.28 * u.deg
+    table["DEC_PNT"] = 21.78 * u.deg
+    table.meta.update(time_ref_to_dict(time_ref))
+    table.meta.update(earth_location_to_dict(location))
+
+    pointing = PointingInfo(table)
+
+    obstimes = time_ref + np.linspace(10, 3590, 101) * u.s
+    icrs = pointing.get_icrs(obstimes)
+    assert_allclose(icrs.ra.deg, 83.28)
+    assert_allclose(icrs.dec.deg, 21.78)
+
+    altaz = pointing.get_altaz(obstimes)
+    altaz_exact = SkyCoord(83.28 * u.deg, 21.78 * u.deg).transform_to(altaz.frame)
+    assert np.all(altaz.separation(altaz_exact) < 1 * u.arcmin)
+
+    with pytest.raises(ValueError):
+        pointing.get_altaz(time_ref + [-10, 10] * u.s)
+
+
 def test_fixed_pointing_info_altaz():
     """Test new api of FixedPointingInfo in AltAz (DRIFT)"""
     location = observatory_locations["cta_south"]
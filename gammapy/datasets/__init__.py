@@ -6,6 +6,7 @@ from .io import OGIPDatasetReader, OGIPDatasetWriter, FermipyDatasetsReader
 from .map import (
     MapDataset,
     MapDatasetOnOff,
+    MapDatasetStacker,
     MapDatasetWeighted,
     create_empty_map_dataset_from_irfs,
     create_map_dataset_from_observation,
@@ -41,6 +42,7 @@ __all__ = [
     "MapDataset",
     "MapDatasetEventSampler",
     "MapDatasetOnOff",
+    "MapDatasetStacker",
     "MapDatasetWeighted",
     "ObservationEventSampler",
     "OGIPDatasetWriter",
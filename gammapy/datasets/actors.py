@@ -84,6 +84,11 @@ class DatasetsActor(Datasets):
         results = self._ray_get([d._update_stat_sum_remote() for d in self._datasets])
         return np.sum(results)
 
+    def stat_sum_batch(self, parameters, values):
+        """Compute joint likelihood for a batch of parameter values."""
+        # the parameters are evaluated one after the other on the actors
+        return Dataset.stat_sum_batch(self, parameters, values)
+
     def _to_asimov_datasets(self):
         """Create Asimov datasets from the current models."""
         asimov_datasets = Datasets([d._to_asimov_dataset() for d in self])
@@ -8,7 +8,9 @@ import numpy as np
 from astropy import units as u
 from astropy.table import Table, vstack
 from gammapy.data import GTI
+from gammapy.modeling import Parameters
 from gammapy.modeling.models import DatasetModels, Models
+from gammapy.utils.pbar import progress_bar
 from gammapy.utils.scripts import make_name, make_path, read_yaml, to_yaml, write_yaml
 
 log = logging.getLogger(__name__)
@@ -74,6 +76,36 @@ class Dataset(abc.ABC):
             prior_stat_sum = self.models.parameters.prior_stat_sum()
         return self._stat_sum_likelihood() + prior_stat_sum
 
+    def stat_sum_batch(self, parameters, values):
+        """Total statistic for a batch of parameter values.
+
+        The parameters are set to each row of ``values`` in turn and restored
+        afterwards, with a progress bar over the rows. Subclasses may evaluate
+        the batch at once.
+
+        Parameters
+        ----------
+        parameters : list of `~gammapy.modeling.Parameter`
+            Parameters to vary.
+        values : `~numpy.ndarray`
+            Parameter values with shape ``(n_batch, n_parameters)``.
+
+        Returns
+        -------
+        stat : `~numpy.ndarray`
+            Total statistic for each row of ``values``.
+        """
+        parameters = Parameters(parameters)
+        stat = np.empty(len(values))
+
+        with parameters.restore_status():
+            for idx, row in enumerate(progress_bar(values, desc="Scan values")):
+                for par, value in zip(parameters, row):
+                    par.value = value
+                stat[idx] = self.stat_sum()
+
+        return stat
+
     def _stat_sum_likelihood(self):
         """Total statistic given the current model parameters without the priors."""
         stat = self.stat_array()
@@ -246,6 +278,26 @@ class Datasets(collections.abc.MutableSequence):
             stat_sum += dataset.stat_sum()
         return stat_sum
 
+    def stat_sum_batch(self, parameters, values):
+        """Compute joint statistic function value for a batch of parameter values.
+
+        Parameters
+        ----------
+        parameters : list of `~gammapy.modeling.Parameter`
+            Parameters to vary.
+        values : `~numpy.ndarray`
+            Parameter values with shape ``(n_batch, n_parameters)``.
+
+        Returns
+        -------
+        stat : `~numpy.ndarray`
+            Joint statistic for each row of ``values``.
+        """
+        stat_sum = np.zeros(len(values))
+        for dataset in self:
+            stat_sum += dataset.stat_sum_batch(parameters, values)
+        return stat_sum
+
     def _stat_sum_likelihood(self):
         """Total statistic given the current model parameters without the priors."""
         stat_sum = 0
@@ -521,12 +573,21 @@ class Datasets(collections.abc.MutableSequence):
                 "Stacking impossible: all Datasets contained are not of a unique type."
             )
 
+        from .map import MapDataset, MapDatasetStacker
+
         stacked = self[0].to_masked(name=name, nan_to_num=nan_to_num)
 
+        if not isinstance(stacked, MapDataset):
+            for dataset in self[1:]:
+                stacked.stack(dataset, nan_to_num=nan_to_num)
+            return stacked
+
+        stacker = MapDatasetStacker(stacked, nan_to_num=nan_to_num)
+
         for dataset in self[1:]:
-            stacked.stack(dataset, nan_to_num=nan_to_num)
+            stacker.add(dataset)
 
-        return stacked
+        return stacker.finalize()
 
     def info_table(self, cumulative=False):
         """Get info table for datasets.
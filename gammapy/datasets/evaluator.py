@@ -9,7 +9,11 @@ from regions import CircleSkyRegion
 import matplotlib.pyplot as plt
 from gammapy.irf import EDispKernel, PSFKernel
 from gammapy.maps import HpxNDMap, Map, RegionNDMap, WcsNDMap
-from gammapy.modeling.models import PointSpatialModel, TemplateNPredModel
+from gammapy.modeling.models import (
+    PointSpatialModel,
+    ScaleSpectralModel,
+    TemplateNPredModel,
+)
 from .utils import apply_edisp
 
 PSF_MAX_RADIUS = None
@@ -376,6 +380,55 @@ class MapEvaluator:
             else:
                 return npred
 
+    @property
+    def is_linear_in_flux(self):
+        """Whether the predicted counts are linear in the binned spectral flux.
+
+        This is the case for sky models evaluated with the PSF applied in true
+        energy, see `compute_npred_templates`.
+        """
+        return not (
+            isinstance(self.model, TemplateNPredModel) or self.apply_psf_after_edisp
+        )
+
+    def compute_npred_templates(self):
+        """Compute predicted counts per unit integral flux in each true energy bin.
+
+        The predicted counts are given by ``npred = flux @ templates``, where
+        ``flux`` is the integral flux of the spectral model in the true energy
+        bins, as given by `compute_flux_spectral`. This allows to evaluate the
+        predicted counts for many values of the spectral model parameters at
+        once.
+
+        Returns
+        -------
+        templates : `~astropy.units.Quantity`
+            Templates with shape ``(n_energy_true,)`` followed by the data shape
+            of the reconstructed energy geometry.
+        """
+        value = u.Quantity(np.ones(self.geom.data_shape))
+
+        if self.model.spatial_model:
+            if self.psf_containment is not None:
+                value = value * self.psf_containment
+            else:
+                value = value * self.compute_flux_spatial()
+
+        if self.model.temporal_model:
+            value *= self.compute_temporal_norm()
+
+        if self.model.apply_irf["exposure"]:
+            value = value * self.exposure.quantity
+
+        if self.model.apply_irf["edisp"] and self.edisp:
+            pdf_matrix = self.edisp.pdf_matrix
+        else:
+            pdf_matrix = self._edisp_diagonal.pdf_matrix
+
+        # the energy dispersion maps each true energy bin onto the reco axis
+        shape = pdf_matrix.shape + (1,) * (value.ndim - 1)
+        return pdf_matrix.reshape(shape) * value[:, np.newaxis]
+
     @lazyproperty
     def _compute_npred(self):
         """Compute npred."""
@@ -393,7 +446,12 @@ class MapEvaluator:
                     self._computation_cache = values
                 npred = self._computation_cache
             else:
-                npred = self._computation_cache * self.renorm()
+                # share the geometry of the cached npred instead of copying it
+                npred = Map.from_geom(
+                    geom=self._computation_cache.geom,
+                    data=self._computation_cache.data * self.renorm(),
+                    unit=self._computation_cache.unit,
+                )
         return npred
 
     @property
@@ -483,6 +541,13 @@ class MapEvaluator:
     @lazyproperty
     def _norm_idx(self):
         """Norm index."""
+        spectral_model = getattr(self.model, "spectral_model", None)
+
+        if isinstance(spectral_model, ScaleSpectralModel):
+            # the norm of a scaled model, e.g. used by the flux estimators,
+            # is always a global factor
+            return self.model.parameters.index(spectral_model.norm)
+
         names = self.model.parameters.names
         ind = [idx for idx, name in enumerate(names) if name in ["norm", "amplitude"]]
         if len(ind) == 1:
@@ -4,13 +4,14 @@ import numpy as np
 from scipy.stats import median_abs_deviation as mad
 import astropy.units as u
 from astropy.io import fits
-from astropy.table import Table
+from astropy.table import Table, vstack
 from regions import CircleSkyRegion
 import matplotlib.pyplot as plt
 import gammapy.datasets.evaluator as meval
 from gammapy.data import GTI, PointingMode
 from gammapy.irf import EDispKernelMap, EDispMap, PSFKernel, PSFMap, RecoPSFMap
 from gammapy.maps import LabelMapAxis, Map, MapAxes, MapAxis, WcsGeom
+from gammapy.modeling import Parameters
 from gammapy.modeling.models import DatasetModels, FoVBackgroundModel, Models
 from gammapy.stats import (
     CashCountsStatistic,
@@ -21,6 +22,7 @@ from gammapy.stats import (
     get_wstat_mu_bkg,
     wstat,
 )
+from gammapy.stats.fit_statistics_cython import TRUNCATION_VALUE
 from gammapy.utils.fits import HDULocation, LazyFitsData
 from gammapy.utils.random import get_random_state
 from gammapy.utils.scripts import make_name, make_path
@@ -33,6 +35,7 @@ from .utils import get_axes
 __all__ = [
     "MapDataset",
     "MapDatasetOnOff",
+    "MapDatasetStacker",
     "MapDatasetWeighted",
     "create_empty_map_dataset_from_irfs",
     "create_map_dataset_geoms",
@@ -1151,6 +1154,11 @@ class MapDataset(Dataset):
             Non-finite values are replaced by zero if True. Default is True.
 
         """
+        self._stack_data(other, nan_to_num=nan_to_num)
+        self._stack_meta(gtis=[other.gti], meta_tables=[other.meta_table])
+
+    def _stack_data(self, other, nan_to_num=True):
+        """Stack the maps and IRFs of another dataset in place."""
         if self.counts and other.counts:
             self.counts.stack(
                 other.counts, weights=other.mask_safe, nan_to_num=nan_to_num
@@ -1194,18 +1202,31 @@ class MapDataset(Dataset):
         elif other.mask_fit:
             self.mask_fit = other.mask_fit.copy()
 
-        if self.gti and other.gti:
-            self.gti.stack(other.gti)
-            self.gti = self.gti.union()
-
-        if self.meta_table and other.meta_table:
-            self.meta_table = hstack_columns(self.meta_table, other.meta_table)
-        elif other.meta_table:
-            self.meta_table = other.meta_table.copy()
-
         if self.meta and other.meta:
             self.meta.stack(other.meta)
 
+    def _stack_meta(self, gtis, meta_tables):
+        """Stack the GTIs and meta tables of other datasets in place.
+
+        All GTIs and meta tables are merged at once, so that stacking many
+        datasets does not repeat the GTI union for each of them.
+        """
+        gtis = [gti for gti in gtis if gti]
+
+        if self.gti and gtis:
+            table = vstack([self.gti.table] + [gti.table for gti in gtis])
+            gti = self.gti.__class__(table, reference_time=self.gti.time_ref)
+            self.gti = gti.union()
+
+        meta_tables = [table for table in meta_tables if table]
+
+        if self.meta_table and meta_tables:
+            self.meta_table = hstack_columns(self.meta_table, *meta_tables)
+        elif len(meta_tables) > 1:
+            self.meta_table = hstack_columns(*meta_tables)
+        elif meta_tables:
+            self.meta_table = meta_tables[0].copy()
+
     def stat_array(self):
         """Statistic function value per bin given the current model parameters."""
         return cash(n_on=self.counts.data, mu_on=self.npred().data)
@@ -1492,6 +1513,146 @@ class MapDataset(Dataset):
             cash_sum = cash_sum_cython(counts.ravel(), npred.ravel())
         return cash_sum + prior_stat_sum
 
+    def _get_linear_evaluator_names(self, parameters):
+        """Names of the evaluators depending on the parameters.
+
+        None is returned if the predicted counts are not linear in the binned
+        spectral flux of these evaluators, or if the parameters do not only
+        belong to their spectral models.
+        """
+        names = []
+
+        for name, evaluator in self.evaluators.items():
+            model_parameters = evaluator.model.parameters
+            selected = [par for par in parameters if par in model_parameters]
+
+            if not selected:
+                continue
+
+            spectral_model = getattr(evaluator.model, "spectral_model", None)
+
+            if spectral_model is None or not evaluator.is_linear_in_flux:
+                return None
+
+            if not all(par in spectral_model.parameters for par in selected):
+                return None
+
+            names.append(name)
+
+        if self.background_model is not None:
+            if any(par in self.background_model.parameters for par in parameters):
+                return None
+
+        return names
+
+    def stat_sum_batch(self, parameters, values):
+        """Total statistic for a batch of parameter values.
+
+        If the parameters only belong to the spectral models of sky models,
+        the predicted counts are linear in the binned spectral flux of these
+        models. Then the predicted counts per unit flux are computed once and
+        the statistic is evaluated for the whole batch by broadcasting over
+        a leading batch axis. Otherwise the statistic is evaluated for one set
+        of parameter values after the other.
+
+        Parameters
+        ----------
+        parameters : list of `~gammapy.modeling.Parameter`
+            Parameters to vary.
+        values : `~numpy.ndarray`
+            Parameter values with shape ``(n_batch, n_parameters)``.
+
+        Returns
+        -------
+        stat : `~numpy.ndarray`
+            Total statistic for each row of ``values``.
+        """
+        parameters = Parameters(parameters)
+        names = None
+
+        if self.stat_type == "cash" and self.models is not None:
+            names = self._get_linear_evaluator_names(parameters)
+
+        if names is None:
+            return super().stat_sum_batch(parameters, values)
+
+        mask = Ellipsis
+        if self.mask is not None:
+            mask = ~(self.mask.data == False)  # noqa
+
+        counts = self.counts.data[mask].astype(float)
+
+        others = [name for name in self.evaluators if name not in names]
+        npred_fixed = self.npred_signal(model_names=others)
+        if self.background:
+            npred_fixed += self.npred_background()
+        npred_fixed = npred_fixed.data[mask]
+
+        evaluators, templates = [], []
+
+        for name in names:
+            evaluator = self.evaluators[name]
+            if evaluator.needs_update:
+                evaluator.update(
+                    self.exposure,
+                    self.psf,
+                    self.edisp,
+                    self._geom,
+                    self.mask_image,
+                )
+
+            if not evaluator.contributes:
+                continue
+
+            npred = evaluator.compute_npred_templates()
+            flux_unit = evaluator.compute_flux_spectral().unit
+            scale = (flux_unit * npred.unit).to("")
+
+            data = []
+            for value in npred.value:
+                template = Map.from_geom(self._geom, dtype=float)
+                template.stack(Map.from_geom(evaluator._geom_reco, data=value))
+                data.append(scale * template.data[mask])
+
+            evaluators.append(evaluator)
+            templates.append(np.array(data))
+
+        fluxes = [np.empty((len(values), len(_))) for _ in templates]
+        prior_stat_sum = np.zeros(len(values))
+        models_parameters = self.models.parameters
+
+        with parameters.restore_status():
+            for idx, row in enumerate(values):
+                for par, value in zip(parameters, row):
+                    par.value = value
+
+                for flux, evaluator in zip(fluxes, evaluators):
+                    flux[idx] = evaluator.compute_flux_spectral().value.ravel()
+
+                prior_stat_sum[idx] = models_parameters.prior_stat_sum()
+
+        # the log term of the Cash statistic only contributes for non-zero counts
+        has_counts = counts > 0
+        counts = counts[has_counts]
+
+        stat = np.empty(len(values))
+        # limit the memory used by the predicted counts of a chunk of the batch
+        n_chunk = max(1, int(1e7) // max(npred_fixed.size, 1))
+
+        for start in range(0, len(values), n_chunk):
+            batch = slice(start, start + n_chunk)
+            npred = np.repeat(npred_fixed[np.newaxis], len(values[batch]), axis=0)
+
+            for flux, template in zip(fluxes, templates):
+                npred += flux[batch] @ template
+
+            npred = np.maximum(npred, TRUNCATION_VALUE)
+            stat[batch] = 2 * (
+                npred.sum(axis=1) - np.log(npred[:, has_counts]) @ counts
+            )
+
+        return stat + prior_stat_sum
+
     def _to_asimov_dataset(self):
         """Create Asimov dataset from the current models."""
 
@@ -1710,7 +1871,14 @@ class MapDataset(Dataset):
 
     @classmethod
     def read(
-        cls, filename, name=None, lazy=False, cache=True, format="gadf", checksum=False
+        cls,
+        filename,
+        name=None,
+        lazy=False,
+        cache=True,
+        format="gadf",
+        checksum=False,
+        memmap=False,
     ):
         """Read a dataset from file.
 
@@ -1728,6 +1896,11 @@ class MapDataset(Dataset):
             Format of the dataset file. Default is "gadf".
         checksum : bool
             If True checks both DATASUM and CHECKSUM cards in the file headers. Default is False.
+        memmap : bool
+            If True the map data are memory mapped with copy-on-write semantics, see
+            `~gammapy.maps.Map.read`. Operations such as `~MapDataset.cutout` then
+            only read the required pixels from disk. Ignored if ``lazy=True``.
+            Default is False.
 
         Returns
         -------
@@ -1746,7 +1919,7 @@ class MapDataset(Dataset):
             )
         else:
             with fits.open(
-                str(make_path(filename)), memmap=False, checksum=checksum
+                str(make_path(filename)), memmap=memmap, checksum=checksum
             ) as hdulist:
                 return cls.from_hdulist(hdulist, name=ds_name, format=format)
 
@@ -2387,6 +2560,70 @@ class MapDataset(Dataset):
         plot_mask(ax=axes[3], mask=self.mask_safe_image, hatches=["///"], colors="w")
 
 
+class MapDatasetStacker:
+    """Accumulate datasets into a stacked dataset.
+
+    The maps and IRFs of each added dataset are stacked in place into the
+    target dataset, while the GTIs and meta tables are collected and merged
+    only once in `finalize`. The cost of stacking many datasets is then
+    linear in their number, instead of recomputing the GTI union and meta
+    table for every dataset as repeated calls to
+    `~gammapy.datasets.MapDataset.stack` do.
+
+    Parameters
+    ----------
+    dataset : `~gammapy.datasets.MapDataset` or `~gammapy.datasets.MapDatasetOnOff`
+        Target dataset. It is modified in place.
+    nan_to_num : bool, optional
+        Non-finite values are replaced by zero if True. Default is True.
+
+    Examples
+    --------
+    >>> from gammapy.datasets import MapDatasetStacker, SpectrumDatasetOnOff
+    >>> filename = "$GAMMAPY_DATA/joint-crab/spectra/hess/pha_obs23523.fits"
+    >>> dataset = SpectrumDatasetOnOff.read(filename)
+    >>> stacker = MapDatasetStacker(dataset.to_masked(name="stacked"))
+    >>> for _ in range(3):
+    ...     stacker.add(dataset)
+    >>> stacked = stacker.finalize()
+    """
+
+    def __init__(self, dataset, nan_to_num=True):
+        self._dataset = dataset
+        self.nan_to_num = nan_to_num
+        self._gtis = []
+        self._meta_tables = []
+
+    @property
+    def dataset(self):
+        """Target dataset."""
+        return self._dataset
+
+    def add(self, other):
+        """Stack another dataset into the target dataset.
+
+        Parameters
+        ----------
+        other : `~gammapy.datasets.MapDataset` or `~gammapy.datasets.MapDatasetOnOff`
+            Dataset to stack.
+        """
+        self._dataset._stack_data(other, nan_to_num=self.nan_to_num)
+        self._gtis.append(other.gti)
+        self._meta_tables.append(other.meta_table)
+
+    def finalize(self):
+        """Merge the GTIs and meta tables of the added datasets.
+
+        Returns
+        -------
+        dataset : `~gammapy.datasets.MapDataset` or `~gammapy.datasets.MapDatasetOnOff`
+            Stacked dataset.
+        """
+        self._dataset._stack_meta(gtis=self._gtis, meta_tables=self._meta_tables)
+        self._gtis, self._meta_tables = [], []
+        return self._dataset
+
+
 class MapDatasetWeighted(MapDataset):
     stat_type = "cash_weighted"
     tag = "MapDatasetWeighted"
@@ -2540,6 +2777,12 @@ class MapDatasetOnOff(MapDataset):
 
         return Map.from_geom(self._geom, data=data.to_value(""), unit="")
 
+    @property
+    def _alpha_counts_off(self):
+        """Off counts weighted by alpha, sharing the dataset geometry."""
+        data = self.alpha.quantity * self.counts_off.quantity
+        return Map.from_geom(self._geom, data=data.value, unit=data.unit)
+
     def npred_background(self):
         """Predicted background counts estimated from the marginalized likelihood estimate.
 
@@ -2808,6 +3051,10 @@ class MapDatasetOnOff(MapDataset):
         nan_to_num : bool
             Non-finite values are replaced by zero if True. Default is True.
         """
+        super().stack(other, nan_to_num=nan_to_num)
+
+    def _stack_data(self, other, nan_to_num=True):
+        """Stack the maps and IRFs of another on-off dataset in place."""
         if not isinstance(other, MapDatasetOnOff):
             raise TypeError("Incompatible types for MapDatasetOnOff stacking")
 
@@ -2826,21 +3073,23 @@ class MapDatasetOnOff(MapDataset):
 
         if self.counts_off:
             total_off.stack(self.counts_off, nan_to_num=nan_to_num)
-            total_alpha.stack(self.alpha * self.counts_off, nan_to_num=nan_to_num)
+            total_alpha.stack(self._alpha_counts_off, nan_to_num=nan_to_num)
         if other.counts_off:
             total_off.stack(
                 other.counts_off, weights=other.mask_safe, nan_to_num=nan_to_num
             )
             total_alpha.stack(
-                other.alpha * other.counts_off,
+                other._alpha_counts_off,
                 weights=other.mask_safe,
                 nan_to_num=nan_to_num,
             )
 
         with np.errstate(divide="ignore", invalid="ignore"):
-            acceptance_off = total_acceptance * total_off / total_alpha
+            data = total_acceptance.quantity * total_off.quantity / total_alpha.quantity
             average_alpha = total_alpha.data.sum() / total_off.data.sum()
 
+        acceptance_off = Map.from_geom(geom, data=data.value, unit=data.unit)
+
         # For the bins where the stacked OFF counts equal 0, the alpha value is
         # performed by weighting on the total OFF counts of each run
         is_zero = total_off.data == 0
@@ -2851,7 +3100,7 @@ class MapDatasetOnOff(MapDataset):
 
         self.counts_off = total_off
 
-        super().stack(other, nan_to_num=nan_to_num)
+        super()._stack_data(other, nan_to_num=nan_to_num)
 
     def stat_sum(self):
         """Total statistic function value given the current model parameters.
@@ -15,6 +15,7 @@ from gammapy.modeling.models import (
     Models,
     PointSpatialModel,
     PowerLawSpectralModel,
+    ScaleSpectralModel,
     SkyModel,
 )
 from gammapy.utils.gauss import Gauss2DPDF
@@ -277,3 +278,33 @@ def test_norm_only_changed():
     spectral_model.amplitude.value *= 2
     spectral_model.index.value *= 2
     assert not evaluator.parameter_norm_only_changed
+
+
+def test_norm_only_changed_scale_model():
+    center = SkyCoord("0 deg", "0 deg", frame="galactic")
+    energy_axis_true = MapAxis.from_energy_bounds(
+        ".1 TeV", "10 TeV", nbin=2, name="energy_true"
+    )
+    geom = WcsGeom.create(
+        skydir=center, width=1 * u.deg, axes=[energy_axis_true], binsz=0.2 * u.deg
+    )
+
+    spectral_model = ScaleSpectralModel(
+        PowerLawSpectralModel(index=2, amplitude="1e-11 TeV-1 s-1 m-2")
+    )
+    spatial_model = PointSpatialModel(lon_0=0 * u.deg, lat_0=0 * u.deg)
+    model = SkyModel(spectral_model=spectral_model, spatial_model=spatial_model)
+
+    exposure = Map.from_geom(geom, unit="m2 s", data=1.0)
+    evaluator = MapEvaluator(model=model, exposure=exposure)
+
+    assert evaluator._norm_idx == model.parameters.index(spectral_model.norm)
+
+    npred = evaluator.compute_npred()
+
+    spectral_model.norm.value = 3
+    assert evaluator.parameter_norm_only_changed
+
+    npred_scaled = evaluator.compute_npred()
+    assert npred_scaled.geom is npred.geom
+    assert_allclose(npred_scaled.data, 3 * npred.data)
@@ -1687,6 +1687,31 @@ def test_dataset_cutout_aligned(geom):
     assert dataset.psf.psf_map.geom.is_aligned(cutout.psf.psf_map.geom)
 
 
+def test_map_dataset_read_memmap_cutout(tmp_path, geom):
+    dataset = MapDataset.create(geom, name="test")
+    random_state = np.random.RandomState(0)
+    dataset.counts.data = random_state.poisson(2, dataset.counts.data.shape)
+    dataset.exposure.data += 1e10
+    dataset.background.data = random_state.uniform(size=dataset.background.data.shape)
+    dataset.write(tmp_path / "test.fits")
+
+    dataset_memmap = MapDataset.read(tmp_path / "test.fits", memmap=True)
+    assert dataset_memmap.counts.is_memmap
+    assert dataset_memmap.exposure.is_memmap
+    assert dataset_memmap.psf.psf_map.is_memmap
+
+    kwargs = {"position": geom.center_skydir, "width": 1 * u.deg}
+    cutout = dataset_memmap.cutout(**kwargs)
+    expected = dataset.cutout(**kwargs)
+
+    assert not cutout.counts.is_memmap
+    assert_allclose(cutout.counts.data, expected.counts.data)
+    assert_allclose(cutout.exposure.data, expected.exposure.data)
+    assert_allclose(cutout.background.data, expected.background.data)
+    assert_allclose(cutout.psf.psf_map.data, expected.psf.psf_map.data)
+    assert_equal(cutout.mask_safe.data, expected.mask_safe.data)
+
+
 def test_stack_onoff_cutout(geom_image):
     # Test stacking of cutouts
     energy_axis_true = MapAxis.from_energy_bounds(
@@ -2433,3 +2458,54 @@ def test_add_fermi_iso():
     dataset.models = model
     assert "isotropic" in dataset.models.names[0]
     assert not dataset.models[0].apply_irf["edisp"]
+
+
+def test_map_dataset_stat_sum_batch(geom, geom_etrue):
+    dataset = MapDataset.create(geom, energy_axis_true=geom_etrue.axes[0], name="test")
+    dataset.exposure.data += 1e12
+    dataset.background.data += 0.2
+    dataset.psf = PSFMap.from_gauss(geom_etrue.axes[0], sigma=0.1 * u.deg)
+    dataset.mask_safe.data[...] = True
+    dataset.mask_fit = geom.region_mask(
+        [CircleSkyRegion(center=geom.center_skydir, radius=0.8 * u.deg)]
+    )
+
+    point = SkyModel(
+        spatial_model=PointSpatialModel.from_position(geom.center_skydir),
+        spectral_model=PowerLawSpectralModel(amplitude="1e-11 cm-2 s-1 TeV-1"),
+        name="point",
+    )
+    disk = SkyModel(
+        spatial_model=DiskSpatialModel.from_position(geom.center_skydir, r_0="0.3 deg"),
+        spectral_model=PowerLawSpectralModel(amplitude="1e-11 cm-2 s-1 TeV-1"),
+        name="disk",
+    )
+    disk.spectral_model.index.prior = UniformPrior(min=2, max=2.5)
+    dataset.models = [point, disk, FoVBackgroundModel(dataset_name="test")]
+    dataset.fake(random_state=0)
+
+    parameters = [disk.spectral_model.index, disk.spectral_model.amplitude]
+    values = [[1.8, 1e-11], [2.2, 2e-11], [2.6, 0.5e-11], [2.0, -1e-13]]
+
+    actual = dataset.stat_sum_batch(parameters, values)
+
+    expected = []
+    for index, amplitude in values:
+        disk.spectral_model.index.value = index
+        disk.spectral_model.amplitude.value = amplitude
+        expected.append(dataset.stat_sum())
+
+    assert_allclose(actual, expected, rtol=1e-8)
+
+    # spatial parameters are evaluated one after the other
+    parameters = [point.spatial_model.lon_0, disk.spectral_model.index]
+    values = [[266.4, 2.0], [266.5, 2.2]]
+    actual = Datasets([dataset]).stat_sum_batch(parameters, values)
+
+    expected = []
+    for lon_0, index in values:
+        point.spatial_model.lon_0.value = lon_0
+        disk.spectral_model.index.value = index
+        expected.append(dataset.stat_sum())
+
+    assert_allclose(actual, expected, rtol=1e-8)
@@ -8,7 +8,12 @@ from astropy.table import Table
 from astropy.time import Time
 from astropy.utils.exceptions import AstropyUserWarning
 from gammapy.data import GTI
-from gammapy.datasets import Datasets, SpectrumDataset, SpectrumDatasetOnOff
+from gammapy.datasets import (
+    Datasets,
+    MapDatasetStacker,
+    SpectrumDataset,
+    SpectrumDatasetOnOff,
+)
 from gammapy.irf import EDispKernelMap, EffectiveAreaTable2D
 from gammapy.makers.utils import make_map_exposure_true_energy
 from gammapy.maps import LabelMapAxis, MapAxis, RegionGeom, RegionNDMap, WcsGeom
@@ -1055,6 +1060,40 @@ def test_datasets_stack_reduce_no_off():
     assert stacked.counts == 245
 
 
+def test_map_dataset_stacker():
+    datasets = make_observation_list()
+    datasets.append(datasets[0].copy(name="3"))
+
+    for idx, dataset in enumerate(datasets):
+        dataset.meta_table = Table({"OBS_ID": [idx]})
+
+    expected = datasets[0].to_masked()
+    for dataset in datasets[1:]:
+        expected.stack(dataset)
+
+    stacker = MapDatasetStacker(datasets[0].to_masked(name="stacked"))
+    for dataset in datasets[1:]:
+        stacker.add(dataset)
+
+    stacked = stacker.finalize()
+
+    assert stacked is stacker.dataset
+    assert stacked.name == "stacked"
+    assert_allclose(stacked.counts.data, expected.counts.data)
+    assert_allclose(stacked.counts_off.data, expected.counts_off.data)
+    assert_allclose(stacked.alpha.data, expected.alpha.data)
+    assert_allclose(stacked.exposure.data, expected.exposure.data)
+    assert_allclose(stacked.exposure.meta["livetime"], 6 * u.h)
+    assert_time_allclose(stacked.gti.time_start, expected.gti.time_start)
+    assert_time_allclose(stacked.gti.time_stop, expected.gti.time_stop)
+    assert_equal(stacked.meta_table["OBS_ID"].data, [[0, 1, 2]])
+
+    stacked = Datasets(datasets).stack_reduce(name="stacked")
+    assert_allclose(stacked.counts_off.data, expected.counts_off.data)
+    assert_time_allclose(stacked.gti.time_start, expected.gti.time_start)
+    assert_equal(stacked.meta_table["OBS_ID"].data, [[0, 1, 2]])
+
+
 @requires_data("gammapy-data")
 def test_stack_livetime():
     dataset_ref = SpectrumDatasetOnOff.read(
@@ -1,12 +1,14 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
 import numpy as np
-from gammapy.datasets import Datasets
+from gammapy.datasets import Datasets, MapDataset
 from gammapy.datasets.actors import DatasetsActor
+from gammapy.estimators.map.ts import BrentqFluxEstimator, SimpleMapDataset
 from gammapy.estimators.parameter import ParameterEstimator
 from gammapy.estimators.utils import _get_default_norm
 from gammapy.maps import Map, MapAxis
 from gammapy.modeling.models import ScaleSpectralModel
+from gammapy.stats import cash
 
 log = logging.getLogger(__name__)
 
@@ -59,6 +61,17 @@ class FluxEstimator(ParameterEstimator):
         unless the source model does not have one and only one norm parameter.
         If a dict is given the entries should be a subset of
         `~gammapy.modeling.Parameter` arguments.
+    fast_norm : bool
+        If True and only the norm of the source is free (``reoptimize=False``),
+        the predicted counts of the source are computed once and the norm is
+        obtained by rescaling them, using root finding on the analytical
+        derivatives of the Cash statistic instead of a full fit. This only
+        applies to datasets using the "cash" fit statistic and without
+        priors, otherwise the regular fit is used. Default is False.
+    shared_profile : bool
+        If True the asymmetric errors and upper limits are computed from a
+        single, adaptively sampled fit statistic profile of the norm, see
+        `~gammapy.estimators.ParameterEstimator`. Default is False.
     """
 
     tag = "FluxEstimator"
@@ -73,8 +86,11 @@ class FluxEstimator(ParameterEstimator):
         fit=None,
         reoptimize=False,
         norm=None,
+        fast_norm=False,
+        shared_profile=False,
     ):
         self.source = source
+        self.fast_norm = fast_norm
 
         self.norm = _get_default_norm(norm, interp="log")
 
@@ -86,6 +102,7 @@ class FluxEstimator(ParameterEstimator):
             selection_optional=selection_optional,
             fit=fit,
             reoptimize=reoptimize,
+            shared_profile=shared_profile,
         )
 
     def get_scale_model(self, models):
@@ -163,8 +180,133 @@ class FluxEstimator(ParameterEstimator):
 
         models[self.source].spectral_model = model
         datasets.models = models
+
+        if self._use_fast_norm(datasets):
+            result.update(self.estimate_fast_norm(datasets, model.norm))
+            return result
+
         result.update(super().run(datasets, model.norm))
 
         datasets.models[self.source].spectral_model.norm.value = result["norm"]
         result.update(self.estimate_npred_excess(datasets=datasets))
         return result
+
+    def _use_fast_norm(self, datasets):
+        """Whether the norm can be estimated by rescaling the source npred."""
+        if not self.fast_norm or self.reoptimize:
+            return False
+
+        if isinstance(datasets, DatasetsActor) or not np.any(
+            datasets.contributes_to_stat
+        ):
+            return False
+
+        if "sensitivity" in self.selection_optional:
+            return False
+
+        for dataset in datasets:
+            if not isinstance(dataset, MapDataset) or dataset.stat_type != "cash":
+                return False
+
+        return all(par.prior is None for par in datasets.models.parameters)
+
+    def estimate_fast_norm(self, datasets, parameter):
+        """Estimate the norm by rescaling the predicted counts of the source.
+
+        With all other parameters frozen, the predicted counts are linear in
+        the norm, ``npred = background + norm * template``, where the template
+        is the source npred for a norm of one and the background includes all
+        other models. The best fit norm, errors and upper limit are obtained
+        from the Cash statistic of the masked pixels of all datasets, like for
+        the `~gammapy.estimators.TSMapEstimator`.
+
+        Parameters
+        ----------
+        datasets : `~gammapy.datasets.Datasets`
+            Map or spectrum datasets using the "cash" fit statistic.
+        parameter : `~gammapy.modeling.Parameter`
+            Norm parameter.
+
+        Returns
+        -------
+        result : dict
+            Dictionary with the same entries as `ParameterEstimator.run`
+            and the npred excess.
+        """
+        name = datasets.models[self.source].name
+        counts, background, template, sizes = [], [], [], []
+
+        with datasets.parameters.restore_status():
+            parameter.value = 1
+
+            for dataset in datasets:
+                mask = Ellipsis
+                if dataset.mask is not None:
+                    mask = ~(dataset.mask.data == False)  # noqa
+
+                npred_signal = dataset.npred_signal(model_names=[name]).data[mask]
+                npred = dataset.npred().data[mask]
+
+                sizes.append(npred.size)
+                counts.append(dataset.counts.data[mask].astype(float).ravel())
+                background.append((npred - npred_signal).astype(float).ravel())
+                template.append(npred_signal.astype(float).ravel())
+
+        counts = np.concatenate(counts)
+        background = np.concatenate(background)
+        template = np.concatenate(template)
+
+        selection = [_ for _ in ["errn-errp", "ul"] if _ in self.selection_optional]
+        estimator = BrentqFluxEstimator(
+            rtol=1e-4,
+            n_sigma=self.n_sigma,
+            n_sigma_ul=self.n_sigma_ul,
+            selection_optional=selection,
+            max_niter=100,
+        )
+
+        # pixels without counts, background and signal do not contribute
+        valid = (counts != 0) | (background != 0) | (template != 0)
+        dataset = SimpleMapDataset(
+            model=template[valid],
+            counts=counts[valid],
+            background=background[valid],
+            norm_guess=1,
+        )
+        result = estimator.estimate_best_fit(dataset)
+        norm = result["norm"]
+
+        if np.isfinite(parameter.min):
+            norm = max(norm, parameter.min)
+
+        if np.isfinite(parameter.max):
+            norm = min(norm, parameter.max)
+
+        result["norm"] = norm
+        result["stat"] = dataset.stat_sum(norm=norm)
+        result["stat_null"] = dataset.stat_sum(norm=self.null_value)
+        result["ts"] = result["stat_null"] - result["stat"]
+        del result["niter"]
+
+        if "ul" in selection:
+            result.update(estimator.estimate_ul(dataset, result))
+
+        if "errn-errp" in selection:
+            result.update(estimator.estimate_errn_errp(dataset, result))
+
+        if "scan" in self.selection_optional:
+            scan_values = parameter.scan_values
+            npred = dataset.npred(norm=scan_values[:, np.newaxis])
+            stat_scan = cash(dataset.counts, npred).sum(axis=1)
+            result.update({"norm_scan": scan_values, "stat_scan": stat_scan})
+
+        datasets.models[self.source].spectral_model.norm.value = norm
+
+        index = np.repeat(np.arange(len(sizes)), sizes)
+        npred_excess = norm * np.bincount(index, weights=template, minlength=len(sizes))
+        npred_background = np.bincount(index, weights=background, minlength=len(sizes))
+        result["npred"] = npred_background + npred_excess
+        result["npred_excess"] = npred_excess
+
+        result.update(self.estimate_counts(datasets))
+        return result
@@ -8,7 +8,7 @@ from gammapy.datasets import MapDatasetOnOff
 from gammapy.maps import Map, Maps, WcsNDMap
 from gammapy.modeling.models import PowerLawSpectralModel
 from gammapy.stats import CashCountsStatistic
-from gammapy.utils.array import scale_cube
+from gammapy.utils.array import _fftconvolve_wrap
 from gammapy.utils.pbar import progress_bar
 from ..core import Estimator
 from ..utils import estimate_exposure_reco_energy
@@ -49,6 +49,21 @@ class ASmoothMapEstimator(Estimator):
         but rather the closest values to the energy axis edges of the parent dataset.
         Default is None: apply the estimator in each energy bin of the parent dataset.
         For further explanation see :ref:`estimators`.
+    pyramid_min_width : float, optional
+        Minimal kernel width in pixels on the downsampled maps of an image pyramid.
+        Each scale is evaluated on the maps downsampled by the largest power of two,
+        for which the kernel width is still larger than this value, and the result
+        is interpolated back to the full resolution. This speeds up large scales at
+        the cost of an approximation. Default is None, which evaluates all scales
+        at full resolution.
+
+    Notes
+    -----
+    The scales are evaluated one after the other, from the smallest to the
+    largest. Each scale is only evaluated in the region containing the pixels that
+    did not reach the threshold yet, and the estimation stops once all pixels
+    reached it. The memory use is bounded by a few images, independent of the
+    number of scales.
 
     Examples
     --------
@@ -73,6 +88,7 @@ class ASmoothMapEstimator(Estimator):
         method="lima",
         threshold=5,
         energy_edges=None,
+        pyramid_min_width=None,
     ):
         if spectral_model is None:
             spectral_model = PowerLawSpectralModel(index=2)
@@ -87,6 +103,7 @@ class ASmoothMapEstimator(Estimator):
         self.threshold = threshold
         self.method = method
         self.energy_edges = energy_edges
+        self.pyramid_min_width = pyramid_min_width
 
     def selection_all(self):
         """Which quantities are computed."""
@@ -129,15 +146,14 @@ class ASmoothMapEstimator(Estimator):
             List of `~astropy.convolution.Kernel`.
         """
         scales = self.scales.to_value("deg") / Angle(pixel_scale).deg
+        return [self._get_kernel(scale) for scale in scales]
 
-        kernels = []
-        for scale in scales:  # .value:
-            kernel = self.kernel(scale, mode="oversample")
-            # TODO: check if normalizing here makes sense
-            kernel.normalize("peak")
-            kernels.append(kernel)
-
-        return kernels
+    def _get_kernel(self, scale):
+        """Get kernel for a scale given in pixels."""
+        kernel = self.kernel(scale, mode="oversample")
+        # TODO: check if normalizing here makes sense
+        kernel.normalize("peak")
+        return kernel
 
     @staticmethod
     def _sqrt_ts_cube(cubes, method):
@@ -237,20 +253,14 @@ class ASmoothMapEstimator(Estimator):
         else:
             exposure = None
 
-        pixel_scale = dataset_image.counts.geom.pixel_scales.mean()
-        kernels = self.get_kernels(pixel_scale)
-
-        cubes = {}
-        cubes["counts"] = scale_cube(counts, kernels)
-        cubes["background"] = scale_cube(background, kernels)
+        images = {"counts": counts, "background": background}
 
         if exposure is not None:
             flux = (dataset_image.counts - background) / exposure
-            cubes["flux"] = scale_cube(flux.data[0], kernels)
-
-        cubes["sqrt_ts"] = self._sqrt_ts_cube(cubes, method=self.method)
+            images["flux"] = flux.data[0]
 
-        smoothed = self._reduce_cubes(cubes, kernels)
+        pixel_scale = dataset_image.counts.geom.pixel_scales.mean()
+        smoothed = self._smooth_images(images, pixel_scale)
 
         result = {}
 
@@ -274,41 +284,149 @@ class ASmoothMapEstimator(Estimator):
 
         return result
 
-    def _reduce_cubes(self, cubes, kernels):
-        """
-        Combine scale cube to image.
+    def _get_downsampling_factor(self, scale):
+        """Downsampling factor of the image pyramid level for a scale given in pixels."""
+        if self.pyramid_min_width is None or scale < 2 * self.pyramid_min_width:
+            return 1
+
+        return int(2 ** np.floor(np.log2(scale / self.pyramid_min_width)))
+
+    def _smooth_images(self, images, pixel_scale):
+        """Combine the images smoothed with the scale selected per pixel.
 
         Parameters
         ----------
-        cubes : dict
-            Data cubes.
+        images : dict of `~numpy.ndarray`
+            Counts, background and optionally flux images.
+        pixel_scale : `~astropy.coordinates.Angle`
+            Sky image pixel scale.
+
+        Returns
+        -------
+        smoothed : dict of `~numpy.ndarray`
+            Smoothed images, NaN where no scale reached the threshold.
         """
-        shape = cubes["counts"].shape[:2]
-        smoothed = {}
+        shape = images["counts"].shape
+        smoothed = {key: np.full(shape, np.nan) for key in ["scale", "sqrt_ts"]}
+
+        for key in images:
+            smoothed[key] = np.full(shape, np.nan)
 
-        # Init smoothed data arrays
-        for key in ["counts", "background", "scale", "sqrt_ts"]:
-            smoothed[key] = np.tile(np.nan, shape)
+        remaining = np.ones(shape, dtype=bool)
+        scales = self.scales.to_value("deg") / Angle(pixel_scale).deg
+        pyramid = {1: images}
 
-        if "flux" in cubes:
-            smoothed["flux"] = np.tile(np.nan, shape)
+        for scale, scale_pix in zip(self.scales, scales):
+            if not remaining.any():
+                break
 
-        for idx, scale in enumerate(self.scales):
-            # slice out 2D image at index idx out of cube
-            slice_ = np.s_[:, :, idx]
+            factor = self._get_downsampling_factor(scale_pix)
 
-            mask = np.isnan(smoothed["counts"])
-            mask = (cubes["sqrt_ts"][slice_] > self.threshold) & mask
+            if factor not in pyramid:
+                pyramid[factor] = {
+                    key: _block_mean(image, factor) for key, image in images.items()
+                }
 
-            smoothed["scale"][mask] = scale
-            smoothed["sqrt_ts"][mask] = cubes["sqrt_ts"][slice_][mask]
+            region = _bounding_box(remaining)
+            cubes, norm = self._convolve_region(
+                pyramid[factor], scale_pix / factor, factor, region
+            )
+            cubes["sqrt_ts"] = self._sqrt_ts_cube(cubes, method=self.method)
 
-            # renormalize smoothed data arrays
-            norm = kernels[idx].array.sum()
-            for key in ["counts", "background"]:
-                smoothed[key][mask] = cubes[key][slice_][mask] / norm
+            mask = remaining[region] & (cubes["sqrt_ts"] > self.threshold)
+            remaining[region][mask] = False
 
-            if "flux" in cubes:
-                smoothed["flux"][mask] = cubes["flux"][slice_][mask] / norm
+            smoothed["scale"][region][mask] = scale
+            smoothed["sqrt_ts"][region][mask] = cubes["sqrt_ts"][mask]
+
+            # renormalize smoothed data arrays
+            for key in images:
+                smoothed[key][region][mask] = cubes[key][mask] / norm
 
         return smoothed
+
+    def _convolve_region(self, images, scale, factor, region):
+        """Convolve images with the kernel of a scale, in a region of the full resolution images.
+
+        Parameters
+        ----------
+        images : dict of `~numpy.ndarray`
+            Images, downsampled by ``factor``.
+        scale : float
+            Scale in pixels of the downsampled images.
+        factor : int
+            Downsampling factor.
+        region : tuple of slice
+            Region of the full resolution images.
+
+        Returns
+        -------
+        cubes : dict of `~numpy.ndarray`
+            Convolved images in the region, in units of the full resolution images.
+        norm : float
+            Sum of the kernel at full resolution.
+        """
+        kernel = self._get_kernel(scale)
+        norm = kernel.array.sum()
+        width = np.array(kernel.shape) // 2 + 1
+
+        shape_level = images["counts"].shape
+        start = [max(_.start // factor - w, 0) for _, w in zip(region, width)]
+        stop = [
+            min(-(-_.stop // factor) + w, n)
+            for _, w, n in zip(region, width, shape_level)
+        ]
+        cutout = tuple(slice(lo, hi) for lo, hi in zip(start, stop))
+
+        cubes = {}
+
+        for key, image in images.items():
+            convolved = _fftconvolve_wrap(kernel, image[cutout])
+
+            if factor == 1:
+                cubes[key] = convolved[
+                    tuple(
+                        slice(_.start - lo, _.stop - lo) for _, lo in zip(region, start)
+                    )
+                ]
+            else:
+                cubes[key] = _upsample_region(convolved, factor, region, start)
+                cubes[key] *= factor**2
+
+        return cubes, norm * factor**2
+
+
+def _bounding_box(mask):
+    """Slices of the smallest region containing all True pixels of a mask."""
+    region = []
+
+    for axis in [1, 0]:
+        idx = np.flatnonzero(mask.any(axis=axis))
+        region.append(slice(idx[0], idx[-1] + 1))
+
+    return tuple(region)
+
+
+def _upsample_region(image, factor, region, offset):
+    """Bilinear interpolation of a downsampled image at the pixel centers of a full resolution region."""
+    for axis, (slice_, lo) in enumerate(zip(region, offset)):
+        coords = (np.arange(slice_.start, slice_.stop) + 0.5) / factor - 0.5 - lo
+        coords = np.clip(coords, 0, image.shape[axis] - 1)
+        idx = coords.astype(int)
+        weights = np.expand_dims(coords - idx, axis=1 - axis)
+
+        lower = np.take(image, idx, axis=axis)
+        upper = np.take(image, np.minimum(idx + 1, image.shape[axis] - 1), axis=axis)
+        image = lower + weights * (upper - lower)
+
+    return image
+
+
+def _block_mean(image, factor):
+    """Downsample an image by a factor, averaging over the valid pixels of each block."""
+    shape = -(-np.array(image.shape) // factor)
+    pad_width = [(0, n * factor - m) for n, m in zip(shape, image.shape)]
+
+    data = np.pad(image, pad_width).reshape(shape[0], factor, shape[1], factor)
+    weights = np.pad(np.ones(image.shape), pad_width).reshape(data.shape)
+    return data.sum(axis=(1, 3)) / weights.sum(axis=(1, 3))
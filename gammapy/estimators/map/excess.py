@@ -1,15 +1,18 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
-import copy
 import logging
 import numpy as np
 from astropy.convolution import Tophat2DKernel
 from astropy.coordinates import Angle
 from gammapy.datasets import MapDataset, MapDatasetOnOff
-from gammapy.maps import Map
+from gammapy.maps import Map, MapAxis
 from gammapy.modeling.models import PowerLawSpectralModel, SkyModel
 from gammapy.stats import CashCountsStatistic, WStatCountsStatistic
 from ..core import Estimator
-from ..utils import estimate_exposure_reco_energy, apply_threshold_sensitivity
+from ..utils import (
+    _FFTConvolution,
+    apply_threshold_sensitivity,
+    estimate_exposure_reco_energy,
+)
 from .core import FluxMaps
 
 __all__ = ["ExcessMapEstimator"]
@@ -17,75 +20,121 @@ __all__ = ["ExcessMapEstimator"]
 log = logging.getLogger(__name__)
 
 
-def _get_convolved_maps(dataset, kernel, mask, correlate_off):
-    """Return convolved maps.
+def _convolve_maps(maps, kernels):
+    """Convolve maps sharing the same geometry with several kernels.
+
+    The maps are convolved one after the other and plane by plane. The
+    transform of each kernel is computed only once and shared by all maps and
+    image planes. The convolved maps are directly stored as float32.
+
+    Parameters
+    ----------
+    maps : dict of `~gammapy.maps.WcsNDMap`
+        Maps to convolve.
+    kernels : list of `~numpy.ndarray`
+        Kernel images.
+
+    Returns
+    -------
+    convolved : list of dict of `~gammapy.maps.WcsNDMap`
+        Convolved maps for each kernel.
+    """
+    data_shape = next(iter(maps.values())).data.shape
+    convolve = _FFTConvolution(kernels, data_shape)
+    results = [{} for _ in kernels]
+
+    for name, m in maps.items():
+        convolved = convolve(m.data, dtype=np.float32)
+
+        for result, data in zip(results, convolved):
+            result[name] = m.copy(data=data)
+
+    return results
+
+
+def _get_convolved_maps(dataset, kernels, mask, correlate_off, reco_exposure=None):
+    """Return convolved maps for each kernel.
 
     Parameters
     ----------
     dataset : `~gammapy.datasets.MapDataset` or `~gammapy.datasets.MapDatasetOnOff`
         Map dataset.
-    kernel : `~astropy.convolution.Kernel`
-        Kernel.
+    kernels : list of `~gammapy.maps.Map`
+        Kernels.
     mask : `~gammapy.maps.Map`
         Mask map.
     correlate_off : bool
         Correlate OFF events.
+    reco_exposure : `~gammapy.maps.Map`, optional
+        Exposure in reconstructed energy. If given, the mask averaged
+        correlated exposure is added as "reco_exposure". Default is None.
 
     Returns
     -------
-    convolved_maps : dict
-        Dictionary of convolved maps.
+    convolved_maps : list of dict
+        Dictionary of convolved maps for each kernel.
     """
-    # Kernel is modified later make a copy here
-    kernel = copy.deepcopy(kernel)
-    kernel_data = kernel.data / kernel.data.max()
+    kernels = [kernel.data / kernel.data.max() for kernel in kernels]
 
-    # fft convolution adds numerical noise, to ensure integer results we call
-    # np.rint
-    n_on = dataset.counts * mask
-    n_on_conv = np.rint(n_on.convolve(kernel_data).data)
-
-    convolved_maps = {"n_on_conv": n_on_conv}
+    maps = {"n_on": dataset.counts * mask}
 
     if isinstance(dataset, MapDatasetOnOff):
         n_off = dataset.counts_off * mask
-        npred_sig = dataset.npred_signal() * mask
         acceptance_on = dataset.acceptance * mask
         acceptance_off = dataset.acceptance_off * mask
-        npred_sig_convolve = npred_sig.convolve(kernel_data)
+        maps["npred_sig"] = dataset.npred_signal() * mask
+
         if correlate_off:
             background = dataset.background * mask
             background.data[dataset.acceptance_off == 0] = 0.0
-            background_conv = background.convolve(kernel_data)
-            n_off = n_off.convolve(kernel_data)
+            maps["background"] = background
+            maps["n_off"] = n_off
+        else:
+            maps["acceptance_on"] = acceptance_on
+    else:
+        maps["npred"] = dataset.npred() * mask
 
-            with np.errstate(invalid="ignore", divide="ignore"):
-                alpha = background_conv / n_off
+    if reco_exposure is not None:
+        maps["reco_exposure"] = reco_exposure
+        maps["mask"] = mask
+
+    results = []
 
+    for convolved in _convolve_maps(maps, kernels):
+        # fft convolution adds numerical noise, to ensure integer results we call
+        # np.rint
+        convolved_maps = {"n_on_conv": np.rint(convolved["n_on"].data)}
+
+        if isinstance(dataset, MapDatasetOnOff):
+            if correlate_off:
+                n_off = convolved["n_off"]
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    alpha = convolved["background"] / n_off
+            else:
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    alpha = convolved["acceptance_on"] / acceptance_off
+
+            convolved_maps.update(
+                {
+                    "n_off": n_off,
+                    "npred_sig_convolve": convolved["npred_sig"],
+                    "acceptance_on": acceptance_on,
+                    "acceptance_off": acceptance_off,
+                    "alpha": alpha,
+                }
+            )
         else:
-            acceptance_on_convolve = acceptance_on.convolve(kernel_data)
+            convolved_maps["background_conv"] = convolved["npred"]
 
+        if reco_exposure is not None:
             with np.errstate(invalid="ignore", divide="ignore"):
-                alpha = acceptance_on_convolve / acceptance_off
-        convolved_maps.update(
-            {
-                "n_off": n_off,
-                "npred_sig_convolve": npred_sig_convolve,
-                "acceptance_on": acceptance_on,
-                "acceptance_off": acceptance_off,
-                "alpha": alpha,
-            }
-        )
-    else:
-        npred = dataset.npred() * mask
-        background_conv = npred.convolve(kernel_data)
-        convolved_maps.update(
-            {
-                "background_conv": background_conv,
-            }
-        )
+                convolved_maps["reco_exposure"] = (
+                    convolved["reco_exposure"] / convolved["mask"]
+                )
+
+        results.append(convolved_maps)
 
-    return convolved_maps
+    return results
 
 
 def convolved_map_dataset_counts_statistics(convolved_maps, stat_type):
@@ -272,6 +321,11 @@ class ExcessMapEstimator(Estimator):
         maps : `FluxMaps`
             Flux maps.
         """
+        resampled_dataset, reco_exposure = self._resample_dataset(dataset)
+        return self.estimate_excess_map(resampled_dataset, reco_exposure)
+
+    def _resample_dataset(self, dataset):
+        """Resample the dataset and exposure in reconstructed energy to the target energy axis."""
         if not isinstance(dataset, MapDataset):
             raise ValueError(
                 "Unsupported dataset type. Excess map is not applicable to 1D datasets."
@@ -301,28 +355,72 @@ class ExcessMapEstimator(Estimator):
             )
             resampled_dataset.models = None
 
-        result = self.estimate_excess_map(resampled_dataset, reco_exposure)
-        return result
+        return resampled_dataset, reco_exposure
+
+    def run_radii(self, dataset, correlation_radii):
+        """Compute correlated excess, Li & Ma significance and flux maps for several correlation radii.
+
+        The dataset is resampled once and all correlated maps are computed with
+        a single Fourier transform of the input maps, shared by all radii.
+
+        Parameters
+        ----------
+        dataset : `~gammapy.datasets.MapDataset` or `~gammapy.datasets.MapDatasetOnOff`
+            Map dataset.
+        correlation_radii : `~astropy.coordinates.Angle`
+            Correlation radii.
+
+        Returns
+        -------
+        maps : `FluxMaps`
+            Flux maps with an additional "correlation_radius" axis.
+        """
+        correlation_radii = Angle(correlation_radii).to("deg")
+        dataset, reco_exposure = self._resample_dataset(dataset)
 
-    def estimate_kernel(self, dataset):
+        kernels = [
+            self.estimate_kernel(dataset, correlation_radius=correlation_radius)
+            for correlation_radius in correlation_radii
+        ]
+        results = self._estimate_excess_maps(dataset, reco_exposure, kernels)
+
+        axis = MapAxis.from_nodes(
+            correlation_radii, name="correlation_radius", interp="lin"
+        )
+
+        maps = {}
+        for name in results[0]:
+            maps[name] = Map.from_stack(maps=[_[name] for _ in results], axis=axis)
+
+        return self._to_flux_maps(maps)
+
+    def estimate_kernel(self, dataset, correlation_radius=None):
         """Get the convolution kernel for the input dataset.
 
         Parameters
         ----------
         dataset : `~gammapy.datasets.MapDataset`
             Input dataset.
+        correlation_radius : `~astropy.coordinates.Angle`, optional
+            Correlation radius. Default is None, which uses `correlation_radius`
+            of the estimator.
 
         Returns
         -------
         kernel : `~astropy.convolution.Tophat2DKernel`
             Kernel.
         """
+        if correlation_radius is None:
+            correlation_radius = self.correlation_radius
+
+        correlation_radius = Angle(correlation_radius)
+
         pixel_size = np.mean(np.abs(dataset.counts.geom.wcs.wcs.cdelt))
-        size = self.correlation_radius.deg / pixel_size
+        size = correlation_radius.deg / pixel_size
         kernel = Tophat2DKernel(size)
 
         geom = dataset.counts.geom.to_image()
-        geom = geom.to_odd_npix(max_radius=self.correlation_radius)
+        geom = geom.to_odd_npix(max_radius=correlation_radius)
         return Map.from_geom(geom, data=kernel.array)
 
     @staticmethod
@@ -385,10 +483,40 @@ class ExcessMapEstimator(Estimator):
             Map dataset.
         """
         kernel = self.estimate_kernel(dataset)
+        maps = self._estimate_excess_maps(dataset, reco_exposure, kernels=[kernel])[0]
+        return self._to_flux_maps(maps)
+
+    def _estimate_excess_maps(self, dataset, reco_exposure, kernels):
+        """Estimate excess and test statistic maps for several kernels.
+
+        Parameters
+        ----------
+        dataset : `~gammapy.datasets.MapDataset`
+            Map dataset.
+        reco_exposure : `~gammapy.maps.Map`
+            Exposure in reconstructed energy.
+        kernels : list of `~gammapy.maps.Map`
+            Kernels.
+
+        Returns
+        -------
+        maps : list of dict of `~gammapy.maps.Map`
+            Result maps for each kernel.
+        """
         geom = dataset.counts.geom
         mask = self.estimate_mask_default(dataset)
 
-        convolved_maps = _get_convolved_maps(dataset, kernel, mask, self.correlate_off)
+        results = _get_convolved_maps(
+            dataset, kernels, mask, self.correlate_off, reco_exposure=reco_exposure
+        )
+
+        return [
+            self._estimate_excess_map(dataset, geom, mask, convolved_maps)
+            for convolved_maps in results
+        ]
+
+    def _estimate_excess_map(self, dataset, geom, mask, convolved_maps):
+        """Estimate excess and test statistic maps from convolved maps."""
         counts_stat = convolved_map_dataset_counts_statistics(
             convolved_maps=convolved_maps, stat_type=dataset.stat_type
         )
@@ -401,9 +529,7 @@ class ExcessMapEstimator(Estimator):
         maps["ts"] = Map.from_geom(geom, data=counts_stat.ts)
         maps["sqrt_ts"] = Map.from_geom(geom, data=counts_stat.sqrt_ts)
 
-        reco_exposure = self.estimate_exposure_reco_energy(
-            dataset, kernel, mask, reco_exposure
-        )
+        reco_exposure = convolved_maps.get("reco_exposure", 1)
 
         with np.errstate(invalid="ignore", divide="ignore"):
             maps["norm"] = maps["npred_excess"] / reco_exposure
@@ -451,6 +577,10 @@ class ExcessMapEstimator(Estimator):
         for name in maps:
             maps[name].data[~mask] = np.nan
 
+        return maps
+
+    def _to_flux_maps(self, maps):
+        """Create flux maps from the result maps."""
         meta = {
             "n_sigma": self.n_sigma,
             "n_sigma_ul": self.n_sigma_ul,
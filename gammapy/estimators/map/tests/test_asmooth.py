@@ -1,11 +1,12 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
+import numpy as np
 from numpy.testing import assert_allclose
 import astropy.units as u
-from astropy.convolution import Tophat2DKernel
+from astropy.convolution import Gaussian2DKernel, Tophat2DKernel
 from gammapy.datasets import Datasets, MapDataset, MapDatasetOnOff
 from gammapy.estimators import ASmoothMapEstimator
-from gammapy.maps import Map, MapAxis, WcsNDMap
+from gammapy.maps import Map, MapAxis, WcsGeom, WcsNDMap
 from gammapy.utils.testing import requires_data
 from gammapy.modeling.models import PowerLawSpectralModel
 from gammapy.utils.deprecation import GammapyDeprecationWarning
@@ -123,3 +124,38 @@ def test_asmooth_map_dataset_on_off():
     assert_allclose(smoothed["counts"].data[0, 25, 25], 2)
     assert_allclose(smoothed["background"].data[0, 25, 25], 1)
     assert_allclose(smoothed["sqrt_ts"].data[0, 25, 25], 4.39, rtol=1e-2)
+
+
+@pytest.mark.parametrize("kernel", [Gaussian2DKernel, Tophat2DKernel])
+def test_asmooth_pyramid(kernel):
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=1)
+    geom = WcsGeom.create(npix=200, binsz=0.02, axes=[axis])
+    dataset = MapDataset.create(geom)
+    dataset.mask_safe.data[...] = True
+    dataset.background.data += 0.5
+
+    y, x = np.mgrid[:200, :200]
+    signal = np.exp(-0.5 * ((x - 60) ** 2 + (y - 80) ** 2) / 20**2)
+    rng = np.random.default_rng(0)
+    dataset.counts.data = rng.poisson(0.5 + 0.3 * signal)[np.newaxis]
+
+    scales = ASmoothMapEstimator.get_scales(7, kernel=kernel) * 0.1 * u.deg
+    asmooth = ASmoothMapEstimator(scales=scales, kernel=kernel, threshold=3)
+    smoothed = asmooth.run(dataset)
+
+    scale = smoothed["scale"].data
+    assert np.all(scale[~np.isnan(scale)] <= scales[-1].to_value("deg"))
+    assert np.isfinite(scale[0, 80, 60])
+    assert_allclose(smoothed["background"].data[0, 80, 60], 0.5)
+
+    asmooth.pyramid_min_width = 4
+    smoothed_pyramid = asmooth.run(dataset)
+
+    valid = np.isfinite(scale)
+    same_scale = smoothed_pyramid["scale"].data == scale
+    assert np.sum(same_scale) > 0.8 * np.sum(valid)
+
+    for name in ["counts", "sqrt_ts"]:
+        actual = smoothed_pyramid[name].data[same_scale]
+        desired = smoothed[name].data[same_scale]
+        assert_allclose(np.median(np.abs(actual / desired - 1)), 0, atol=2e-2)
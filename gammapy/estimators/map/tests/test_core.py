@@ -9,7 +9,7 @@ from astropy.io import fits
 from astropy.time import Time
 from gammapy.data import GTI
 from gammapy.estimators import FluxMaps
-from gammapy.estimators.utils import combine_flux_maps
+from gammapy.estimators.utils import FluxMapsCombiner, combine_flux_maps
 from gammapy.maps import MapAxis, Maps, RegionGeom, TimeMapAxis, WcsNDMap
 from gammapy.modeling.models import (
     LogParabolaSpectralModel,
@@ -271,6 +271,50 @@ def test_combine_flux_maps(map_flux_estimate, wcs_flux_map, reference_model):
     assert_allclose(fe_new.ts, ts * 2)
 
 
+@pytest.mark.parametrize("method", ["gaussian_errors", "distrib"])
+def test_flux_maps_combiner(method, tmp_path):
+    gti = GTI.create(u.Quantity([1, 2], "min"), u.Quantity([1.5, 2.5], "min"))
+
+    axis = MapAxis.from_energy_edges((0.1, 1.0), unit="TeV")
+    nmap = WcsNDMap.create(npix=5, axes=[axis])
+
+    data = dict()
+    data["norm"] = nmap.copy(data=1.0)
+    data["norm_err"] = nmap.copy(data=0.1)
+    data["norm_errn"] = nmap.copy(data=0.2)
+    data["norm_errp"] = nmap.copy(data=0.15)
+    data["ts"] = nmap.copy(data=100.0)
+
+    model = SkyModel(PowerLawSpectralModel(amplitude="1e-10 cm-2s-1TeV-1", index=2))
+    fe = FluxMaps(data=data, reference_model=model, gti=gti)
+
+    combiner = FluxMapsCombiner(method=method)
+    combiner.add(fe)
+    combiner.add(fe)
+
+    filename = tmp_path / "combined.fits"
+    combiner.write(filename)
+    assert (tmp_path / "combined_model.yaml").exists()
+
+    combiner = FluxMapsCombiner.read(filename)
+    assert combiner.method == method
+    assert combiner.n_maps == 2
+    combiner.add(fe)
+
+    fe_new = combiner.finalize()
+    fe_ref = combine_flux_maps([fe, fe, fe], method=method)
+
+    assert_allclose(fe_new.dnde.quantity, fe_ref.dnde.quantity)
+    assert_allclose(fe_new.dnde_err.quantity, fe_ref.dnde_err.quantity)
+    assert_allclose(fe_new.ts.data, fe_ref.ts.data)
+    assert_allclose(fe_new.ts.data, 3 * fe.ts.data, rtol=1e-2)
+    assert len(fe_new.gti.table) == 6
+    assert fe_new.reference_model.spectral_model.index.value == 2
+
+    with pytest.raises(ValueError):
+        FluxMapsCombiner(method="sum")
+
+
 def test_flux_map_properties(wcs_flux_map, reference_model):
     fluxmap = FluxMaps(wcs_flux_map, reference_model)
 
@@ -444,6 +444,13 @@ def test_joint_excess_map(simple_dataset):
     assert_allclose(
         result["df"].data, 2 * (~np.isnan(result["significance"].data)), rtol=1e-3
     )
+    assert len(result["estimator_results"]) == 2
+
+    result_streamed = get_combined_significance_maps(
+        estimator, [simple_dataset, simple_dataset2], keep_estimator_results=False
+    )
+    assert "estimator_results" not in result_streamed
+    assert_allclose(result_streamed["significance"].data, result["significance"].data)
 
 
 def test_maps_alpha(simple_dataset_on_off):
@@ -455,3 +462,31 @@ def test_maps_alpha(simple_dataset_on_off):
     assert_allclose(result["acceptance_on"].data[:, 10, 10], 2, atol=1e-3)
     assert_allclose(result["acceptance_off"].data[:, 10, 10], 2, atol=1e-3)
     assert_allclose(result["alpha"].data[:, 10, 10], 1, atol=1e-3)
+
+
+@pytest.mark.parametrize("correlate_off", [True, False])
+def test_excess_map_estimator_run_radii(simple_dataset_mask_safe, correlate_off):
+    dataset_on_off = MapDatasetOnOff.from_map_dataset(
+        simple_dataset_mask_safe,
+        acceptance=1,
+        acceptance_off=2,
+        counts_off=simple_dataset_mask_safe.background * 2,
+    )
+    radii = [0.05, 0.1] * u.deg
+
+    for dataset in [simple_dataset_mask_safe, dataset_on_off]:
+        estimator = ExcessMapEstimator(
+            energy_edges=[0.1, 1, 10] * u.TeV,
+            correlate_off=correlate_off,
+        )
+        result = estimator.run_radii(dataset, radii)
+
+        assert result.sqrt_ts.geom.axes.names == ["energy", "correlation_radius"]
+        assert result.sqrt_ts.data.shape == (2, 2, 20, 20)
+
+        for idx, radius in enumerate(radii):
+            estimator.correlation_radius = radius
+            result_ref = estimator.run(dataset)
+
+            for name in ["npred", "npred_excess", "sqrt_ts", "norm", "norm_err"]:
+                assert_allclose(result[name].data[idx], result_ref[name].data)
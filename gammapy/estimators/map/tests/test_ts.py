@@ -421,6 +421,15 @@ def test_ts_map_stat_scan(fake_dataset):
     assert_allclose(combined_map.ts.data, 2 * ts, rtol=1e-4)
     assert_allclose(combined_map.norm.data[success], norm[success], rtol=5e-2)
 
+    combined_results = get_combined_flux_maps(
+        estimator,
+        [dataset, dataset.copy()],
+        method="distrib",
+        keep_estimator_results=False,
+    )
+    assert "estimator_results" not in combined_results
+    assert_allclose(combined_results["flux_maps"].ts.data, combined_map.ts.data)
+
     combined_map = combine_flux_maps([maps, maps1], method="profile")
     assert_allclose(combined_map.ts.data, 2 * ts, rtol=1e-4)
     assert_allclose(combined_map.norm.data[success], norm[success], rtol=5e-2)
@@ -646,3 +655,35 @@ def test_joint_ts_map_hawc():
         result["dnde_scan_values"].data[0, 0, 59, 59], -3.164557e-13, rtol=1e-3
     )
     assert_allclose(result["stat_scan"].data[0, 0, 59, 59], 7625.040553, rtol=1e-3)
+
+
+def test_ts_map_run_models(fake_dataset):
+    spectral_model = fake_dataset.models["source"].spectral_model
+    models = [
+        SkyModel(spectral_model, PointSpatialModel(), name="point"),
+        SkyModel(spectral_model, GaussianSpatialModel(sigma="0.05 deg"), name="gauss"),
+    ]
+
+    estimator = TSMapEstimator(
+        SkyModel(spatial_model=PointSpatialModel(), spectral_model=spectral_model),
+        kernel_width="0.3 deg",
+        energy_edges=[0.1, 1, 10] * u.TeV,
+        selection_optional=["ul"],
+        threshold=1,
+        downsampling_factor=2,
+    )
+    maps = estimator.run_models(fake_dataset, models)
+
+    assert maps.ts.geom.axes.names == ["energy", "kernel"]
+    assert maps.ts.geom.data_shape == (2, 2, 50, 50)
+    assert list(maps.ts.geom.axes["kernel"].center) == ["point", "gauss"]
+    assert maps.success.data.dtype == bool
+
+    for idx, model in enumerate(models):
+        estimator.model = SkyModel(
+            spatial_model=model.spatial_model, spectral_model=spectral_model
+        )
+        maps_ref = estimator.run(fake_dataset)
+
+        for name in ["ts", "norm", "norm_err", "norm_ul", "niter"]:
+            assert_allclose(maps[name].data[idx], maps_ref[name].data)
@@ -12,7 +12,7 @@ import gammapy.utils.parallel as parallel
 from gammapy.datasets import Datasets
 from gammapy.datasets.map import MapEvaluator
 from gammapy.datasets.utils import get_nearest_valid_exposure_position
-from gammapy.maps import Map, MapAxis, Maps
+from gammapy.maps import LabelMapAxis, Map, MapAxis, Maps
 from gammapy.modeling.models import PointSpatialModel, PowerLawSpectralModel, SkyModel
 from gammapy.stats import cash, cash_sum_cython, f_cash_root_cython, norm_bounds_cython
 from gammapy.utils.array import shape_2N, symmetric_crop_pad_width
@@ -20,6 +20,7 @@ from gammapy.utils.pbar import progress_bar
 from gammapy.utils.roots import find_roots
 from ..core import Estimator
 from ..utils import (
+    _convolve_fft,
     _generate_scan_values,
     _get_default_norm,
     _get_norm_scan_values,
@@ -258,7 +259,7 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
 
         return selection
 
-    def estimate_kernel(self, dataset):
+    def estimate_kernel(self, dataset, model=None):
         """Get the convolution kernel for the input dataset.
 
         Convolves the model with the IRFs at the center of the dataset,
@@ -268,6 +269,8 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         ----------
         dataset : `~gammapy.datasets.MapDataset`
             Input dataset.
+        model : `~gammapy.modeling.models.SkyModel`, optional
+            Source model. Default is None, which uses `model` of the estimator.
 
         Returns
         -------
@@ -280,7 +283,10 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         if self.kernel_width is not None:
             geom = geom.to_odd_npix(max_radius=self.kernel_width / 2)
 
-        model = self.model.copy()
+        if model is None:
+            model = self.model
+
+        model = model.copy()
         model.spatial_model.position = geom.center_skydir
 
         # Creating exposure map with the mean non-null exposure
@@ -333,17 +339,30 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         if kernel is None:
             kernel = self.estimate_kernel(dataset=dataset)
 
-        kernel = kernel.data / np.sum(kernel.data**2)
+        return self._estimate_flux_default(
+            dataset=dataset, kernels=[kernel], exposure=exposure, npred=dataset.npred()
+        )[0]
 
+    @staticmethod
+    def _estimate_flux_default(dataset, kernels, exposure, npred):
+        """Estimate default flux maps for several kernels sharing one FFT."""
         with np.errstate(invalid="ignore", divide="ignore"):
-            flux = (dataset.counts - dataset.npred()) / exposure
+            flux = (dataset.counts - npred) / exposure
             flux.data = np.nan_to_num(flux.data)
 
         flux.quantity = flux.quantity.to("1 / (cm2 s)")
-        flux = flux.convolve(kernel)
-        if dataset.mask_safe:
-            flux *= dataset.mask_safe
-        return flux.sum_over_axes()
+
+        kernels = [kernel.data / np.sum(kernel.data**2) for kernel in kernels]
+
+        fluxes = []
+
+        for data in _convolve_fft(flux.data, kernels):
+            flux_kernel = flux.copy(data=data.astype(np.float32))
+            if dataset.mask_safe:
+                flux_kernel *= dataset.mask_safe
+            fluxes.append(flux_kernel.sum_over_axes())
+
+        return fluxes
 
     @staticmethod
     def estimate_mask_default(dataset):
@@ -418,21 +437,43 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         maps : dict of `Map`
             Maps dictionary.
         """
+        return self._estimate_fit_input_maps(dataset=dataset, models=[self.model])[0]
+
+    def _estimate_fit_input_maps(self, dataset, models):
+        """Estimate fit input maps for several source models.
+
+        The counts, background, exposure and masks are computed once and shared,
+        only the kernel and the default norm differ between the models.
+
+        Parameters
+        ----------
+        dataset : `MapDataset`
+            Map dataset.
+        models : list of `~gammapy.modeling.models.SkyModel`
+            Source models.
+
+        Returns
+        -------
+        maps : list of dict of `Map`
+            Maps dictionary for each model.
+        """
         # First create 2D map arrays
 
         exposure = estimate_exposure_reco_energy(dataset, self.model.spectral_model)
 
-        kernel = self.estimate_kernel(dataset)
+        kernels = [self.estimate_kernel(dataset, model=model) for model in models]
 
         mask = self.estimate_mask_default(dataset=dataset)
 
-        flux = self.estimate_flux_default(
-            dataset=dataset, kernel=kernel, exposure=exposure
+        npred = dataset.npred()
+
+        fluxes = self._estimate_flux_default(
+            dataset=dataset, kernels=kernels, exposure=exposure, npred=npred
         )
 
         mask_safe = dataset.mask_safe if dataset.mask_safe else 1.0
         counts = dataset.counts * mask_safe
-        background = dataset.npred() * mask_safe
+        background = npred * mask_safe
         exposure *= mask_safe
 
         energy_axis = counts.geom.axes["energy"]
@@ -442,7 +483,6 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         )
 
         exposure_npred = (exposure * flux_ref * mask.data).to_unit("")
-        norm = (flux / flux_ref).to_unit("")
 
         if self.sum_over_energy_groups:
             if dataset.mask_safe is None:
@@ -454,15 +494,18 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         else:
             mask_safe = None  # already applied
 
-        return {
-            "counts": counts,
-            "background": background,
-            "norm": norm,
-            "mask": mask,
-            "mask_safe": mask_safe,
-            "exposure": exposure_npred,
-            "kernel": kernel,
-        }
+        return [
+            {
+                "counts": counts,
+                "background": background,
+                "norm": (flux / flux_ref).to_unit(""),
+                "mask": mask,
+                "mask_safe": mask_safe,
+                "exposure": exposure_npred,
+                "kernel": kernel,
+            }
+            for flux, kernel in zip(fluxes, kernels)
+        ]
 
     def estimate_flux_map(self, datasets):
         """Estimate flux and test statistic maps for single dataset.
@@ -473,7 +516,10 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
             Map dataset or Datasets (list of MapDataset with the same spatial geometry).
         """
         maps = [self.estimate_fit_input_maps(dataset=d) for d in datasets]
+        return self._estimate_flux_map(maps)
 
+    def _estimate_flux_map(self, maps):
+        """Estimate flux and test statistic maps from the fit input maps of each dataset."""
         mask = np.sum([_["mask"].data for _ in maps], axis=0).astype(bool)
 
         if not np.any(mask):
@@ -571,6 +617,92 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
                 * flux_ul : upper limit map.
 
         """
+        maps, gti = self._run(datasets=datasets, models=[self.model])
+
+        meta = {"n_sigma": self.n_sigma, "n_sigma_ul": self.n_sigma_ul}
+        return FluxMaps(
+            data=maps[0],
+            reference_model=self.model,
+            gti=gti,
+            meta=meta,
+        )
+
+    def run_models(self, datasets, models):
+        """Run test statistic map estimation for several source models at once.
+
+        The input maps are prepared only once per energy bin and shared by all
+        models: the datasets are padded, downsampled and sliced once, the counts,
+        background, exposure and masks are computed once and the residual flux
+        map used as starting value is Fourier transformed once for all kernels.
+        Only the kernels and the norm fits differ between the models.
+
+        Only the spatial models are used, the spectral model of `model` is
+        assumed for all kernels, so that the results share one reference model.
+        The kernels are truncated at `kernel_width`, which should be large
+        enough for the most extended model.
+
+        Notes
+        -----
+        The progress bar can be displayed for this function.
+
+        Parameters
+        ----------
+        datasets : `~gammapy.datasets.Datasets` or `~gammapy.datasets.MapDataset`
+            Map dataset or Datasets (list of MapDataset with the same spatial geometry).
+        models : list of `~gammapy.modeling.models.SkyModel` or `~gammapy.modeling.models.Models`
+            Source models defining the kernels. The model names are used as
+            labels of the kernel axis.
+
+        Returns
+        -------
+        maps : `~gammapy.estimators.FluxMaps`
+            Flux maps with an additional "kernel" label axis after the energy axis.
+        """
+        models = [
+            SkyModel(
+                spatial_model=model.spatial_model,
+                spectral_model=self.model.spectral_model,
+                name=model.name,
+            )
+            for model in models
+        ]
+
+        axis = LabelMapAxis(labels=[model.name for model in models], name="kernel")
+
+        results, gti = self._run(datasets=datasets, models=models)
+
+        maps = Maps()
+
+        for name in self.selection_all:
+            maps[name] = Map.from_stack(maps=[_[name] for _ in results], axis=axis)
+
+        maps["success"].data = maps["success"].data.astype(bool)
+
+        meta = {"n_sigma": self.n_sigma, "n_sigma_ul": self.n_sigma_ul}
+        return FluxMaps(
+            data=maps,
+            reference_model=self.model,
+            gti=gti,
+            meta=meta,
+        )
+
+    def _run(self, datasets, models):
+        """Estimate the flux maps of each model, sharing the dataset preparation.
+
+        Parameters
+        ----------
+        datasets : `~gammapy.datasets.Datasets` or `~gammapy.datasets.MapDataset`
+            Map dataset or Datasets (list of MapDataset with the same spatial geometry).
+        models : list of `~gammapy.modeling.models.SkyModel`
+            Source models.
+
+        Returns
+        -------
+        maps : list of `~gammapy.maps.Maps`
+            Result maps for each model.
+        gti : `~gammapy.data.GTI`
+            Good time intervals of the datasets.
+        """
         datasets = Datasets(datasets)
 
         geom_ref = datasets[0].counts.geom
@@ -586,8 +718,12 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
 
         pad_width = (0, 0)
         for dataset in datasets:
-            pad_width_dataset = self.estimate_pad_width(dataset=dataset)
-            pad_width = tuple(np.maximum(pad_width, pad_width_dataset))
+            for model in models:
+                kernel = self.estimate_kernel(dataset=dataset, model=model)
+                pad_width_dataset = self.estimate_pad_width(
+                    dataset=dataset, kernel=kernel
+                )
+                pad_width = tuple(np.maximum(pad_width, pad_width_dataset))
 
         datasets_padded = Datasets()
         for dataset in datasets:
@@ -614,30 +750,39 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
                     sum_over_energy_groups=self.sum_over_energy_groups,
                 )
                 datasets_sliced.models = models_sliced
-            result = self.estimate_flux_map(datasets_sliced)
-            results.append(result)
 
-        maps = Maps()
+            maps = [
+                self._estimate_fit_input_maps(dataset=dataset, models=models)
+                for dataset in datasets_sliced
+            ]
+            results.append(
+                [
+                    self._estimate_flux_map([_[idx] for _ in maps])
+                    for idx in range(len(models))
+                ]
+            )
 
-        for name in self.selection_all:
-            m = Map.from_stack(maps=[_[name] for _ in results], axis_name="energy")
+        maps_models = []
 
-            order = 0 if name in ["niter", "success"] else 1
-            m = m.upsample(
-                factor=self.downsampling_factor, preserve_counts=False, order=order
-            )
+        for idx in range(len(models)):
+            maps = Maps()
 
-            maps[name] = m.crop(crop_width=pad_width)
+            for name in self.selection_all:
+                m = Map.from_stack(
+                    maps=[_[idx][name] for _ in results], axis_name="energy"
+                )
 
-        maps["success"].data = maps["success"].data.astype(bool)
+                order = 0 if name in ["niter", "success"] else 1
+                m = m.upsample(
+                    factor=self.downsampling_factor, preserve_counts=False, order=order
+                )
 
-        meta = {"n_sigma": self.n_sigma, "n_sigma_ul": self.n_sigma_ul}
-        return FluxMaps(
-            data=maps,
-            reference_model=self.model,
-            gti=dataset.gti,
-            meta=meta,
-        )
+                maps[name] = m.crop(crop_width=pad_width)
+
+            maps["success"].data = maps["success"].data.astype(bool)
+            maps_models.append(maps)
+
+        return maps_models, dataset.gti
 
 
 # TODO: merge with MapDataset?
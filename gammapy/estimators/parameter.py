@@ -9,6 +9,7 @@ from gammapy.modeling import Fit
 from gammapy.modeling.selection import TestStatisticNested
 from gammapy.modeling.parameter import restore_parameters_status
 from gammapy.stats.utils import ts_to_sigma
+from gammapy.utils.interpolation import interpolate_profile
 from gammapy.utils.roots import find_roots
 from .core import Estimator
 
@@ -47,6 +48,15 @@ class ParameterEstimator(Estimator):
         Fit instance specifying the backend and fit options.
     reoptimize : bool
         Re-optimize other free model parameters. Default is True.
+    shared_profile : bool
+        If True the asymmetric errors and the upper limit are computed from a
+        single fit statistic profile, which is sampled adaptively around the
+        best fit value, cached and interpolated, instead of running a separate
+        confidence interval computation for each of them. The parameter error
+        is then used to narrow the search range of the sensitivity. This
+        reduces the number of fit statistic evaluations, the results agree
+        with the default method within the relative tolerance of the profile
+        sampling. Default is False.
 
     Examples
     --------
@@ -71,6 +81,7 @@ class ParameterEstimator(Estimator):
 
     tag = "ParameterEstimator"
     _available_selection_optional = ["errn-errp", "ul", "scan", "sensitivity"]
+    _profile = None
 
     def __init__(
         self,
@@ -81,6 +92,7 @@ class ParameterEstimator(Estimator):
         selection_optional=None,
         fit=None,
         reoptimize=True,
+        shared_profile=False,
     ):
         self.n_sigma = n_sigma
         self.n_sigma_ul = n_sigma_ul
@@ -93,6 +105,7 @@ class ParameterEstimator(Estimator):
 
         self.fit = fit
         self.reoptimize = reoptimize
+        self.shared_profile = shared_profile
 
     def estimate_best_fit(self, datasets, parameter):
         """Estimate parameter asymmetric errors.
@@ -193,6 +206,16 @@ class ParameterEstimator(Estimator):
                 f"{parameter.name}_errn": np.nan,
             }
 
+        if self.shared_profile:
+            profile = self._get_stat_profile(datasets, parameter)
+            delta_ts = self.n_sigma**2
+            return {
+                f"{parameter.name}_errp": profile.crossing(delta_ts, upper=True)
+                - profile.value_best,
+                f"{parameter.name}_errn": profile.value_best
+                - profile.crossing(delta_ts, upper=False),
+            }
+
         self.fit.optimize(datasets=datasets)
 
         res = self.fit.confidence(
@@ -264,6 +287,11 @@ class ParameterEstimator(Estimator):
         if not np.any(datasets.contributes_to_stat):
             return {f"{parameter.name}_ul": np.nan}
 
+        if self.shared_profile:
+            profile = self._get_stat_profile(datasets, parameter)
+            ul = profile.crossing(self.n_sigma_ul**2, upper=True)
+            return {f"{parameter.name}_ul": ul}
+
         self.fit.optimize(datasets=datasets)
 
         res = self.fit.confidence(
@@ -292,9 +320,34 @@ class ParameterEstimator(Estimator):
         estimator = ParameterSensitivityEstimator(
             parameter, self.null_value, n_sigma=self.n_sigma_sensitivity
         )
-        value = estimator.run(datasets)
+
+        bounds = None
+        error = parameter.error
+
+        if self.shared_profile and np.isfinite(error) and error > 0:
+            # the sensitivity is of the order of n_sigma parameter errors
+            value = self.n_sigma_sensitivity * error
+            bounds = (self.null_value + value / 10, self.null_value + value * 10)
+
+        value = estimator.run(datasets, bounds=bounds)
         return {f"{parameter.name}_sensitivity": value}
 
+    def _get_stat_profile(self, datasets, parameter):
+        """Get the cached fit statistic profile, or create it at the best fit."""
+        profile = self._profile
+
+        if profile is None or profile.parameter is not parameter:
+            self.fit.optimize(datasets=datasets)
+            profile = _StatProfile(
+                datasets=datasets,
+                parameter=parameter,
+                fit=self.fit,
+                reoptimize=self.reoptimize,
+            )
+            self._profile = profile
+
+        return profile
+
     @staticmethod
     def estimate_counts(datasets):
         """Estimate counts for the flux point.
@@ -368,11 +421,15 @@ class ParameterEstimator(Estimator):
             result = self.estimate_best_fit(datasets, parameter)
             result.update(self.estimate_ts(datasets, parameter))
 
-            if "errn-errp" in self.selection_optional:
-                result.update(self.estimate_errn_errp(datasets, parameter))
+            try:
+                if "errn-errp" in self.selection_optional:
+                    result.update(self.estimate_errn_errp(datasets, parameter))
 
-            if "ul" in self.selection_optional:
-                result.update(self.estimate_ul(datasets, parameter))
+                if "ul" in self.selection_optional:
+                    result.update(self.estimate_ul(datasets, parameter))
+            finally:
+                # the profile is only shared within a run
+                self._profile = None
 
             if "scan" in self.selection_optional:
                 result.update(self.estimate_scan(datasets, parameter))
@@ -442,17 +499,9 @@ class ParameterSensitivityEstimator:
         ts_asimov = self.test.ts_asimov(datasets)
         return ts_to_sigma(ts_asimov, ts_asimov=ts_asimov) - self.n_sigma
 
-    def parameter_matching_significance(self, datasets):
-        """Parameter value  matching the target significance"""
-
-        if ~np.isfinite(self.parameter.min):
-            vmin = self.parameter.value / 1e3
-        else:
-            vmin = self.parameter.min
-        if ~np.isfinite(self.parameter.max):
-            vmax = self.parameter.value * 1e3
-        else:
-            vmax = self.parameter.max
+    def _find_root(self, datasets, vmin, vmax, nbin, points_scale, relative_xtol=False):
+        # the default absolute tolerance of brentq is too large for small values
+        xtol = self.rtol * np.abs(vmin) if relative_xtol and vmin != 0 else None
 
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
@@ -461,10 +510,11 @@ class ParameterSensitivityEstimator:
                 vmin,
                 vmax,
                 args=(datasets,),
-                nbin=100,
+                nbin=nbin,
                 maxiter=self.max_niter,
                 rtol=self.rtol,
-                points_scale=self.parameter.interp,
+                xtol=xtol,
+                points_scale=points_scale,
             )
         # Where the root finding fails NaN is set as norm
         roots = roots[roots > 0]
@@ -473,11 +523,233 @@ class ParameterSensitivityEstimator:
         else:
             return np.nan
 
-    def run(self, datasets):
+    def parameter_matching_significance(self, datasets, bounds=None):
+        """Parameter value  matching the target significance
+
+        Parameters
+        ----------
+        datasets : `~gammapy.datasets.Datasets`
+            Datasets.
+        bounds : tuple of float, optional
+            Expected range of the parameter value. It is sampled with a few
+            points only, if no value is found within this range the full
+            search range is used. If given, the root is found with a tolerance
+            relative to the lower end of the search range instead of the
+            default absolute tolerance of `~scipy.optimize.brentq`.
+            Default is None.
+        """
+        relative_xtol = bounds is not None
+
+        if bounds is not None:
+            points_scale = "log" if bounds[0] > 0 else "lin"
+            value = self._find_root(
+                datasets,
+                *bounds,
+                nbin=4,
+                points_scale=points_scale,
+                relative_xtol=relative_xtol,
+            )
+            if np.isfinite(value):
+                return value
+
+        if ~np.isfinite(self.parameter.min):
+            vmin = self.parameter.value / 1e3
+        else:
+            vmin = self.parameter.min
+        if ~np.isfinite(self.parameter.max):
+            vmax = self.parameter.value * 1e3
+        else:
+            vmax = self.parameter.max
+
+        return self._find_root(
+            datasets,
+            vmin,
+            vmax,
+            nbin=100,
+            points_scale=self.parameter.interp,
+            relative_xtol=relative_xtol,
+        )
+
+    def run(self, datasets, bounds=None):
         """Parameter sensitivity
         given as the difference between value matching the target significance and the null value.
+
+        Parameters
+        ----------
+        datasets : `~gammapy.datasets.Datasets`
+            Datasets.
+        bounds : tuple of float, optional
+            Expected range of the parameter value matching the target
+            significance, see `parameter_matching_significance`.
+            Default is None.
         """
         with restore_parameters_status(self.test.parameters):
-            value = self.parameter_matching_significance(datasets)
+            value = self.parameter_matching_significance(datasets, bounds=bounds)
 
         return value - self.test.null_values[0]
+
+
+class _StatProfile:
+    """Fit statistic profile of a parameter, evaluated on demand and cached.
+
+    The profile is sampled where its crossings with given delta TS values are
+    searched, starting from a parabolic guess based on the parameter error.
+    The crossings are then located by interpolating all cached evaluations, so
+    that the asymmetric errors and the upper limit share most evaluations.
+
+    Parameters
+    ----------
+    datasets : `~gammapy.datasets.Datasets`
+        Datasets, with the parameters at their best fit values.
+    parameter : `~gammapy.modeling.Parameter`
+        Parameter of interest.
+    fit : `~gammapy.modeling.Fit`
+        Fit instance used to re-optimize the other free parameters.
+    reoptimize : bool
+        Re-optimize other free model parameters.
+    rtol : float, optional
+        Relative tolerance on the delta TS of a crossing. Default is 1e-3.
+    max_niter : int, optional
+        Maximum number of profile evaluations per crossing. Default is 20.
+    """
+
+    def __init__(self, datasets, parameter, fit, reoptimize, rtol=1e-3, max_niter=20):
+        self.datasets = datasets
+        self.parameter = parameter
+        self.fit = fit
+        self.reoptimize = reoptimize and len(datasets.parameters.free_parameters) > 1
+        self.rtol = rtol
+        self.max_niter = max_niter
+
+        self.value_best = parameter.value
+        self.stat_best = datasets.stat_sum()
+        self._cache = {self.value_best: 0.0}
+
+    def __call__(self, value):
+        """Evaluate the delta TS with respect to the best fit."""
+        if value in self._cache:
+            return self._cache[value]
+
+        with self.datasets.parameters.restore_status():
+            self.parameter.value = value
+
+            if self.reoptimize:
+                self.parameter.frozen = True
+                self.fit.optimize(datasets=self.datasets)
+
+            delta_ts = self.datasets.stat_sum() - self.stat_best
+
+        self._cache[value] = delta_ts
+        return delta_ts
+
+    @property
+    def _step(self):
+        error = self.parameter.error
+        if np.isfinite(error) and error > 0:
+            return error
+        return np.abs(self.value_best) if self.value_best != 0 else 1.0
+
+    def _side(self, upper):
+        """Cached evaluations on one side of the best fit, sorted by value."""
+        values = np.array(list(self._cache.keys()))
+        delta_ts = np.array(list(self._cache.values()))
+        sign = 1 if upper else -1
+        selection = sign * (values - self.value_best) >= 0
+        idx = np.argsort(values[selection])
+        return values[selection][idx], delta_ts[selection][idx]
+
+    def crossing(self, delta_ts, upper=True):
+        """Parameter value at which the profile crosses a given delta TS.
+
+        Parameters
+        ----------
+        delta_ts : float
+            Delta TS with respect to the best fit.
+        upper : bool, optional
+            Whether to search above or below the best fit value.
+            Default is True.
+
+        Returns
+        -------
+        value : float
+            Parameter value. NaN if the crossing is beyond the parameter limit.
+        """
+        sign = 1 if upper else -1
+        limit = self.parameter.max if upper else self.parameter.min
+
+        values, stats = self._side(upper)
+        # parabolic extrapolation from the cached value closest to the crossing
+        valid = stats > 0
+        if np.any(valid):
+            idx = np.argmin(np.abs(stats[valid] - delta_ts))
+            distance = np.abs(values[valid][idx] - self.value_best)
+            distance *= np.sqrt(delta_ts / stats[valid][idx])
+        else:
+            distance = np.sqrt(delta_ts) * self._step
+
+        value = self.value_best + sign * distance
+
+        for _ in range(self.max_niter):
+            at_limit = np.isfinite(limit) and sign * (value - limit) >= 0
+            if at_limit:
+                value = limit
+
+            stat = self(value)
+
+            if np.abs(stat - delta_ts) <= self.rtol * delta_ts:
+                return value
+
+            values, stats = self._side(upper)
+            above = stats > delta_ts
+
+            if not np.any(above):
+                if at_limit:
+                    return np.nan
+                # the profile is flatter than expected, extrapolate further
+                factor = np.sqrt(delta_ts / stat) if stat > 0 else 2
+                value = self.value_best + (value - self.value_best) * np.clip(
+                    1.1 * factor, 1.2, 10
+                )
+                continue
+
+            value = self._interpolate_crossing(values, stats, delta_ts, upper)
+
+        return value
+
+    @staticmethod
+    def _interpolate_crossing(values, stats, delta_ts, upper):
+        """Interpolate the cached profile to find the crossing."""
+        above = stats > delta_ts
+        # keep the points up to the first one above the crossing
+        if upper:
+            idx_max = np.argmax(above)
+            values, stats = values[: idx_max + 1], stats[: idx_max + 1]
+        else:
+            idx_min = len(above) - 1 - np.argmax(above[::-1])
+            values, stats = values[idx_min:], stats[idx_min:]
+
+        # normalize the values, the root finding uses an absolute tolerance
+        offset, scale = values[0], values[-1] - values[0]
+        values = (values - offset) / scale
+
+        interp_scale = "sqrt" if len(values) > 2 else "lin"
+        interp = interpolate_profile(values, stats, interp_scale=interp_scale)
+
+        if upper:
+            x, y = values[-2:], stats[-2:]
+        else:
+            x, y = values[:2], stats[:2]
+
+        roots, _ = find_roots(
+            lambda value: interp((value,)) - delta_ts,
+            lower_bound=x[0],
+            upper_bound=x[1],
+            nbin=1,
+        )
+        value = roots[0]
+
+        if not np.isfinite(value):
+            # linear interpolation between the bracketing points
+            value = x[0] + (delta_ts - y[0]) * (x[1] - x[0]) / (y[1] - y[0])
+
+        return offset + value * scale
@@ -3,12 +3,12 @@ import logging
 from itertools import repeat
 import numpy as np
 import astropy.units as u
+from astropy.time import Time
 import gammapy.utils.parallel as parallel
 from gammapy.data import GTI
 from gammapy.datasets import Datasets
 from gammapy.datasets.actors import DatasetsActor
 from gammapy.maps import LabelMapAxis, Map, TimeMapAxis
-from gammapy.utils.pbar import progress_bar
 from .core import FluxPoints
 from .sed import FluxPointsEstimator
 
@@ -17,6 +17,52 @@ __all__ = ["LightCurveEstimator"]
 log = logging.getLogger(__name__)
 
 
+def _get_datasets_indices_in_time_intervals(datasets, gti, atol):
+    """Get the indices of the datasets fully contained in each time interval.
+
+    This is equivalent to calling `~gammapy.datasets.Datasets.select_time` for
+    each time interval, but the time comparisons are done once for all
+    intervals and datasets.
+
+    Parameters
+    ----------
+    datasets : `~gammapy.datasets.Datasets`
+        Datasets.
+    gti : `~gammapy.data.GTI`
+        Sorted and non-overlapping time intervals.
+    atol : `~astropy.units.Quantity`
+        Tolerance value for time comparison.
+
+    Returns
+    -------
+    indices : list of list of int
+        Indices of the datasets for each time interval.
+    """
+    time_ref = gti.time_start[0]
+    atol = u.Quantity(atol).to_value("s")
+
+    time_min = (gti.time_start - time_ref).to_value("s") - atol
+    time_max = (gti.time_stop - time_ref).to_value("s") + atol
+
+    time_start = Time([dataset.gti.time_start[0] for dataset in datasets])
+    time_stop = Time([dataset.gti.time_stop[-1] for dataset in datasets])
+    time_start = (time_start - time_ref).to_value("s")
+    time_stop = (time_stop - time_ref).to_value("s")
+
+    # the intervals are sorted and do not overlap, so the intervals containing
+    # a given dataset are contiguous
+    idx_min = np.searchsorted(time_max, time_stop, side="left")
+    idx_max = np.searchsorted(time_min, time_start, side="right")
+
+    indices = [[] for _ in range(len(gti.table))]
+
+    for idx, (idx_interval_min, idx_interval_max) in enumerate(zip(idx_min, idx_max)):
+        for idx_interval in range(idx_interval_min, idx_interval_max):
+            indices[idx_interval].append(idx)
+
+    return indices
+
+
 class LightCurveEstimator(FluxPointsEstimator):
     """Estimate light curve.
 
@@ -82,6 +128,16 @@ class LightCurveEstimator(FluxPointsEstimator):
         unless the source model does not have one and only one norm parameter.
         If a dict is given the entries should be a subset of
         `~gammapy.modeling.Parameter` arguments.
+    fast_norm : bool
+        If True and ``reoptimize`` is False, the norm is estimated by rescaling
+        the predicted counts of the source, instead of a full fit. Only applies
+        to datasets using the "cash" fit statistic, see `FluxEstimator`.
+        Default is False.
+    shared_profile : bool
+        If True the asymmetric errors and upper limits are computed from a
+        single, adaptively sampled fit statistic profile of the norm, instead
+        of separate confidence interval computations, see `FluxEstimator`.
+        Default is False.
 
     Examples
     --------
@@ -126,41 +182,36 @@ class LightCurveEstimator(FluxPointsEstimator):
 
         gti = gti.union(overlap_ok=False, merge_equal=False)
 
-        rows = []
-        valid_intervals = []
-        parallel_datasets = []
-        dataset_names = datasets.names
-        for t_min, t_max in progress_bar(
-            gti.time_intervals, desc="Time intervals selection"
-        ):
-            datasets_to_fit = datasets.select_time(
-                time_min=t_min, time_max=t_max, atol=self.atol
-            )
+        indices = _get_datasets_indices_in_time_intervals(
+            datasets=datasets, gti=gti, atol=self.atol
+        )
 
-            if len(datasets_to_fit) == 0:
+        valid_intervals, valid_indices = [], []
+        for (t_min, t_max), idx in zip(gti.time_intervals, indices):
+            if len(idx) == 0:
                 log.info(
                     f"No Dataset for the time interval {t_min} to {t_max}. Skipping interval."
                 )
                 continue
 
             valid_intervals.append([t_min, t_max])
-
-            if self.n_jobs == 1:
-                fp = self.estimate_time_bin_flux(datasets_to_fit, dataset_names)
-                rows.append(fp)
-            else:
-                parallel_datasets.append(datasets_to_fit)
+            valid_indices.append(idx)
 
         if self.n_jobs > 1:
             self._update_child_jobs()
+
+        # the datasets are sent once to each worker process and the time bin
+        # tasks only carry the indices of their datasets
+        with parallel.shared_data(datasets) as shared:
             rows = parallel.run_multiprocessing(
-                self.estimate_time_bin_flux,
+                self._estimate_time_bin_flux_from_pool,
                 zip(
-                    parallel_datasets,
-                    repeat(dataset_names),
+                    repeat(shared.key),
+                    valid_indices,
+                    repeat(datasets.names),
                 ),
                 backend=self.parallel_backend,
-                pool_kwargs=dict(processes=self.n_jobs),
+                pool_kwargs=dict(processes=self.n_jobs, **shared.pool_kwargs),
                 task_name="Time intervals",
             )
 
@@ -222,5 +273,11 @@ class LightCurveEstimator(FluxPointsEstimator):
                 )
         return fp
 
+    def _estimate_time_bin_flux_from_pool(self, key, indices, dataset_names=None):
+        """Estimate flux point for the shared datasets with given indices."""
+        datasets = parallel.get_shared_data(key)
+        datasets = datasets.__class__([datasets[idx] for idx in indices])
+        return self.estimate_time_bin_flux(datasets, dataset_names)
+
     def _run_flux_points(self, datasets):
         return super().run(datasets)
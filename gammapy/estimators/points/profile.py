@@ -1,13 +1,19 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Tools to create profiles (i.e. 1D "slices" from 2D images)."""
 
-from itertools import repeat
+from copy import deepcopy
 import numpy as np
 from astropy import units as u
-from regions import CircleAnnulusSkyRegion
+from regions import CircleAnnulusSkyRegion, PixCoord, PointSkyRegion
 import gammapy.utils.parallel as parallel
-from gammapy.datasets import Datasets
-from gammapy.maps import MapAxis
+from gammapy.datasets import (
+    Datasets,
+    MapDataset,
+    MapDatasetOnOff,
+    SpectrumDataset,
+    SpectrumDatasetOnOff,
+)
+from gammapy.maps import MapAxis, RegionGeom, RegionNDMap, WcsGeom
 from gammapy.modeling.models import PowerLawSpectralModel, SkyModel
 from .core import FluxPoints
 from .sed import FluxPointsEstimator
@@ -136,6 +142,9 @@ class FluxProfileEstimator(FluxPointsEstimator):
     def run(self, datasets):
         """Run flux profile estimation.
 
+        The datasets are reduced in all regions at once, and the flux points
+        of each region are then estimated in parallel.
+
         Parameters
         ----------
         datasets : list of `~gammapy.datasets.MapDataset`
@@ -148,9 +157,18 @@ class FluxProfileEstimator(FluxPointsEstimator):
         """
         datasets = Datasets(datasets=datasets)
 
+        datasets_regions = [Datasets() for _ in self.regions]
+
+        for dataset in datasets:
+            spectrum_datasets = self._to_spectrum_datasets(dataset)
+            for datasets_region, spectrum_dataset in zip(
+                datasets_regions, spectrum_datasets
+            ):
+                datasets_region.append(spectrum_dataset)
+
         maps = parallel.run_multiprocessing(
             self._run_region,
-            zip(repeat(datasets), self.regions),
+            zip(datasets_regions),
             backend=self.parallel_backend,
             pool_kwargs=dict(processes=self.n_jobs),
             task_name="Flux profile estimation",
@@ -161,21 +179,135 @@ class FluxProfileEstimator(FluxPointsEstimator):
             axis=self.projected_distance_axis,
         )
 
-    def _run_region(self, datasets, region):
-        # TODO: test if it would be more efficient
-        # to not compute datasets_to_fit in parallel
-        # to avoid copying the full datasets
-        datasets_to_fit = datasets.to_spectrum_datasets(region=region)
-        for dataset_spec, dataset_map in zip(datasets_to_fit, datasets):
-            dataset_spec.background.data = (
-                dataset_map.npred()
-                .to_region_nd_map(region, func=np.sum, weights=dataset_map.mask_safe)
-                .data
-            )
-        datasets_to_fit.models = SkyModel(self.spectral_model, name="test-source")
-        estimator = self.copy()
+    def _run_region(self, datasets):
+        datasets.models = SkyModel(self.spectral_model, name="test-source")
+        # the regions are not needed to estimate the flux points, share them
+        estimator = deepcopy(self, memo={id(self.regions): self.regions})
         estimator.n_jobs = self._n_child_jobs
-        return estimator._run_flux_points(datasets_to_fit)
+        return estimator._run_flux_points(datasets)
+
+    def _to_spectrum_datasets(self, dataset):
+        """Reduce a map dataset to one spectrum dataset per region.
+
+        The predicted counts of the dataset are used as background.
+        """
+        if not self._is_label_reduction_supported(dataset):
+            return [
+                self._to_spectrum_dataset(dataset, region) for region in self.regions
+            ]
+
+        geom = dataset.counts.geom
+        labels = _get_region_labels(geom, self.regions)
+        region_geoms = [
+            RegionGeom.from_regions(regions=region, wcs=geom.wcs)
+            for region in self.regions
+        ]
+
+        def to_region_nd_maps(m, func, weights=None):
+            if m.geom.to_image() == geom.to_image():
+                m_labels = labels
+            else:
+                m_labels = _get_region_labels(m.geom, self.regions)
+
+            data = _reduce_in_regions(m, m_labels, len(self.regions), func, weights)
+            return [
+                RegionNDMap(
+                    geom=region_geom.to_cube(m.geom.axes),
+                    data=data[idx],
+                    unit=m.unit,
+                    meta=m.meta.copy(),
+                )
+                for idx, region_geom in enumerate(region_geoms)
+            ]
+
+        mask_safe = dataset.mask_safe
+        maps = {}
+
+        if mask_safe is not None:
+            maps["mask_safe"] = to_region_nd_maps(mask_safe, func=np.any)
+
+        if dataset.mask_fit is not None:
+            maps["mask_fit"] = to_region_nd_maps(dataset.mask_fit, func=np.any)
+
+        maps["counts"] = to_region_nd_maps(dataset.counts, np.sum, weights=mask_safe)
+
+        if dataset.exposure is not None:
+            maps["exposure"] = to_region_nd_maps(dataset.exposure, func=np.mean)
+
+        if dataset.stat_type == "cash":
+            maps["background"] = to_region_nd_maps(
+                dataset.npred(), func=np.sum, weights=mask_safe
+            )
+        else:
+            maps["counts_off"] = to_region_nd_maps(
+                dataset.counts_off, np.sum, weights=mask_safe
+            )
+            maps["acceptance"] = to_region_nd_maps(
+                dataset.acceptance, np.mean, weights=mask_safe
+            )
+            maps["norm"] = to_region_nd_maps(
+                dataset.background, np.sum, weights=mask_safe
+            )
+
+        spectrum_datasets = []
+
+        for idx, region in enumerate(self.regions):
+            kwargs = {key: value[idx] for key, value in maps.items()}
+            kwargs.update(
+                name=dataset.name, gti=dataset.gti, meta_table=dataset.meta_table
+            )
+
+            if dataset.edisp is not None:
+                kwargs["edisp"] = dataset.edisp.to_region_nd_map(region.center)
+
+            if dataset.stat_type == "cash":
+                spectrum_datasets.append(SpectrumDataset(**kwargs))
+                continue
+
+            kwargs_off = {
+                key: kwargs.pop(key) for key in ["counts_off", "acceptance", "norm"]
+            }
+            acceptance_off = (
+                kwargs_off["acceptance"] * kwargs_off["counts_off"] / kwargs_off["norm"]
+            )
+            np.nan_to_num(acceptance_off.data, copy=False)
+
+            spectrum_dataset = SpectrumDatasetOnOff.from_spectrum_dataset(
+                dataset=SpectrumDataset(**kwargs),
+                counts_off=kwargs_off["counts_off"],
+                acceptance=kwargs_off["acceptance"],
+                acceptance_off=acceptance_off,
+                name=dataset.name,
+            )
+            spectrum_datasets.append(spectrum_dataset)
+
+        return spectrum_datasets
+
+    def _is_label_reduction_supported(self, dataset):
+        """Whether a dataset can be reduced in all regions at once."""
+        if type(dataset) not in [MapDataset, MapDatasetOnOff]:
+            return False
+
+        if isinstance(dataset, MapDatasetOnOff) and (
+            dataset.counts_off is None or dataset.acceptance is None
+        ):
+            return False
+
+        if not isinstance(dataset.counts.geom, WcsGeom):
+            return False
+
+        return not any(isinstance(region, PointSkyRegion) for region in self.regions)
+
+    def _to_spectrum_dataset(self, dataset, region):
+        spectrum_dataset = dataset.to_spectrum_dataset(
+            on_region=region, name=dataset.name
+        )
+        spectrum_dataset.background.data = (
+            dataset.npred()
+            .to_region_nd_map(region, func=np.sum, weights=dataset.mask_safe)
+            .data
+        )
+        return spectrum_dataset
 
     def _run_flux_points(self, datasets):
         return super().run(datasets)
@@ -187,3 +319,86 @@ class FluxProfileEstimator(FluxPointsEstimator):
         pars = {key.strip("_"): value for key, value in pars.items()}
         pars.pop("regions")
         return pars
+
+
+def _get_region_labels(geom, regions):
+    """Rasterize regions into the contained pixels of a WCS geometry.
+
+    Parameters
+    ----------
+    geom : `~gammapy.maps.WcsGeom`
+        Map geometry.
+    regions : list of `~regions.SkyRegion`
+        Regions.
+
+    Returns
+    -------
+    idx, labels : tuple of `~numpy.ndarray`
+        Flat spatial index of each contained pixel and index of the region it
+        belongs to. A pixel contained in several regions appears once per region.
+    """
+    ny, nx = geom.data_shape[-2:]
+    idx, labels = [], []
+
+    for label, region in enumerate(regions):
+        region_pix = region.to_pixel(geom.wcs)
+        bbox = region_pix.bounding_box
+
+        x, y = np.meshgrid(
+            np.arange(max(bbox.ixmin, 0), min(bbox.ixmax, nx)),
+            np.arange(max(bbox.iymin, 0), min(bbox.iymax, ny)),
+        )
+        contained = region_pix.contains(PixCoord(x, y))
+
+        idx.append(y[contained] * nx + x[contained])
+        labels.append(np.full(contained.sum(), label))
+
+    return np.concatenate(idx), np.concatenate(labels)
+
+
+def _reduce_in_regions(m, labels, n_regions, func=np.sum, weights=None):
+    """Reduce the spatial dimensions of a map in each region using `~numpy.bincount`.
+
+    Parameters
+    ----------
+    m : `~gammapy.maps.WcsNDMap`
+        Map to reduce.
+    labels : tuple of `~numpy.ndarray`
+        Contained pixels and regions, see `_get_region_labels`.
+    n_regions : int
+        Number of regions.
+    func : {`~numpy.sum`, `~numpy.mean`, `~numpy.any`}, optional
+        Reduction. Default is `~numpy.sum`.
+    weights : `~gammapy.maps.WcsNDMap`, optional
+        Weights applied to the map before the reduction. Default is None.
+
+    Returns
+    -------
+    data : `~numpy.ndarray`
+        Reduced data, with the region index as first dimension and two
+        trailing spatial dimensions of size one.
+    """
+    idx, label = labels
+    data = m.data if weights is None else m.data * weights.data
+
+    shape = data.shape[:-2]
+    values = data.reshape((-1, data.shape[-2] * data.shape[-1]))[:, idx]
+
+    offset = np.arange(values.shape[0])[:, np.newaxis] * n_regions
+    result = np.bincount(
+        (offset + label).ravel(),
+        weights=values.ravel(),
+        minlength=values.shape[0] * n_regions,
+    ).reshape(shape + (n_regions,))
+
+    dtype = m.data.dtype
+
+    if func is np.mean:
+        result /= np.bincount(label, minlength=n_regions)
+        if not np.issubdtype(dtype, np.floating):
+            dtype = np.float64
+    elif func is np.any:
+        result = result > 0
+
+    result = np.moveaxis(result, -1, 0).astype(dtype, copy=False)
+    return result[..., np.newaxis, np.newaxis]
@@ -82,6 +82,16 @@ class FluxPointsEstimator(FluxEstimator, parallel.ParallelMixin):
         unless the source model does not have one and only one norm parameter.
         If a dict is given the entries should be a subset of
         `~gammapy.modeling.Parameter` arguments.
+    fast_norm : bool
+        If True and ``reoptimize`` is False, the norm is estimated by rescaling
+        the predicted counts of the source, instead of a full fit. Only applies
+        to datasets using the "cash" fit statistic, see `FluxEstimator`.
+        Default is False.
+    shared_profile : bool
+        If True the asymmetric errors and upper limits are computed from a
+        single, adaptively sampled fit statistic profile of the norm, instead
+        of separate confidence interval computations, see `FluxEstimator`.
+        Default is False.
     """
 
     tag = "FluxPointsEstimator"
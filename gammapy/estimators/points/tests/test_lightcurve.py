@@ -7,14 +7,18 @@ from astropy.table import Column, Table
 from astropy.time import Time
 from astropy.timeseries import BinnedTimeSeries, BoxLeastSquares
 from gammapy.data import GTI
-from gammapy.datasets import Datasets, FluxPointsDataset
+from gammapy.datasets import Datasets, FluxPointsDataset, SpectrumDataset
 from gammapy.datasets.actors import DatasetsActor
 from gammapy.estimators import FluxPoints, LightCurveEstimator
+from gammapy.estimators.points.lightcurve import (
+    _get_datasets_indices_in_time_intervals,
+)
 from gammapy.estimators.points.lightcurve import parallel as parallel
 from gammapy.estimators.points.tests.test_sed import (
     simulate_map_dataset,
     simulate_spectrum_dataset,
 )
+from gammapy.maps import MapAxis, RegionGeom
 from gammapy.modeling import Fit
 from gammapy.modeling.models import FoVBackgroundModel, PowerLawSpectralModel, SkyModel
 from gammapy.utils.testing import (
@@ -175,6 +179,35 @@ def get_spectrum_datasets():
     return [dataset_1, dataset_2]
 
 
+def test_get_datasets_indices_in_time_intervals():
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=1)
+    geom = RegionGeom.create("icrs;circle(0, 0, 0.1)", axes=[energy_axis])
+    time_ref = Time("2010-01-01T00:00:00").tt
+
+    datasets = Datasets()
+    for idx, (start, stop) in enumerate([(0, 1), (1, 2), (0.5, 1.5), (3, 4), (1, 2)]):
+        dataset = SpectrumDataset.create(geom, name=f"dataset-{idx}")
+        dataset.gti = GTI.create(start * u.h, stop * u.h, time_ref)
+        datasets.append(dataset)
+
+    time_intervals = [
+        time_ref + [0, 1] * u.h,
+        time_ref + [1, 2] * u.h,
+        time_ref + [2, 3] * u.h,
+        time_ref + [3, 5] * u.h,
+    ]
+    gti = GTI.from_time_intervals(time_intervals)
+
+    indices = _get_datasets_indices_in_time_intervals(
+        datasets=datasets, gti=gti, atol=1e-6 * u.s
+    )
+    assert indices == [[0], [1, 4], [], [3]]
+
+    for (time_min, time_max), idx in zip(gti.time_intervals, indices):
+        selected = datasets.select_time(time_min=time_min, time_max=time_max)
+        assert selected.names == [datasets[_].name for _ in idx]
+
+
 @requires_data()
 def test_group_datasets_in_time_interval():
     # Doing a LC on one hour bin
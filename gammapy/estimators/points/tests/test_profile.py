@@ -188,6 +188,34 @@ def test_serialisation(tmpdir):
     assert np.all(result.is_ul == profile.is_ul)
 
 
+@pytest.mark.parametrize("on_off", [True, False])
+def test_profile_label_reduction(on_off, monkeypatch):
+    dataset = get_simple_dataset_on_off()
+    dataset.mask_safe.data[:, :, :10] = False
+    dataset.counts.data[:, 20:] += 3
+
+    if not on_off:
+        dataset = dataset.to_map_dataset(name="test-map")
+
+    boxes = make_boxes(dataset.counts.geom.wcs)
+    prof_maker = FluxProfileEstimator(
+        regions=boxes, energy_edges=[0.1, 1, 10] * u.TeV, selection_optional=[]
+    )
+    assert prof_maker._is_label_reduction_supported(dataset)
+
+    result = prof_maker.run(dataset)
+
+    monkeypatch.setattr(
+        FluxProfileEstimator, "_is_label_reduction_supported", lambda *args: False
+    )
+    expected = prof_maker.run(dataset)
+
+    assert_allclose(result.counts.data, expected.counts.data)
+    assert_allclose(result.npred_excess.data, expected.npred_excess.data, rtol=1e-5)
+    assert_allclose(result.norm.data, expected.norm.data, rtol=1e-5)
+    assert_allclose(result.ts.data, expected.ts.data, rtol=1e-5)
+
+
 def test_regions_init():
     with pytest.raises(ValueError):
         FluxProfileEstimator(regions=[])
@@ -618,6 +618,32 @@ def test_flux_points_estimator_small_edges():
     assert np.isnan(fp.npred.data[1, 0, 0])
 
 
+def test_flux_points_estimator_fast_norm():
+    model = SkyModel(spectral_model=PowerLawSpectralModel(), name="source")
+    dataset = simulate_spectrum_dataset(model).to_spectrum_dataset(name="test")
+    dataset.models = model
+
+    fpe = FluxPointsEstimator(
+        energy_edges=[0.1, 1, 10, 100] * u.TeV,
+        source="source",
+        selection_optional=["errn-errp", "ul", "scan"],
+    )
+    table = fpe.run([dataset]).to_table(sed_type="likelihood")
+
+    fpe.fast_norm = True
+    table_fast = fpe.run([dataset]).to_table(sed_type="likelihood")
+
+    for name in ["norm", "norm_err", "norm_errn", "norm_errp", "norm_ul"]:
+        assert_allclose(table_fast[name], table[name], rtol=1e-3)
+
+    for name in ["ts", "stat", "stat_null", "stat_scan", "npred", "npred_excess"]:
+        assert_allclose(table_fast[name], table[name], rtol=1e-4)
+
+    assert_allclose(table_fast["norm"], [1.081611, 0.912658, 0.925485], rtol=1e-5)
+    assert_allclose(table_fast["counts"], table["counts"])
+    assert table_fast["success"].all()
+
+
 def test_flux_points_recompute_ul(fpe_pwl):
     datasets, fpe = fpe_pwl
     fpe.selection_optional = ["all"]
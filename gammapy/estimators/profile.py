@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Tools to create profiles (i.e. 1D "slices" from 2D images)."""
+
 import numpy as np
 import scipy.ndimage
 from astropy import units as u
@@ -88,39 +89,46 @@ class ImageProfileEstimator(Estimator):
 
         return x_edges
 
-    def _estimate_profile(self, image, image_err, mask):
+    def _estimate_profile(self, image, image_err, mask, x_edges):
         p = self.parameters
-        labels = self._label_image(image, mask)
+        labels = self._label_image(image, mask, x_edges=x_edges).data.ravel()
 
         profile_err = None
 
-        index = np.arange(1, len(self._get_x_edges(image)))
+        nbin = len(x_edges) - 1
+
+        def label_sum(data):
+            # labels 0 and nbin + 1 collect the pixels outside of the edges
+            total = np.bincount(labels, weights=data.ravel(), minlength=nbin + 2)
+            return total[1 : nbin + 1]
 
         if p["method"] == "sum":
-            profile = scipy.ndimage.sum(image.data, labels.data, index)
+            profile = label_sum(image.data)
 
             if image.unit.is_equivalent("counts"):
                 profile_err = np.sqrt(profile)
             elif image_err:
                 # gaussian error propagation
-                err_sum = scipy.ndimage.sum(image_err.data**2, labels.data, index)
+                err_sum = label_sum(image_err.data**2)
                 profile_err = np.sqrt(err_sum)
 
         elif p["method"] == "mean":
             # gaussian error propagation
-            profile = scipy.ndimage.mean(image.data, labels.data, index)
+            profile = label_sum(image.data) / label_sum(np.ones(image.data.shape))
             if image_err:
-                N = scipy.ndimage.sum(~np.isnan(image_err.data), labels.data, index)
-                err_sum = scipy.ndimage.sum(image_err.data**2, labels.data, index)
+                N = label_sum(~np.isnan(image_err.data))
+                err_sum = label_sum(image_err.data**2)
                 profile_err = np.sqrt(err_sum) / N
 
         return profile, profile_err
 
-    def _label_image(self, image, mask=None):
+    def _label_image(self, image, mask=None, x_edges=None):
         p = self.parameters
 
         coordinates = image.geom.get_coord().skycoord
-        x_edges = self._get_x_edges(image)
+
+        if x_edges is None:
+            x_edges = self._get_x_edges(image)
 
         if p["axis"] == "lon":
             lon = coordinates.data.lon.wrap_at("180d")
@@ -162,10 +170,12 @@ class ImageProfileEstimator(Estimator):
         if image.unit.is_equivalent("count"):
             image_err = image.copy(data=np.sqrt(image.data))
 
-        profile, profile_err = self._estimate_profile(image, image_err, mask)
+        x_edges = self._get_x_edges(image)
+        profile, profile_err = self._estimate_profile(
+            image, image_err, mask, x_edges=x_edges
+        )
 
         result = Table()
-        x_edges = self._get_x_edges(image)
         result["x_min"] = x_edges[:-1]
         result["x_max"] = x_edges[1:]
         result["x_ref"] = (x_edges[:-1] + x_edges[1:]) / 2
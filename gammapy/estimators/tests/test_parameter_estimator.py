@@ -2,8 +2,9 @@
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
-from gammapy.datasets import Datasets, SpectrumDatasetOnOff
+from gammapy.datasets import Datasets, SpectrumDataset, SpectrumDatasetOnOff
 from gammapy.estimators.parameter import ParameterEstimator
+from gammapy.maps import MapAxis, RegionGeom
 from gammapy.modeling.models import PowerLawSpectralModel, SkyModel
 from gammapy.utils.testing import requires_data
 
@@ -29,6 +30,53 @@ def crab_datasets_fermi():
     return Datasets.read(filename=filename, filename_models=filename_models)
 
 
+def make_simulated_datasets():
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "100 TeV", nbin=10)
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.5 TeV", "200 TeV", nbin=20, name="energy_true"
+    )
+    geom = RegionGeom.create("icrs;circle(0, 0, 0.1)", axes=[energy_axis])
+
+    dataset = SpectrumDataset.create(geom, energy_axis_true=energy_axis_true)
+    dataset.exposure.data += 1e9
+    dataset.background.data += 1
+    dataset.mask_safe.data[...] = True
+
+    spectral_model = PowerLawSpectralModel(amplitude="3e-11 cm-2s-1TeV-1", index=2.7)
+    dataset.models = SkyModel(spectral_model=spectral_model, name="source")
+    dataset.fake(random_state=0)
+    return Datasets([dataset])
+
+
+@pytest.mark.parametrize("reoptimize", [True, False])
+def test_parameter_estimator_shared_profile(reoptimize):
+    selection_optional = ["errn-errp", "ul", "sensitivity"]
+    estimator = ParameterEstimator(
+        selection_optional=selection_optional, reoptimize=reoptimize
+    )
+    expected = estimator.run(make_simulated_datasets(), parameter="amplitude")
+
+    estimator = ParameterEstimator(
+        selection_optional=selection_optional,
+        reoptimize=reoptimize,
+        shared_profile=True,
+    )
+    result = estimator.run(make_simulated_datasets(), parameter="amplitude")
+
+    assert estimator._profile is None
+    assert_allclose(result["amplitude"], expected["amplitude"])
+
+    for name in ["errp", "errn", "ul"]:
+        key = f"amplitude_{name}"
+        assert_allclose(result[key], expected[key], rtol=5e-3)
+
+    # the default sensitivity root finding uses the absolute tolerance of
+    # brentq, which is coarse for amplitudes
+    assert_allclose(
+        result["amplitude_sensitivity"], expected["amplitude_sensitivity"], rtol=6e-2
+    )
+
+
 @requires_data()
 def test_parameter_estimator_1d(crab_datasets_1d, pwl_model):
     datasets = crab_datasets_1d
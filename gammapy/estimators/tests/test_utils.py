@@ -2,6 +2,7 @@
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
+from scipy.signal import convolve
 import astropy.units as u
 from astropy.coordinates import SkyCoord
 from astropy.table import Column, Table
@@ -9,6 +10,7 @@ from astropy.time import Time
 from gammapy.datasets import MapDataset
 from gammapy.estimators import ExcessMapEstimator, FluxPoints
 from gammapy.estimators.utils import (
+    _convolve_fft,
     compute_lightcurve_doublingtime,
     compute_lightcurve_fpp,
     compute_lightcurve_fvar,
@@ -289,3 +291,17 @@ def test_get_rebinned_axis():
 
     with pytest.raises(ValueError):
         get_rebinned_axis(lc_1d, method="error", value=2, axis_name="time")
+
+
+def test_convolve_fft():
+    rng = np.random.default_rng(0)
+    data = rng.random((2, 20, 25))
+    kernels = [rng.random((2, 5, 7)), rng.random((4, 4)), rng.random((2, 9, 3))]
+
+    convolved = _convolve_fft(data, kernels)
+
+    for kernel, result in zip(kernels, convolved):
+        kernel = np.broadcast_to(kernel, (2,) + kernel.shape[-2:])
+        for idx in range(2):
+            expected = convolve(data[idx], kernel[idx], mode="same")
+            assert_allclose(result[idx], expected, atol=1e-12)
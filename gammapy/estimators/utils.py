@@ -1,17 +1,22 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import json
 import numpy as np
+import scipy.fft
 import scipy.ndimage
 from scipy import special
 from scipy.interpolate import InterpolatedUnivariateSpline
 from astropy import units as u
 from astropy.coordinates import SkyCoord
+from astropy.io import fits
 from astropy.table import Table
+from gammapy.data import GTI
 from gammapy.datasets import SpectrumDataset, SpectrumDatasetOnOff
 from gammapy.datasets.map import MapEvaluator
-from gammapy.maps import Map, MapAxis, TimeMapAxis, WcsNDMap
+from gammapy.maps import Map, MapAxis, Maps, TimeMapAxis, WcsNDMap
 from gammapy.modeling import Parameter
 from gammapy.modeling.models import (
     ConstantFluxSpatialModel,
+    Models,
     PowerLawSpectralModel,
     SkyModel,
 )
@@ -22,9 +27,12 @@ from gammapy.stats import (
     discrete_correlation,
 )
 from gammapy.stats.utils import ts_to_sigma
+from gammapy.utils.scripts import make_path
+from gammapy.utils.types import JsonQuantityDecoder, JsonQuantityEncoder
 from .map.core import FluxMaps
 
 __all__ = [
+    "FluxMapsCombiner",
     "combine_flux_maps",
     "combine_significance_maps",
     "estimate_exposure_reco_energy",
@@ -306,6 +314,96 @@ def estimate_exposure_reco_energy(dataset, spectral_model=None, normalize=True):
     return reco_exposure
 
 
+class _FFTConvolution:
+    """Convolution of arrays of a given shape with several kernels.
+
+    The transform of each kernel is computed only once and shared by all
+    convolved arrays and image planes, and the transform of each image plane
+    is shared by all kernels. The planes are processed one after the other,
+    which is faster than a single multi-dimensional transform of the full
+    array and keeps the memory bounded. The result for each kernel is
+    equivalent to `~scipy.signal.convolve` with ``mode="same"``.
+
+    Parameters
+    ----------
+    kernels : list of `~numpy.ndarray`
+        Kernel arrays. Leading non-spatial axes must broadcast against the data.
+    data_shape : tuple of int
+        Shape of the convolved arrays, the last two axes are the image axes.
+    """
+
+    def __init__(self, kernels, data_shape):
+        self.data_shape = tuple(data_shape)
+        self.image_shape = self.data_shape[-2:]
+
+        shape_kernel = np.max([kernel.shape[-2:] for kernel in kernels], axis=0)
+        self.shape = [
+            scipy.fft.next_fast_len(int(n))
+            for n in np.array(self.image_shape) + shape_kernel - 1
+        ]
+
+        self.kernels_ft, self.offsets = [], []
+
+        for kernel in kernels:
+            kernel_ft = scipy.fft.rfft2(kernel, self.shape)
+            self.kernels_ft.append(
+                np.broadcast_to(kernel_ft, self.data_shape[:-2] + kernel_ft.shape[-2:])
+            )
+            self.offsets.append((np.array(kernel.shape[-2:]) - 1) // 2)
+
+    def __call__(self, data, dtype=float):
+        """Convolve an array with all kernels.
+
+        Parameters
+        ----------
+        data : `~numpy.ndarray`
+            Data array of shape ``data_shape``. Image planes are transformed
+            in double precision.
+        dtype : data-type, optional
+            Data type of the convolved arrays. Default is float.
+
+        Returns
+        -------
+        convolved : list of `~numpy.ndarray`
+            Convolved arrays with the shape of the data, one per kernel.
+        """
+        ny, nx = self.image_shape
+        convolved = [np.empty(data.shape, dtype=dtype) for _ in self.kernels_ft]
+
+        for idx in np.ndindex(data.shape[:-2]):
+            data_ft = scipy.fft.rfft2(np.asarray(data[idx], dtype=float), self.shape)
+
+            for kernel_ft, (y, x), result in zip(
+                self.kernels_ft, self.offsets, convolved
+            ):
+                image = scipy.fft.irfft2(data_ft * kernel_ft[idx], self.shape)
+                result[idx] = image[y : y + ny, x : x + nx]
+
+        return convolved
+
+
+def _convolve_fft(data, kernels, dtype=float):
+    """Convolve the image planes of an array with several kernels.
+
+    See `_FFTConvolution`.
+
+    Parameters
+    ----------
+    data : `~numpy.ndarray`
+        Data array, the last two axes are the image axes.
+    kernels : list of `~numpy.ndarray`
+        Kernel arrays. Leading non-spatial axes must broadcast against the data.
+    dtype : data-type, optional
+        Data type of the convolved arrays. Default is float.
+
+    Returns
+    -------
+    convolved : list of `~numpy.ndarray`
+        Convolved arrays with the shape of the data, one per kernel.
+    """
+    return _FFTConvolution(kernels, data.shape)(data, dtype=dtype)
+
+
 def _satisfies_conditions(info_dict, conditions):
     satisfies = True
     for key in conditions.keys():
@@ -813,13 +911,21 @@ def combine_significance_maps(maps):
 
     """
 
-    geom = maps[0].ts.geom.to_image()
-    ts_sum = Map.from_geom(geom)
-    ts_sum_sign = Map.from_geom(geom)
-    npred_excess_sum = Map.from_geom(geom)
-    df = Map.from_geom(geom)
+    results = _combine_significance_maps(maps)
+    results["estimator_results"] = maps
+    return results
+
+
+def _combine_significance_maps(maps):
+    """Sum TS, degrees of freedom and excess of an iterable of maps in one pass."""
+    for k, result in enumerate(maps):
+        if k == 0:
+            geom = result.ts.geom.to_image()
+            ts_sum = Map.from_geom(geom)
+            ts_sum_sign = Map.from_geom(geom)
+            npred_excess_sum = Map.from_geom(geom)
+            df = Map.from_geom(geom)
 
-    for result in maps:
         df += np.sum(result["ts"].data > 0, axis=0)  # one dof (norm) per valid bin
         ts_sum += result["ts"].reduce_over_axes()
         ts_sum_sign += (
@@ -834,11 +940,10 @@ def combine_significance_maps(maps):
         df=df,
         ts=ts_sum,
         npred_excess=npred_excess_sum,
-        estimator_results=maps,
     )
 
 
-def get_combined_significance_maps(estimator, datasets):
+def get_combined_significance_maps(estimator, datasets, keep_estimator_results=True):
     """Compute excess and significance for a set of datasets.
 
     The significance computation assumes that the model contains
@@ -857,6 +962,11 @@ def get_combined_significance_maps(estimator, datasets):
         Excess Map Estimator or TS Map Estimator
     dataset : `~gammapy.datasets.Datasets`
         Datasets containing only `~gammapy.datasets.MapDataset`.
+    keep_estimator_results : bool, optional
+        Keep the maps computed for each dataset. If False, the maps of each
+        dataset are summed as soon as they are computed and then discarded,
+        so that the memory needed does not grow with the number of datasets.
+        Default is True.
 
     Returns
     -------
@@ -867,6 +977,7 @@ def get_combined_significance_maps(estimator, datasets):
                 * "df" : degree of freedom map (one norm per valid bin).
                 * "npred_excess" : summed excess map.
                 * "estimator_results" : dictionary containing the flux maps computed for each dataset.
+                  Only included if ``keep_estimator_results`` is True.
 
     See also
     --------
@@ -882,9 +993,19 @@ def get_combined_significance_maps(estimator, datasets):
         )
 
     results = []
-    for dataset in datasets:
-        results.append(estimator.run(dataset))
-    return combine_significance_maps(results)
+
+    def run_estimator():
+        for dataset in datasets:
+            result = estimator.run(dataset)
+            if keep_estimator_results:
+                results.append(result)
+            yield result
+
+    output = _combine_significance_maps(run_estimator())
+
+    if keep_estimator_results:
+        output["estimator_results"] = results
+    return output
 
 
 def combine_flux_maps(
@@ -898,7 +1019,8 @@ def combine_flux_maps(
     Parameters
     ----------
     maps : list of `~gammapy.estimators.FluxMaps`
-        List of maps with the same geometry.
+        List of maps with the same geometry. Any iterable is accepted, the maps
+        are combined one at a time.
     method : str
         * gaussian_errors :
             Under the gaussian error approximation the likelihood is given by the gaussian distibution.
@@ -933,92 +1055,17 @@ def combine_flux_maps(
     See also
     --------
     get_combined_flux_maps : same method but using directly the flux maps from estimators
+    FluxMapsCombiner : incremental combination, with checkpointing to disk
 
     """
-    gtis = [map_.gti for map_ in maps if map_.gti is not None]
-    if np.any(gtis):
-        gti = gtis[0].copy()
-        for k in range(1, len(gtis)):
-            gti.stack(gtis[k])
-    else:
-        gti = None
-    # TODO : change this once we have stackable metadata objets
-    metas = [map_.meta for map_ in maps if map_.meta is not None]
-    meta = {}
-    if np.any(metas):
-        for data in metas:
-            meta.update(data)
-    if reference_model is None:
-        reference_model = maps[0].reference_model
-
-    if method == "gaussian_errors":
-        means = [map_.dnde.copy() for map_ in maps]
-        sigmas = [map_.dnde_err.copy() for map_ in maps]
-        # compensate for the ts deviation from gaussian approximation expectation in each map
-        ts_diff = np.nansum(
-            [
-                map_.ts.data - (map_.dnde.data / map_.dnde_err.data) ** 2
-                for map_ in maps
-            ],
-            axis=0,
-        )
-
-        mean = means[0]
-        sigma = sigmas[0]
-
-        for k in range(1, len(means)):
-            mean_k = means[k].quantity.to_value(mean.unit)
-            sigma_k = sigmas[k].quantity.to_value(sigma.unit)
-
-            mask_valid = np.isfinite(mean) & np.isfinite(sigma) & (sigma.data != 0)
-            mask_valid_k = np.isfinite(mean_k) & np.isfinite(sigma_k) & (sigma_k != 0)
-            mask = mask_valid & mask_valid_k
-            mask_k = ~mask_valid & mask_valid_k
-
-            mean.data[mask] = (
-                (mean.data * sigma_k**2 + mean_k * sigma.data**2)
-                / (sigma.data**2 + sigma_k**2)
-            )[mask]
-            sigma.data[mask] = (
-                sigma.data * sigma_k / np.sqrt(sigma.data**2 + sigma_k**2)
-            )[mask]
-
-            mean.data[mask_k] = mean_k[mask_k]
-            sigma.data[mask_k] = sigma_k[mask_k]
-
-        ts = mean * mean / sigma / sigma + ts_diff
-        ts.data[~np.isfinite(ts.data)] = np.nan
-
-        kwargs = dict(
-            sed_type="dnde", reference_model=reference_model, meta=meta, gti=gti
-        )
-        return FluxMaps.from_maps(dict(dnde=mean, dnde_err=sigma, ts=ts), **kwargs)
-
-    elif method in ["distrib", "profile"]:
-        if dnde_scan_axis is None:
-            dnde_scan_axis = _default_scan_map(maps[0]).geom.axes["dnde"]
-        for k, map_ in enumerate(maps):
-            if method == "profile":
-                map_stat_scan = interpolate_profile_map(map_, dnde_scan_axis)
-            else:
-                map_stat_scan = approximate_profile_map(map_, dnde_scan_axis)
-            map_stat_scan.data[np.isnan(map_stat_scan.data)] = 0.0
-            if k == 0:
-                stat_scan = map_stat_scan
-            else:
-                stat_scan.data += map_stat_scan.data
+    combiner = FluxMapsCombiner(
+        method=method, reference_model=reference_model, dnde_scan_axis=dnde_scan_axis
+    )
 
-        return get_flux_map_from_profile(
-            {"stat_scan": stat_scan},
-            reference_model=reference_model,
-            meta=meta,
-            gti=gti,
-        )
+    for map_ in maps:
+        combiner.add(map_)
 
-    else:
-        raise ValueError(
-            f'Invalid method provided : {method}. Available methods are : "gaussian_errors", "distrib", "profile"'
-        )
+    return combiner.finalize()
 
 
 def get_combined_flux_maps(
@@ -1027,6 +1074,7 @@ def get_combined_flux_maps(
     method="gaussian_errors",
     reference_model=None,
     dnde_scan_axis=None,
+    keep_estimator_results=True,
 ):
     """Create a `~gammapy.estimators.FluxMaps` by combining a list of flux maps with the same geometry.
 
@@ -1062,6 +1110,11 @@ def get_combined_flux_maps(
         Map axis providing the dnde values used to compute the profile.
         If None, it will be derived from the first FluxMaps in the list. Default is None.
         Used only if `method` is "distrib" or "profile".
+    keep_estimator_results : bool, optional
+        Keep the flux maps computed for each dataset. If False, the flux maps of
+        each dataset are combined as soon as they are computed and then discarded,
+        so that the memory needed does not grow with the number of datasets.
+        Default is True.
 
     Returns
     -------
@@ -1070,6 +1123,7 @@ def get_combined_flux_maps(
 
                 * "flux_maps" : `gammapy.estimators.FluxMaps`
                 * "estimator_results" : dictionary containing the flux maps computed for each dataset.
+                  Only included if ``keep_estimator_results`` is True.
 
     See also
     --------
@@ -1084,21 +1138,287 @@ def get_combined_flux_maps(
             f"`estimator` type should be ExcessMapEstimator or TSMapEstimator), got {type(estimator)} instead."
         )
 
+    combiner = FluxMapsCombiner(
+        method=method, reference_model=reference_model, dnde_scan_axis=dnde_scan_axis
+    )
+
     results = []
     for dataset in datasets:
-        results.append(estimator.run(dataset))
+        result = estimator.run(dataset)
+        combiner.add(result)
+        if keep_estimator_results:
+            results.append(result)
 
     output = dict()
-    output["flux_maps"] = combine_flux_maps(
-        results,
-        method=method,
-        reference_model=reference_model,
-        dnde_scan_axis=dnde_scan_axis,
-    )
-    output["estimator_results"] = results
+    output["flux_maps"] = combiner.finalize()
+
+    if keep_estimator_results:
+        output["estimator_results"] = results
     return output
 
 
+class FluxMapsCombiner:
+    """Combine flux maps with the same geometry one at a time.
+
+    This assumes the flux maps are independent measurements of the same true
+    value, see `combine_flux_maps`. Each added flux map is folded into a
+    running state, so that the memory needed does not grow with the number of
+    flux maps:
+
+        * "gaussian_errors" : the weighted mean and error of dnde, and the
+          summed deviation of ts from the gaussian approximation.
+        * "distrib" and "profile" : the summed likelihood profile on the
+          ``dnde_scan_axis`` grid.
+
+    The state can be written to disk with `write` and read back with `read`,
+    e.g. to resume the combination of a long list of runs.
+
+    Parameters
+    ----------
+    method : {"gaussian_errors", "distrib", "profile"}, optional
+        Combination method, see `combine_flux_maps`. Default is "gaussian_errors".
+    reference_model : `~gammapy.modeling.models.SkyModel`, optional
+        Reference model to use for conversions.
+        Default is None and it will use the reference_model of the first added flux map.
+    dnde_scan_axis : `~gammapy.maps.MapAxis`, optional
+        Map axis providing the dnde values used to compute the profile.
+        Default is None and it will be derived from the first added flux map.
+        Used only if `method` is "distrib" or "profile".
+
+    Examples
+    --------
+    >>> from gammapy.estimators import TSMapEstimator
+    >>> from gammapy.estimators.utils import FluxMapsCombiner
+    >>> estimator = TSMapEstimator()
+    >>> combiner = FluxMapsCombiner(method="distrib")
+    >>> for dataset in datasets:  # doctest: +SKIP
+    ...     combiner.add(estimator.run(dataset))
+    ...     combiner.write("combined.fits", overwrite=True)
+    >>> combiner = FluxMapsCombiner.read("combined.fits")  # doctest: +SKIP
+    >>> flux_maps = combiner.finalize()  # doctest: +SKIP
+
+    See also
+    --------
+    combine_flux_maps, get_combined_flux_maps
+    """
+
+    def __init__(
+        self, method="gaussian_errors", reference_model=None, dnde_scan_axis=None
+    ):
+        if method not in ["gaussian_errors", "distrib", "profile"]:
+            raise ValueError(
+                f'Invalid method provided : {method}. Available methods are : "gaussian_errors", "distrib", "profile"'
+            )
+
+        self.method = method
+        self.reference_model = reference_model
+        self.dnde_scan_axis = dnde_scan_axis
+        self.n_maps = 0
+        self.gti = None
+        self.meta = {}
+        self._maps = Maps()
+
+    def add(self, flux_map):
+        """Add a flux map to the combination.
+
+        Parameters
+        ----------
+        flux_map : `~gammapy.estimators.FluxMaps`
+            Flux map.
+        """
+        if self.reference_model is None:
+            self.reference_model = flux_map.reference_model
+
+        if flux_map.gti is not None:
+            if self.gti is None:
+                self.gti = flux_map.gti.copy()
+            else:
+                self.gti.stack(flux_map.gti)
+
+        # TODO : change this once we have stackable metadata objets
+        if flux_map.meta is not None:
+            self.meta.update(flux_map.meta)
+
+        if self.method == "gaussian_errors":
+            self._add_gaussian_errors(flux_map)
+        else:
+            self._add_profile(flux_map)
+
+        self.n_maps += 1
+
+    def _add_gaussian_errors(self, flux_map):
+        # compensate for the ts deviation from gaussian approximation expectation in each map
+        ts_diff = flux_map.ts.data - (flux_map.dnde.data / flux_map.dnde_err.data) ** 2
+        ts_diff[np.isnan(ts_diff)] = 0
+
+        if self.n_maps == 0:
+            self._maps["dnde"] = flux_map.dnde.copy()
+            self._maps["dnde_err"] = flux_map.dnde_err.copy()
+            self._maps["ts_diff"] = Map.from_geom(
+                flux_map.dnde.geom, data=ts_diff, unit=""
+            )
+            return
+
+        mean, sigma = self._maps["dnde"], self._maps["dnde_err"]
+        self._maps["ts_diff"].data += ts_diff
+
+        mean_k = flux_map.dnde.quantity.to_value(mean.unit)
+        sigma_k = flux_map.dnde_err.quantity.to_value(sigma.unit)
+
+        mask_valid = np.isfinite(mean) & np.isfinite(sigma) & (sigma.data != 0)
+        mask_valid_k = np.isfinite(mean_k) & np.isfinite(sigma_k) & (sigma_k != 0)
+        mask = mask_valid & mask_valid_k
+        mask_k = ~mask_valid & mask_valid_k
+
+        mean.data[mask] = (
+            (mean.data * sigma_k**2 + mean_k * sigma.data**2)
+            / (sigma.data**2 + sigma_k**2)
+        )[mask]
+        sigma.data[mask] = (sigma.data * sigma_k / np.sqrt(sigma.data**2 + sigma_k**2))[
+            mask
+        ]
+
+        mean.data[mask_k] = mean_k[mask_k]
+        sigma.data[mask_k] = sigma_k[mask_k]
+
+    def _add_profile(self, flux_map):
+        if self.dnde_scan_axis is None:
+            self.dnde_scan_axis = _default_scan_map(flux_map).geom.axes["dnde"]
+
+        if self.method == "profile":
+            stat_scan = interpolate_profile_map(flux_map, self.dnde_scan_axis)
+        else:
+            stat_scan = approximate_profile_map(flux_map, self.dnde_scan_axis)
+
+        stat_scan.data[np.isnan(stat_scan.data)] = 0.0
+
+        if self.n_maps == 0:
+            self._maps["stat_scan"] = stat_scan
+        else:
+            self._maps["stat_scan"].data += stat_scan.data
+
+    def finalize(self):
+        """Compute the combined flux map.
+
+        Further flux maps can still be added afterwards.
+
+        Returns
+        -------
+        flux_maps : `~gammapy.estimators.FluxMaps`
+            Joint flux map.
+        """
+        if self.n_maps == 0:
+            raise ValueError("No flux map added to the combination.")
+
+        kwargs = dict(
+            reference_model=self.reference_model,
+            meta=self.meta.copy(),
+            gti=self.gti.copy() if self.gti is not None else None,
+        )
+
+        if self.method == "gaussian_errors":
+            mean = self._maps["dnde"].copy()
+            sigma = self._maps["dnde_err"].copy()
+
+            ts = mean * mean / sigma / sigma + self._maps["ts_diff"].data
+            ts.data[~np.isfinite(ts.data)] = np.nan
+
+            return FluxMaps.from_maps(
+                dict(dnde=mean, dnde_err=sigma, ts=ts), sed_type="dnde", **kwargs
+            )
+
+        return get_flux_map_from_profile(
+            {"stat_scan": self._maps["stat_scan"].copy()}, **kwargs
+        )
+
+    def write(self, filename, filename_model=None, overwrite=False, checksum=False):
+        """Write the state of the combination to file.
+
+        Parameters
+        ----------
+        filename : str
+            Filename to write to.
+        filename_model : str, optional
+            Filename of the reference model (yaml format).
+            If None, keep string before '.' and add '_model.yaml' suffix.
+            Default is None.
+        overwrite : bool, optional
+            Overwrite existing file. Default is False.
+        checksum : bool, optional
+            When True adds both DATASUM and CHECKSUM cards to the headers written to the file.
+            Default is False.
+        """
+        if self.n_maps == 0:
+            raise ValueError("No flux map added to the combination.")
+
+        filename = make_path(filename)
+
+        if filename_model is None:
+            name = filename.name.split(".")[0]
+            filename_model = filename.parent / f"{name}_model.yaml"
+
+        filename_model = make_path(filename_model)
+
+        hdulist = self._maps.to_hdulist()
+        header = hdulist[0].header
+        header["METHOD"] = self.method
+        header["NMAPS"] = self.n_maps
+        header["META"] = json.dumps(self.meta, cls=JsonQuantityEncoder)
+
+        if self.gti is not None:
+            hdulist.append(self.gti.to_table_hdu(format="gadf"))
+
+        models = Models(self.reference_model)
+        models.write(filename_model, overwrite=overwrite, write_covariance=False)
+        header["MODEL"] = filename_model.as_posix()
+
+        hdulist.writeto(filename, overwrite=overwrite, checksum=checksum)
+
+    @classmethod
+    def read(cls, filename, checksum=False):
+        """Read the state of a combination from file.
+
+        Parameters
+        ----------
+        filename : str
+            Filename to read from.
+        checksum : bool, optional
+            If True checks both DATASUM and CHECKSUM cards in the file headers. Default is False.
+
+        Returns
+        -------
+        combiner : `FluxMapsCombiner`
+            Flux maps combiner.
+        """
+        filename = make_path(filename)
+
+        with fits.open(str(filename), memmap=False, checksum=checksum) as hdulist:
+            header = hdulist[0].header
+            maps = Maps.from_hdulist(hdulist)
+
+            if "GTI" in hdulist:
+                gti = GTI.from_table_hdu(hdulist["GTI"])
+            else:
+                gti = None
+
+        reference_model = Models.read(header["MODEL"], checksum=checksum)[0]
+
+        dnde_scan_axis = None
+        if "stat_scan" in maps:
+            dnde_scan_axis = maps["stat_scan"].geom.axes["dnde"]
+
+        combiner = cls(
+            method=header["METHOD"],
+            reference_model=reference_model,
+            dnde_scan_axis=dnde_scan_axis,
+        )
+        combiner.n_maps = header["NMAPS"]
+        combiner.gti = gti
+        combiner.meta = json.loads(header["META"], cls=JsonQuantityDecoder)
+        combiner._maps = maps
+        return combiner
+
+
 def _default_scan_map(flux_map, dnde_scan_axis=None):
     if dnde_scan_axis is None:
         dnde_scan_axis = MapAxis(
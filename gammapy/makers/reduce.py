@@ -2,7 +2,13 @@
 import logging
 from astropy.coordinates import Angle
 import gammapy.utils.parallel as parallel
-from gammapy.datasets import Datasets, MapDataset, MapDatasetOnOff, SpectrumDataset
+from gammapy.datasets import (
+    Datasets,
+    MapDataset,
+    MapDatasetOnOff,
+    MapDatasetStacker,
+    SpectrumDataset,
+)
 from .core import Maker
 from .safe import SafeMaskMaker
 
@@ -127,7 +133,7 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         if self.stack_datasets:
             if type(self._dataset) is MapDataset and type(dataset) is MapDatasetOnOff:
                 dataset = dataset.to_map_dataset(name=dataset.name)
-            self._dataset.stack(dataset)
+            self._stacker.add(dataset)
         else:
             self._datasets.append(dataset)
 
@@ -156,6 +162,7 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         if isinstance(dataset, MapDataset):
             # also valid for Spectrum as it inherits from MapDataset
             self._dataset = dataset
+            self._stacker = MapDatasetStacker(dataset)
         else:
             raise TypeError("Invalid reference dataset.")
 
@@ -186,7 +193,7 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
             raise RuntimeError("Execution of a sub-process failed")
 
         if self.stack_datasets:
-            return Datasets([self._dataset])
+            return Datasets([self._stacker.finalize()])
 
         lookup = {
             d.meta_table["OBS_ID"][0]: idx for idx, d in enumerate(self._datasets)
@@ -8,6 +8,7 @@ from .hpx import HpxGeom, HpxMap, HpxNDMap
 from .maps import Maps
 from .measure import containment_radius, containment_region
 from .region import RegionGeom, RegionNDMap
+from .reproject import Reprojector
 from .wcs import WcsGeom, WcsMap, WcsNDMap
 
 __all__ = [
@@ -23,6 +24,7 @@ __all__ = [
     "Maps",
     "RegionGeom",
     "RegionNDMap",
+    "Reprojector",
     "TimeMapAxis",
     "WcsGeom",
     "WcsMap",
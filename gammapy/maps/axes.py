@@ -36,7 +36,13 @@ class BoundaryEnum(str, Enum):
 
 
 class AxisCoordInterpolator:
-    """Axis coordinate interpolator."""
+    """Axis coordinate interpolator.
+
+    Pixel coordinates are a piecewise linear function of the scaled axis
+    coordinates, extrapolated linearly outside of the nodes. The segment
+    containing a coordinate is found in closed form for regularly spaced
+    scaled nodes and by binary search otherwise.
+    """
 
     def __init__(self, edges, interp="lin"):
         self.scale = interpolation_scale(interp)
@@ -49,19 +55,52 @@ class AxisCoordInterpolator:
         else:
             self.kind = 1
 
+        order = np.argsort(self.x)
+        self._x_sorted, self._y_sorted = self.x[order], self.y[order]
+
+        diff = np.diff(self._x_sorted)
+        self._slope_coord_to_pix = np.diff(self._y_sorted) / diff
+        self._slope_pix_to_coord = np.diff(self.x)
+        self._is_regular = self.kind == 1 and np.allclose(diff, diff[0], rtol=1e-10)
+
+    @staticmethod
+    def _interp(values, idx, x, y, slope):
+        """Evaluate the piecewise linear function on the segments ``idx``."""
+        nseg = len(slope)
+        idx = np.clip(np.where(np.isfinite(values), idx, 0), 0, nseg - 1).astype(int)
+        return y[idx] + (values - x[idx]) * slope[idx]
+
     def coord_to_pix(self, coord):
         """Transform coordinate to pixel."""
-        interp_fn = scipy.interpolate.interp1d(
-            x=self.x, y=self.y, kind=self.kind, fill_value=self.fill_value
-        )
-        return interp_fn(self.scale(coord))
+        if self.kind == 0:
+            interp_fn = scipy.interpolate.interp1d(
+                x=self.x, y=self.y, kind=self.kind, fill_value=self.fill_value
+            )
+            return interp_fn(self.scale(coord))
+
+        values = np.asarray(self.scale(coord), dtype=float)
+        x, y = self._x_sorted, self._y_sorted
+
+        if self._is_regular:
+            idx = np.floor((values - x[0]) / (x[1] - x[0]))
+        else:
+            idx = np.searchsorted(x, values, side="right") - 1
+
+        return self._interp(values, idx, x, y, self._slope_coord_to_pix)
 
     def pix_to_coord(self, pix):
         """Transform pixel to coordinate."""
-        interp_fn = scipy.interpolate.interp1d(
-            x=self.y, y=self.x, kind=self.kind, fill_value=self.fill_value
+        if self.kind == 0:
+            interp_fn = scipy.interpolate.interp1d(
+                x=self.y, y=self.x, kind=self.kind, fill_value=self.fill_value
+            )
+            return self.scale.inverse(interp_fn(pix))
+
+        pix = np.asarray(pix, dtype=float)
+        values = self._interp(
+            pix, np.floor(pix), self.y, self.x, self._slope_pix_to_coord
         )
-        return self.scale.inverse(interp_fn(pix))
+        return self.scale.inverse(values)
 
 
 PLOT_AXIS_LABEL = {
@@ -864,6 +903,10 @@ class MapAxis:
         if self._boundary_type == BoundaryEnum.periodic:
             coord = self.wrap_coord(coord)
         coord = u.Quantity(coord, self.unit, copy=COPY_IF_NEEDED).value
+        return self._coord_to_pix(coord)
+
+    def _coord_to_pix(self, coord):
+        """Transform axis coordinate values, given in the axis unit, to pixel coordinates."""
         pix = self._transform.coord_to_pix(coord=coord)
         return np.array(pix + self._pix_offset, ndmin=1)
 
@@ -887,8 +930,23 @@ class MapAxis:
         if self._boundary_type == BoundaryEnum.periodic:
             coord = self.wrap_coord(coord)
         coord = u.Quantity(coord, self.unit, copy=COPY_IF_NEEDED, ndmin=1).value
+        return self._coord_to_idx(coord, clip=clip)
+
+    @lazyproperty
+    def _edges_value(self):
+        """Bin edges in the axis unit and whether they are increasing."""
         edges = self.edges.value
-        idx = np.digitize(coord, edges) - 1
+        return edges, bool(np.all(np.diff(edges) > 0))
+
+    def _coord_to_idx(self, coord, clip=False):
+        """Transform axis coordinate values, given in the axis unit, to bin indices."""
+        coord = np.array(coord, ndmin=1, copy=COPY_IF_NEEDED)
+        edges, increasing = self._edges_value
+
+        if increasing:
+            idx = np.searchsorted(edges, coord, side="right") - 1
+        else:
+            idx = np.digitize(coord, edges) - 1
 
         if clip:
             idx = np.clip(idx, 0, self.nbin - 1)
@@ -923,7 +981,7 @@ class MapAxis:
         >>> sliced = axis.slice(slices)
         """
         center = self.center[idx].value
-        idx = self.coord_to_idx(center)
+        idx = self._coord_to_idx(center)
         # For edge nodes we need to keep N+1 nodes
         if self._node_type == "edges":
             idx = tuple(list(idx) + [1 + idx[-1]])
@@ -4,13 +4,12 @@ import copy
 import html
 import inspect
 import json
+import mmap
 from collections import OrderedDict
-from itertools import repeat
 import numpy as np
 from astropy import units as u
 from astropy.io import fits
 import matplotlib.pyplot as plt
-import gammapy.utils.parallel as parallel
 from gammapy.utils.compat import COPY_IF_NEEDED
 from gammapy.utils.random import InverseCDFSampler, get_random_state
 from gammapy.utils.scripts import make_path
@@ -22,6 +21,9 @@ from .geom import pix_tuple_to_idx
 
 __all__ = ["Map"]
 
+MEMMAP_CHUNK_SIZE = 2**26
+"""Maximum size in bytes of the chunks used to process memory-mapped map data."""
+
 
 class Map(abc.ABC):
     """Abstract map class.
@@ -82,6 +84,38 @@ class Map(abc.ABC):
         """Whether map is a mask with boolean data type."""
         return self.data.dtype == bool
 
+    @property
+    def is_memmap(self):
+        """Whether the map data is memory-mapped from a file."""
+        data = self.data
+
+        while data is not None:
+            if isinstance(data, mmap.mmap):
+                return True
+            # copies of a `~numpy.memmap` keep the class, but not the file
+            if isinstance(data, np.memmap) and data._mmap is not None:
+                return True
+            data = getattr(data, "base", None)
+
+        return False
+
+    def _iter_chunk_slices(self):
+        """Iterate over slices of data chunks along the last spatial axis.
+
+        The chunks contain at most `MEMMAP_CHUNK_SIZE` bytes, but at least one
+        pixel row (or one pixel for HEALPix maps).
+        """
+        shape = self.data.shape
+        axis = -1 if self.geom.is_hpx else -2
+        n_bins = shape[axis]
+
+        bytes_per_bin = self.data.dtype.itemsize * np.prod(shape) // max(n_bins, 1)
+        chunk_size = max(int(MEMMAP_CHUNK_SIZE // max(bytes_per_bin, 1)), 1)
+
+        for start in range(0, n_bins, chunk_size):
+            chunk = slice(start, min(start + chunk_size, n_bins))
+            yield (Ellipsis, chunk) if axis == -1 else (Ellipsis, chunk, slice(None))
+
     @property
     def geom(self):
         """Map geometry as a `~gammapy.maps.Geom` object."""
@@ -116,6 +150,19 @@ class Map(abc.ABC):
                 ) from exc
 
         self._data = value
+        self._clear_interpolators()
+
+    def _clear_interpolators(self):
+        """Clear the interpolators cached by `interp_by_pix`.
+
+        Must be called whenever the data are modified in place.
+        """
+        self._interpolators = {}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_interpolators"] = {}
+        return state
 
     @property
     def unit(self):
@@ -228,6 +275,7 @@ class Map(abc.ABC):
         format=None,
         colname=None,
         checksum=False,
+        memmap=False,
     ):
         """Read a map from a FITS file.
 
@@ -251,6 +299,12 @@ class Map(abc.ABC):
             data column name to be used for HEALPix map.
         checksum : bool
             If True checks both DATASUM and CHECKSUM cards in the file headers. Default is False.
+        memmap : bool, optional
+            If True the data of uncompressed and unscaled FITS images are memory
+            mapped, so that only the parts of the data which are accessed are read
+            from disk. The file is opened read-only and the data are copy-on-write:
+            modifications are kept in memory and never written back to the file.
+            Default is False.
 
         Returns
         -------
@@ -258,14 +312,14 @@ class Map(abc.ABC):
             Map object.
         """
         with fits.open(
-            make_path(filename), memmap=False, checksum=checksum
+            make_path(filename), memmap=memmap, checksum=checksum
         ) as hdulist:
             return Map.from_hdulist(
                 hdulist, hdu, hdu_bands, map_type, format=format, colname=colname
             )
 
     @staticmethod
-    def from_geom(geom, meta=None, data=None, unit="", dtype="float32"):
+    def from_geom(geom, meta=None, data=None, unit="", dtype="float32", filename=None):
         """Generate an empty map from a `Geom` instance.
 
         Parameters
@@ -280,6 +334,14 @@ class Map(abc.ABC):
             Data unit.
         dtype : str, optional
             Data type. Default is 'float32'.
+        filename : str or `~pathlib.Path`, optional
+            If given, the map data are stored on disk in a memory-mapped ".npy"
+            file of this name, initialised with zeros, instead of in memory. Only
+            the parts of the data which are accessed are loaded. Reductions and
+            in-place arithmetic operations on such maps are computed in chunks
+            of at most `~gammapy.maps.core.MEMMAP_CHUNK_SIZE` bytes. The file can
+            be re-opened with ``Map.from_geom(geom, data=np.load(filename, mmap_mode="r+"))``.
+            Default is None.
 
         Returns
         -------
@@ -300,6 +362,15 @@ class Map(abc.ABC):
         else:
             raise ValueError("Unrecognized geom type.")
 
+        if filename is not None:
+            if data is not None:
+                raise ValueError("Either data or filename can be given, not both.")
+
+            shape = tuple(int(n) for n in geom.data_shape)
+            data = np.lib.format.open_memmap(
+                make_path(filename), mode="w+", dtype=dtype, shape=shape
+            )
+
         cls_out = Map._get_map_cls(map_type)
         return cls_out(geom, data=data, meta=meta, unit=unit, dtype=dtype)
 
@@ -1020,6 +1091,14 @@ class Map(abc.ABC):
         -------
         vals : `~numpy.ndarray`
             Interpolated pixel values.
+
+        Notes
+        -----
+        The interpolator set up on the data is cached on the map and reused by
+        subsequent calls. The cache is cleared when the data are set or modified
+        by the map methods (e.g. `set_by_idx`, `fill_by_idx` or `stack`). When
+        modifying single elements of ``map.data`` in place, assign the data
+        again (``map.data = map.data``) to clear the cache.
         """
         pass
 
@@ -1047,7 +1126,7 @@ class Map(abc.ABC):
             Interpolated Map.
         """
         coords = geom.get_coord()
-        map_copy = self.copy()
+        map_copy = self
 
         if preserve_counts:
             if geom.ndim > 2 and geom.axes[0] != self.geom.axes[0]:
@@ -1055,6 +1134,7 @@ class Map(abc.ABC):
                     f"Energy axes do not match, expected: \n {self.geom.axes[0]},"
                     f" but got: \n {geom.axes[0]}."
                 )
+            map_copy = self.copy()
             map_copy.data /= map_copy.geom.solid_angle().to_value("deg2")
 
         if map_copy.is_mask and fill_value is not None:
@@ -1090,9 +1170,13 @@ class Map(abc.ABC):
         -------
         output_map : `Map`
             Reprojected Map.
+
+        See also
+        --------
+        Reprojector : reusable spatial reprojection between two geometries.
         """
         from .hpx import HpxGeom
-        from .region import RegionGeom
+        from .reproject import Reprojector
 
         axes = [ax.copy() for ax in self.geom.axes]
         geom3d = geom.copy(axes=axes)
@@ -1107,28 +1191,13 @@ class Map(abc.ABC):
                     "Reprojection to 3d geom with non-identical axes is not supported for HpxGeom. "
                     "Reproject to 2d geom first and then use inter_to_geom method."
                 )
-        if isinstance(geom3d, RegionGeom):
-            base_factor = (
-                geom3d.to_wcs_geom().pixel_scales.min() / self.geom.pixel_scales.min()
-            )
-        elif isinstance(self.geom, RegionGeom):
-            base_factor = (
-                geom3d.pixel_scales.min() / self.geom.to_wcs_geom().pixel_scales.min()
-            )
-        else:
-            base_factor = geom3d.pixel_scales.min() / self.geom.pixel_scales.min()
-
-        if base_factor >= precision_factor:
-            input_map = self
-        else:
-            factor = precision_factor / base_factor
-            if isinstance(self.geom, HpxGeom):
-                factor = int(2 ** np.ceil(np.log(factor) / np.log(2)))
-            else:
-                factor = int(np.ceil(factor))
-            input_map = self.upsample(factor=factor, preserve_counts=preserve_counts)
-
-        output_map = input_map.resample(geom3d, preserve_counts=preserve_counts)
+        reprojector = Reprojector(
+            self.geom,
+            geom3d,
+            preserve_counts=preserve_counts,
+            precision_factor=precision_factor,
+        )
+        output_map = reprojector.reproject(self)
 
         if not geom.is_image and geom.axes != geom3d.axes:
             for base_ax, target_ax in zip(geom3d.axes, geom.axes):
@@ -1152,7 +1221,9 @@ class Map(abc.ABC):
     ):
         """Reproject each image of a ND map to input 2d geometry.
 
-        For large maps this method is faster than `reproject_to_geom`.
+        All image planes are reprojected with a single `~gammapy.maps.Reprojector`.
+        To reproject many maps sharing the same geometry, create the
+        `~gammapy.maps.Reprojector` once and reuse it.
 
         Parameters
         ----------
@@ -1171,29 +1242,18 @@ class Map(abc.ABC):
         output_map : `Map`
             Reprojected Map.
         """
+        from .reproject import Reprojector
+
         if not geom.is_image:
             raise TypeError("This method is only valid for 2d geom")
 
-        output_map = Map.from_geom(geom.to_cube(self.geom.axes))
-        maps = parallel.run_multiprocessing(
-            self._reproject_image,
-            zip(
-                self.iter_by_image(),
-                repeat(geom),
-                repeat(preserve_counts),
-                repeat(precision_factor),
-            ),
-            task_name="Reprojection",
-        )
-        for idx in np.ndindex(self.geom.shape_axes):
-            output_map.data[idx[0]] = maps[idx[0]].data
-        return output_map
-
-    @staticmethod
-    def _reproject_image(image, geom, preserve_counts, precision_factor):
-        return image.reproject_to_geom(
-            geom, precision_factor=precision_factor, preserve_counts=preserve_counts
+        reprojector = Reprojector(
+            self.geom,
+            geom,
+            preserve_counts=preserve_counts,
+            precision_factor=precision_factor,
         )
+        return reprojector.reproject(self)
 
     def fill_events(self, events, weights=None):
         """Fill the map from an `~gammapy.data.EventList` object.
@@ -1606,6 +1666,10 @@ class Map(abc.ABC):
 
         idx = self.geom.axes.index_data(axis_name)
 
+        if self.is_memmap:
+            data = self._reduce_chunked(idx, func, keepdims=keepdims, weights=weights)
+            return self._init_copy(geom=geom, data=data)
+
         data = self.data
 
         if weights is not None:
@@ -1614,6 +1678,32 @@ class Map(abc.ABC):
         data = func.reduce(data, axis=idx, keepdims=keepdims, where=~np.isnan(data))
         return self._init_copy(geom=geom, data=data)
 
+    def _reduce_chunked(self, idx, func, keepdims=False, weights=None):
+        """Reduce memory-mapped data over a non-spatial axis chunk by chunk."""
+        if weights is not None:
+            weights = np.broadcast_to(np.asarray(weights), self.data.shape)
+
+        data_out = None
+
+        for chunk in self._iter_chunk_slices():
+            data = np.asarray(self.data[chunk])
+
+            if weights is not None:
+                data = data * weights[chunk]
+
+            data = func.reduce(data, axis=idx, keepdims=keepdims, where=~np.isnan(data))
+
+            if data_out is None:
+                shape = list(self.data.shape)
+                shape[idx] = 1
+                if not keepdims:
+                    shape.pop(idx)
+                data_out = np.empty(shape, dtype=data.dtype)
+
+            data_out[chunk] = data
+
+        return data_out
+
     def cumsum(self, axis_name):
         """Compute cumulative sum along a given axis.
 
@@ -1885,9 +1975,38 @@ class Map(abc.ABC):
             q = u.Quantity(other, copy=COPY_IF_NEEDED)
 
         out = self.copy() if copy else self
-        out.quantity = operator(out.quantity, q)
+
+        if not (out.is_memmap and out._arithmetics_chunked(operator, q)):
+            out.quantity = operator(out.quantity, q)
+
         return out
 
+    def _arithmetics_chunked(self, operator, q):
+        """Apply an in-place arithmetic operation on memory-mapped data in chunks.
+
+        Returns False, without modifying the data, if the result cannot be
+        stored in the data type of the map without changing its kind, e.g.
+        float results for an integer map.
+        """
+        if not q.isscalar:
+            q = np.broadcast_to(q, self.data.shape, subok=True)
+
+        unit = None
+        for chunk in self._iter_chunk_slices():
+            value = q if q.isscalar else q[chunk]
+            result = operator(self.quantity[chunk], value)
+
+            if unit is None:
+                if not np.can_cast(result.dtype, self.data.dtype, casting="same_kind"):
+                    return False
+                unit = result.unit
+
+            self.data[chunk] = result.to_value(unit)
+
+        self._unit = unit
+        self._clear_interpolators()
+        return True
+
     def _boolean_arithmetics(self, operator, other, copy):
         """Perform arithmetic on maps after checking geometry consistency."""
         if operator == np.logical_not:
@@ -1338,11 +1338,11 @@ class HpxGeom(Geom):
         if not self.is_regular:
             raise ValueError("Multi-resolution maps not supported yet")
 
-        # TODO: use spatial coordinates only...
         geom = RegionGeom.from_regions(regions)
-        coords = self.get_coord()
+        coords = self.to_image().get_coord()
         mask = geom.contains(coords)
-        return Map.from_geom(self, data=mask)
+        data = mask * np.ones(self.data_shape, dtype=bool)
+        return Map.from_geom(self, data=data)
 
     def get_coord(
         self, idx=None, flat=False, sparse=False, mode="center", axis_name=None
@@ -14,7 +14,12 @@ from ..utils import INVALID_INDEX
 from .core import HpxMap
 from .geom import HpxGeom
 from .io import HPX_FITS_CONVENTIONS, HpxConv
-from .utils import HpxToWcsMapping, get_pix_size_from_nside, get_superpixels
+from .utils import (
+    HpxToWcsMapping,
+    convolve_allsky,
+    get_pix_size_from_nside,
+    get_superpixels,
+)
 
 __all__ = ["HpxNDMap"]
 
@@ -305,11 +310,21 @@ class HpxNDMap(HpxMap):
             )
 
         geom = self.geom.upsample(factor)
-        coords = geom.get_coord()
-        data = self.get_by_coord(coords)
+
+        if self._is_allsky_nest:
+            data = np.repeat(self.data, factor**2, axis=-1)
+        else:
+            idx = geom.get_idx(flat=True)
+            nside = geom._get_nside(idx)
+            idx_super = get_superpixels(
+                idx[0], nside, nside // factor, nest=self.geom.nest
+            )
+            map_out = self._init_copy(geom=geom, data=None, dtype=self.data.dtype)
+            map_out.set_by_idx(idx, self.get_by_idx((idx_super,) + idx[1:]))
+            data = map_out.data
 
         if preserve_counts:
-            data /= factor**2
+            data = data / factor**2
 
         return self._init_copy(geom=geom, data=data)
 
@@ -320,17 +335,35 @@ class HpxNDMap(HpxMap):
             )
 
         geom = self.geom.downsample(factor)
-        coords = self.geom.get_coord()
-        vals = self.get_by_coord(coords)
 
-        map_out = self._init_copy(geom=geom, data=None)
-        map_out.fill_by_coord(coords, vals)
+        if self._is_allsky_nest:
+            shape = self.data.shape[:-1] + (-1, factor**2)
+            map_out = self._init_copy(
+                geom=geom, data=self.data.reshape(shape).sum(axis=-1)
+            )
+        else:
+            idx = self.geom.get_idx(flat=True)
+            nside = self.geom._get_nside(idx)
+            idx_super = get_superpixels(
+                idx[0], nside, nside // factor, nest=self.geom.nest
+            )
+            map_out = self._init_copy(geom=geom, data=None, dtype=self.data.dtype)
+            map_out.fill_by_idx((idx_super,) + idx[1:], self.get_by_idx(idx))
 
         if not preserve_counts:
             map_out.data /= factor**2
 
         return map_out
 
+    @property
+    def _is_allsky_nest(self):
+        """Whether the map is a regular all-sky map in NESTED scheme.
+
+        Super- and subpixels of such maps are contiguous along the pixel axis.
+        """
+        geom = self.geom
+        return geom.is_allsky and geom.is_regular and geom.nest
+
     def to_nside(self, nside, preserve_counts=True):
         """Upsample or downsample the map to a given nside.
 
@@ -453,7 +486,8 @@ class HpxNDMap(HpxMap):
     def smooth(self, width, kernel="gauss"):
         """Smooth the map.
 
-        Iterates over 2D image planes, processing one at a time.
+        All image planes are smoothed in spherical harmonic space, without
+        projection. Partial-sky maps are embedded into an all-sky map first.
 
         Parameters
         ----------
@@ -478,22 +512,6 @@ class HpxNDMap(HpxMap):
 
         nside = self.geom.nside.item()
         lmax = int(3 * nside - 1)  # maximum l of the power spectrum
-        ipix = self.geom._ipix
-
-        if not self.geom.is_allsky:
-            # stack into an all sky map
-            full_sky_geom = HpxGeom.create(
-                nside=self.geom.nside,
-                nest=self.geom.nest,
-                frame=self.geom.frame,
-                axes=self.geom.axes,
-            )
-            full_sky_map = HpxNDMap.from_geom(full_sky_geom)
-
-            for img, idx in self.iter_by_image_data():
-                full_sky_map.data[idx][ipix] = img
-        else:
-            full_sky_map = self
 
         # The smoothing width is expected by healpy in radians
         if isinstance(width, (u.Quantity, str)):
@@ -504,39 +522,25 @@ class HpxNDMap(HpxMap):
             width = width * binsz
             width = np.deg2rad(width)
 
-        smoothed_data = np.empty(self.data.shape, dtype=float)
-
-        for img, idx in full_sky_map.iter_by_image_data():
-            img = img.astype(float)
-
-            if self.geom.nest:
-                # reorder to ring to do the smoothing
-                img = hp.pixelfunc.reorder(img, n2r=True)
-
-            if kernel == "gauss":
-                data = hp.sphtfunc.smoothing(img, sigma=width, pol=False, lmax=lmax)
-            elif kernel == "disk":
-                # create the step function in angular space
-                theta = np.linspace(0, width)
-                beam = np.ones(len(theta))
-                beam[theta > width] = 0
-                # convert to the spherical harmonics space
-                window_beam = hp.sphtfunc.beam2bl(beam, theta, lmax)
-                # normalize the window beam
-                window_beam = window_beam / window_beam.max()
-                data = hp.sphtfunc.smoothing(
-                    img, beam_window=window_beam, pol=False, lmax=lmax
-                )
-            else:
-                raise ValueError(f"Invalid kernel: {kernel!r}")
-
-            if self.geom.nest:
-                # reorder back to nest after the smoothing
-                data = hp.pixelfunc.reorder(data, r2n=True)
-
-            smoothed_data[idx] = data[ipix]
+        if kernel == "gauss":
+            fwhm = width * np.sqrt(8 * np.log(2))
+            window_beam = hp.sphtfunc.gauss_beam(fwhm, lmax=lmax)
+        elif kernel == "disk":
+            # create the step function in angular space
+            theta = np.linspace(0, width)
+            beam = np.ones(len(theta))
+            beam[theta > width] = 0
+            # convert to the spherical harmonics space
+            window_beam = hp.sphtfunc.beam2bl(beam, theta, lmax)
+            # normalize the window beam
+            window_beam = window_beam / window_beam.max()
+        else:
+            raise ValueError(f"Invalid kernel: {kernel!r}")
 
-        return self._init_copy(data=smoothed_data)
+        data = convolve_allsky(
+            self._get_allsky_data(), beam_window=window_beam, nest=self.geom.nest
+        )
+        return self._init_copy(data=self._get_local_data(data))
 
     def convolve(self, kernel, convolution_method="wcs-tan", **kwargs):
         """Convolve map with a WCS kernel.
@@ -676,23 +680,6 @@ class HpxNDMap(HpxMap):
 
         nside = self.geom.nside.item()
         lmax = int(3 * nside - 1)  # maximum l of the power spectrum
-        nest = self.geom.nest
-        allsky = self.geom.is_allsky
-        ipix = self.geom._ipix
-
-        if not allsky:
-            # stack into an all sky map
-            full_sky_geom = HpxGeom.create(
-                nside=self.geom.nside,
-                nest=self.geom.nest,
-                frame=self.geom.frame,
-                axes=self.geom.axes,
-            )
-            full_sky_map = HpxNDMap.from_geom(full_sky_geom)
-            for img, idx in self.iter_by_image_data():
-                full_sky_map.data[idx][ipix] = img
-        else:
-            full_sky_map = self
 
         # Get radial profile from the kernel
         psf_kernel = kernel.psf_kernel_map
@@ -711,27 +698,36 @@ class HpxNDMap(HpxMap):
         angles = coordinates.separation(psf_kernel.geom.center_skydir).rad
         values = psf_kernel.get_by_pix(pixels)
 
-        # Do the convolution in each image plane
-        convolved_data = np.empty(self.data.shape, dtype=float)
-        for img, idx in full_sky_map.iter_by_image_data():
-            img = img.astype(float)
-            if nest:
-                # reorder to ring to do the convolution
-                img = hp.pixelfunc.reorder(img, n2r=True)
+        # Window function of the kernel in each image plane
+        window_beams = np.empty(self.data.shape[:-1] + (lmax + 1,))
+        for idx in self.iter_by_image_index():
             radial_profile = np.reshape(values[:, idx], (values.shape[0],))
             window_beam = hp.sphtfunc.beam2bl(
                 np.flip(radial_profile), np.flip(angles), lmax
             )
-            window_beam = window_beam / window_beam.max()
-            data = hp.sphtfunc.smoothing(
-                img, beam_window=window_beam, pol=False, lmax=lmax
-            )
-            if nest:
-                # reorder back to nest after the convolution
-                data = hp.pixelfunc.reorder(data, r2n=True)
+            window_beams[idx] = window_beam / window_beam.max()
+
+        data = convolve_allsky(
+            self._get_allsky_data(), beam_window=window_beams, nest=self.geom.nest
+        )
+        return self._init_copy(data=self._get_local_data(data))
+
+    def _get_allsky_data(self):
+        """Data of the map embedded into an all-sky data array."""
+        if self.geom.is_allsky:
+            return self.data
+
+        npix = int(np.max(self.geom.npix_max))
+        data = np.zeros(self.data.shape[:-1] + (npix,), dtype=self.data.dtype)
+        data[..., self.geom._ipix] = self.data
+        return data
+
+    def _get_local_data(self, data):
+        """Select the pixels of the map from an all-sky data array."""
+        if self.geom.is_allsky:
+            return data
 
-            convolved_data[idx] = data[ipix]
-        return self._init_copy(data=convolved_data)
+        return data[..., self.geom._ipix]
 
     def get_by_idx(self, idx):
         # inherited docstring
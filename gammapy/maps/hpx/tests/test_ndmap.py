@@ -286,6 +286,21 @@ def test_hpxmap_downsample(nside, nested, frame, region, axes):
     assert m.unit == m_down.unit
 
 
+@pytest.mark.parametrize("nest", [True, False])
+@pytest.mark.parametrize("region", [None, "DISK(110.,75.,10.)"])
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_hpxmap_resample_dtype(nest, region, dtype):
+    geom = HpxGeom.create(nside=8, nest=nest, region=region, frame="galactic")
+    m = HpxNDMap(geom, dtype=dtype)
+    m.data += 1
+
+    for preserve_counts in [True, False]:
+        m_up = m.upsample(2, preserve_counts=preserve_counts)
+        assert m_up.data.dtype == dtype
+        m_down = m.downsample(2, preserve_counts=preserve_counts)
+        assert m_down.data.dtype == dtype
+
+
 @pytest.mark.parametrize(("nside", "nested", "frame", "region", "axes"), hpx_test_geoms)
 def test_hpxmap_sum_over_axes(nside, nested, frame, region, axes):
     m = HpxNDMap(
@@ -370,6 +385,37 @@ def test_hpx_nd_map_to_nside():
     assert_allclose(m3.data, 0.25)
 
 
+@pytest.mark.parametrize("nest", [True, False])
+def test_hpx_nd_map_to_nside_healpy(nest):
+    import healpy as hp
+
+    axis = MapAxis.from_edges([1, 2, 3], name="test-1")
+    geom = HpxGeom.create(nside=8, nest=nest, axes=[axis])
+    data = np.random.default_rng(0).random(geom.data_shape)
+    m = HpxNDMap(geom, data=data)
+
+    order = "NESTED" if nest else "RING"
+    for nside in [2, 4, 16]:
+        m_nside = m.to_nside(nside=nside)
+        desired = hp.ud_grade(data, nside, order_in=order, power=-2)
+        assert_allclose(m_nside.data, desired, rtol=1e-6)
+
+
+@pytest.mark.parametrize("nest", [True, False])
+def test_hpx_nd_map_smooth_healpy(nest):
+    import healpy as hp
+
+    geom = HpxGeom.create(nside=8, nest=nest, axes=axes1)
+    data = np.random.default_rng(0).random(geom.data_shape)
+    m = HpxNDMap(geom, data=data)
+
+    smoothed = m.smooth(5 * u.deg)
+
+    for img, idx in m.iter_by_image_data():
+        desired = hp.smoothing(img, sigma=np.deg2rad(5), lmax=23, nest=nest, pol=False)
+        assert_allclose(smoothed.data[idx], desired, rtol=1e-6)
+
+
 def test_hpx_nd_map_to_wcs_tiles():
     m = HpxNDMap.create(nside=8, frame="galactic")
     m.data += 1
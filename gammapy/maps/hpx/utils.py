@@ -275,6 +275,50 @@ def get_subpixels(idx, nside_superpix, nside_subpix, nest=True):
     return idx
 
 
+def convolve_allsky(data, beam_window, nest=True):
+    """Convolve all-sky HEALPix images in spherical harmonic space.
+
+    All image planes are transformed together, without any projection.
+
+    Parameters
+    ----------
+    data : `~numpy.ndarray`
+        All-sky HEALPix data, with the HEALPix pixel index along the last axis.
+    beam_window : `~numpy.ndarray`
+        Beam window function of shape ``(lmax + 1,)``, applied to all image
+        planes, or of shape ``data.shape[:-1] + (lmax + 1,)`` to apply a
+        different beam to each image plane.
+    nest : bool, optional
+        Indexing scheme. If True, "NESTED" scheme. If False, "RING" scheme.
+        Default is True.
+
+    Returns
+    -------
+    data : `~numpy.ndarray`
+        Convolved data.
+    """
+    import healpy as hp
+
+    shape = data.shape
+    nside = hp.npix2nside(shape[-1])
+    lmax = beam_window.shape[-1] - 1
+
+    images = np.reshape(data, (-1, shape[-1])).astype(float)
+
+    if nest:
+        images = hp.reorder(images, n2r=True)
+
+    alms = np.atleast_2d(hp.map2alm(images, lmax=lmax, pol=False))
+    ell, _ = hp.Alm.getlm(lmax)
+    alms *= np.reshape(beam_window, (-1, lmax + 1))[:, ell]
+    images = np.atleast_2d(hp.alm2map(alms, nside, lmax=lmax, pol=False))
+
+    if nest:
+        images = hp.reorder(images, r2n=True)
+
+    return np.reshape(images, shape)
+
+
 class HpxToWcsMapping:
     """Stores the indices need to convert from HEALPix to WCS.
 
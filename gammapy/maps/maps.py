@@ -4,9 +4,47 @@ from collections.abc import MutableMapping
 from astropy.io import fits
 from gammapy.maps import Map
 from gammapy.utils.scripts import make_path
+from .io import find_bands_hdu
+from .wcs import WcsGeom, WcsNDMap
+from .wcs.io import identify_wcs_format
 
 __all__ = ["Maps"]
 
+# header keywords which differ between maps sharing the same geometry
+HEADER_KEYS_NON_GEOM = ["BITPIX", "EXTNAME", "BUNIT", "META", "CHECKSUM", "DATASUM"]
+
+
+class _LazyMap:
+    """Map stored in a FITS file, loaded on first access.
+
+    Parameters
+    ----------
+    filename : `~pathlib.Path`
+        Filename.
+    hdu : str
+        Name of the HDU with the map data.
+    geom : `~gammapy.maps.WcsGeom`
+        Geometry of the map.
+    checksum : bool
+        If True checks both DATASUM and CHECKSUM cards in the file headers.
+    """
+
+    def __init__(self, filename, hdu, geom, checksum=False):
+        self.filename = filename
+        self.hdu = hdu
+        self.geom = geom
+        self.checksum = checksum
+
+    def __repr__(self):
+        return f"{type(self).__name__}(filename={self.filename}, hdu={self.hdu})"
+
+    def load(self):
+        """Load the map."""
+        with fits.open(
+            str(self.filename), memmap=False, checksum=self.checksum
+        ) as hdulist:
+            return WcsNDMap._from_hdu_and_geom(hdulist[self.hdu], self.geom)
+
 
 class Maps(MutableMapping):
     """A Dictionary containing Map objects sharing the same geometry.
@@ -39,7 +77,16 @@ class Maps(MutableMapping):
         self._data[key] = value
 
     def __getitem__(self, key):
-        return self._data[key]
+        value = self._data[key]
+
+        if isinstance(value, _LazyMap):
+            value = value.load()
+            self._data[key] = value
+
+        return value
+
+    def __contains__(self, key):
+        return key in self._data
 
     def __len__(self):
         """Returns the length of MapDict."""
@@ -93,16 +140,81 @@ class Maps(MutableMapping):
         hdulist = fits.HDUList([hdu_primary])
 
         for key, m in self.items():
-            hdulist += m.to_hdulist(hdu=key, hdu_bands=hdu_bands)[exclude_primary]
+            for hdu in m.to_hdulist(hdu=key, hdu_bands=hdu_bands)[exclude_primary]:
+                # the shared BANDS table is only written once
+                if hdu_bands is not None and hdu.name == hdu_bands.upper():
+                    if hdu.name in hdulist:
+                        continue
+                hdulist.append(hdu)
 
         return hdulist
 
+    @staticmethod
+    def _get_map_names(hdulist, names=None):
+        """Get names of the HDUs with map data, without loading the data."""
+        map_names = [
+            hdu.name.lower()
+            for hdu in hdulist
+            if hdu.is_image and hdu.header.get("NAXIS", 0) > 0
+        ]
+
+        if names is None:
+            return map_names
+
+        names = [name.lower() for name in names]
+        missing = [name for name in names if name not in map_names]
+
+        if missing:
+            raise KeyError(f"Maps {missing} not found in HDU list.")
+
+        return names
+
+    @staticmethod
+    def _read_geoms(hdulist, names, hdu_bands=None):
+        """Read the geometries of WCS maps, parsing each distinct geometry once.
+
+        Returns None for maps which are not stored as WCS images in the "gadf" format.
+        """
+        geoms, geoms_cache = {}, {}
+
+        for name in names:
+            hdu = hdulist[name]
+
+            if Map._get_map_type(hdulist, name) != "wcs":
+                geoms[name] = None
+                continue
+
+            bands = hdu_bands if hdu_bands is not None else find_bands_hdu(hdulist, hdu)
+
+            header = hdu.header.copy()
+            for key in HEADER_KEYS_NON_GEOM:
+                header.remove(key, ignore_missing=True)
+
+            key = (header.tostring(), bands)
+
+            if key not in geoms_cache:
+                hdu_bands_ = hdulist[bands] if bands is not None else None
+                format = identify_wcs_format(hdu_bands_)
+
+                if format == "gadf":
+                    geom = WcsGeom.from_header(hdu.header, hdu_bands_, format=format)
+                else:
+                    geom = None
+
+                geoms_cache[key] = geom
+
+            geoms[name] = geoms_cache[key]
+
+        return geoms
+
     @classmethod
-    def from_hdulist(cls, hdulist, hdu_bands="BANDS"):
+    def from_hdulist(cls, hdulist, hdu_bands="BANDS", names=None):
         """Create map dictionary from a HDU list.
 
         Because FITS keywords are case-insensitive, all key names will return as lower-case.
 
+        The geometry shared by the maps is only parsed once.
+
         Parameters
         ----------
         hdulist : `~astropy.io.fits.HDUList`
@@ -110,6 +222,8 @@ class Maps(MutableMapping):
         hdu_bands : str, optional
             Name of the HDU with the BANDS table. If set to None, each map should have its own hdu_band.
             Default is 'BANDS'.
+        names : list of str, optional
+            Names of the maps to read. If None, all maps are read. Default is None.
 
         Returns
         -------
@@ -118,16 +232,19 @@ class Maps(MutableMapping):
         """
         maps = cls()
 
-        for hdu in hdulist:
-            if hdu.is_image and hdu.data is not None:
-                map_name = hdu.name.lower()
-                maps[map_name] = Map.from_hdulist(
-                    hdulist, hdu=map_name, hdu_bands=hdu_bands
-                )
+        names = cls._get_map_names(hdulist, names=names)
+        geoms = cls._read_geoms(hdulist, names=names, hdu_bands=hdu_bands)
+
+        for name in names:
+            if geoms[name] is None:
+                maps[name] = Map.from_hdulist(hdulist, hdu=name, hdu_bands=hdu_bands)
+            else:
+                maps[name] = WcsNDMap._from_hdu_and_geom(hdulist[name], geoms[name])
+
         return maps
 
     @classmethod
-    def read(cls, filename, checksum=False):
+    def read(cls, filename, checksum=False, names=None, lazy=False):
         """Read map dictionary from file.
 
         Because FITS keywords are case-insensitive, all key names will return as lower-case.
@@ -136,16 +253,40 @@ class Maps(MutableMapping):
         ----------
         filename : str
             Filename to read from.
+        checksum : bool, optional
+            If True checks both DATASUM and CHECKSUM cards in the file headers. Default is False.
+        names : list of str, optional
+            Names of the maps to read, e.g. ``["ts", "sqrt_ts"]``. If None, all
+            maps are read. Default is None.
+        lazy : bool, optional
+            If True, only the headers are read and the data of each map is loaded
+            from the file when the map is first accessed. Default is False.
 
         Returns
         -------
         maps : `~gammapy.maps.Maps`
             Maps object.
         """
-        with fits.open(
-            str(make_path(filename)), memmap=False, checksum=checksum
-        ) as hdulist:
-            return cls.from_hdulist(hdulist)
+        filename = make_path(filename)
+
+        with fits.open(str(filename), memmap=False, checksum=checksum) as hdulist:
+            if not lazy:
+                return cls.from_hdulist(hdulist, names=names)
+
+            maps = cls()
+            names = cls._get_map_names(hdulist, names=names)
+            geoms = cls._read_geoms(hdulist, names=names, hdu_bands="BANDS")
+
+            for name in names:
+                if geoms[name] is None:
+                    maps[name] = Map.from_hdulist(hdulist, hdu=name, hdu_bands="BANDS")
+                else:
+                    maps._geom = geoms[name]
+                    maps._data[name] = _LazyMap(
+                        filename, hdu=name, geom=geoms[name], checksum=checksum
+                    )
+
+        return maps
 
     def write(self, filename, overwrite=False, checksum=False):
         """Write map dictionary to file.
@@ -1,6 +1,8 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import copy
+import hashlib
 import logging
+import pickle
 from functools import lru_cache
 import numpy as np
 from astropy import units as u
@@ -110,6 +112,18 @@ class RegionGeom(Geom):
                 state[key] = lru_cache()(value)
         self.__dict__ = state
 
+    def _init_copy(self, **kwargs):
+        geom = super()._init_copy(**kwargs)
+
+        # the cached pixel region and bounding box only depend on the region
+        # and WCS, so they can be shared if those are unchanged
+        if geom.region is self.region and geom.wcs is self.wcs:
+            for name in ["_region_pix", "_rectangle_bbox"]:
+                if name in self.__dict__:
+                    geom.__dict__[name] = self.__dict__[name]
+
+        return geom
+
     @property
     def frame(self):
         """Coordinate system, either Galactic ("galactic") or Equatorial ("icrs")."""
@@ -152,6 +166,10 @@ class RegionGeom(Geom):
             )
         return rectangle_pix.to_sky(self.wcs)
 
+    @lazyproperty
+    def _region_pix(self):
+        return self.region.to_pixel(self.wcs)
+
     @property
     def width(self):
         """Width of bounding box of the region.
@@ -240,7 +258,8 @@ class RegionGeom(Geom):
         if self.is_all_point_sky_regions:
             return np.ones(coords.skycoord.shape, dtype=bool)
 
-        return self.region.contains(coords.skycoord, self.wcs)
+        pixcoord = PixCoord.from_sky(coords.skycoord, self.wcs)
+        return self._region_pix.contains(pixcoord)
 
     def contains_wcs_pix(self, pix):
         """Check if a given WCS pixel coordinate is contained in the region.
@@ -260,8 +279,7 @@ class RegionGeom(Geom):
         if self.is_all_point_sky_regions:
             return np.ones(pix[0].shape, dtype=bool)
 
-        region_pix = self.region.to_pixel(self.wcs)
-        return region_pix.contains(PixCoord(pix[0], pix[1]))
+        return self._region_pix.contains(PixCoord(pix[0], pix[1]))
 
     def separation(self, position):
         """Angular distance between the center of the region and the given position.
@@ -451,15 +469,25 @@ class RegionGeom(Geom):
         weights : `~numpy.ndarray`
             Weights representing the fraction of each pixel
             contained in the region.
+
+        Notes
+        -----
+        The weights are stored in `WcsGeom.cache` and shared between region
+        geometries with equal regions and WCS. The returned array is read-only.
         """
         wcs_geom = self.to_wcs_geom()
 
-        weights = wcs_geom.to_image().region_weights(
-            regions=[self.region], oversampling_factor=factor
-        )
+        def compute():
+            weights = wcs_geom.to_image().region_weights(
+                regions=[self.region], oversampling_factor=factor
+            )
+            mask = weights.data > 0
+            return mask, weights.data[mask]
 
-        mask = weights.data > 0
-        weights = weights.data[mask]
+        # the weights are shared between geometries with equal regions
+        region_key = hashlib.sha1(pickle.dumps(self.region)).hexdigest()
+        key = (wcs_geom._cache_key, "region_weights", region_key, factor)
+        mask, weights = WcsGeom.cache.get_or_compute(key, compute)
 
         # Get coordinates
         coords = wcs_geom.get_coord(sparse=True).apply_mask(mask)
@@ -86,6 +86,7 @@ class RegionNDMap(Map):
             )
 
         self._data = value
+        self._clear_interpolators()
 
     def plot(self, ax=None, axis_name=None, **kwargs):
         """Plot the data contained in region map along the non-spatial axis.
@@ -424,6 +425,7 @@ class RegionNDMap(Map):
         if not preserve_counts:
             weights /= np.bincount(idx_inv).astype(self.data.dtype)
         self.data.T.flat[idx] += weights
+        self._clear_interpolators()
 
     def fill_by_idx(self, idx, weights=None):
         return self._resample_by_idx(idx, weights=weights, preserve_counts=True)
@@ -461,26 +463,33 @@ class RegionNDMap(Map):
 
     def interp_by_pix(self, pix, **kwargs):
         # inherited docstring
-        grid_pix = [np.arange(n, dtype=float) for n in self.data.shape[::-1]]
+        key = tuple(sorted(kwargs.items()))
+        fn = self._interpolators.get(key)
 
-        if np.any(np.isfinite(self.data)):
-            data = self.data.copy().T
-            data[~np.isfinite(data)] = 0.0
-        else:
-            data = self.data.T
+        if fn is None:
+            grid_pix = [np.arange(n, dtype=float) for n in self.data.shape[::-1]]
+
+            if np.any(np.isfinite(self.data)):
+                data = self.data.copy().T
+                data[~np.isfinite(data)] = 0.0
+            else:
+                data = self.data.T
+
+            scale = kwargs.get("values_scale", "lin")
 
-        scale = kwargs.get("values_scale", "lin")
+            if scale == "stat-profile":
+                axis = 2 + self.geom.axes.index("norm")
+                kwargs["values_scale"] = StatProfileScale(axis=axis)
 
-        if scale == "stat-profile":
-            axis = 2 + self.geom.axes.index("norm")
-            kwargs["values_scale"] = StatProfileScale(axis=axis)
+            fn = ScaledRegularGridInterpolator(grid_pix, data, **kwargs)
+            self._interpolators[key] = fn
 
-        fn = ScaledRegularGridInterpolator(grid_pix, data, **kwargs)
         return fn(tuple(pix), clip=False)
 
     def set_by_idx(self, idx, value):
         # inherited docstring
         self.data[idx[::-1]] = value
+        self._clear_interpolators()
 
     @classmethod
     def read(cls, filename, format="gadf", ogip_column=None, hdu=None, checksum=False):
@@ -719,7 +728,7 @@ class RegionNDMap(Map):
             Non-finite values are replaced by zero if True.
             Default is True.
         """
-        data = other.quantity.to_value(self.unit).astype(self.data.dtype)
+        data = other.quantity.to_value(self.unit).astype(self.data.dtype, copy=False)
 
         # TODO: re-think stacking of regions. Is making the union reasonable?
         # self.geom.union(other.geom)
@@ -734,6 +743,7 @@ class RegionNDMap(Map):
             data = data * weights.data
 
         self.data += data
+        self._clear_interpolators()
 
     def to_table(self, format="gadf"):
         """Convert to `~astropy.table.Table`.
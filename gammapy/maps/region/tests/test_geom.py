@@ -392,6 +392,23 @@ def test_get_wcs_coord_and_weights(region):
     assert region_coord.shape == weights.shape
 
 
+def test_get_wcs_coord_and_weights_cache(region):
+    geom = RegionGeom(region)
+    region_coord, weights = geom.get_wcs_coord_and_weights()
+
+    # an equal region in a different geometry shares the cached weights
+    geom_other = RegionGeom(CircleSkyRegion(region.center, radius=region.radius))
+    region_coord_other, weights_other = geom_other.get_wcs_coord_and_weights()
+
+    assert weights_other is weights
+    assert not weights_other.flags.writeable
+    assert_allclose(region_coord_other.lon, region_coord.lon)
+
+    geom_other = RegionGeom(CircleSkyRegion(region.center, radius=0.5 * u.deg))
+    _, weights_other = geom_other.get_wcs_coord_and_weights()
+    assert weights_other.sum() < weights.sum()
+
+
 def test_region_nd_map_plot(region):
     geom = RegionGeom(region)
 
@@ -434,3 +434,17 @@ def test_region_map_sampling(region_map):
     assert coords["lat"].unit == "deg"
     assert coords["energy"].unit == "TeV"
     assert coords["time"].unit == "min"
+
+
+def test_region_nd_map_interp_cache():
+    energy_axis = MapAxis.from_energy_edges([1, 3, 10] * u.TeV)
+    m = RegionNDMap.create(region=None, axes=[energy_axis])
+    m.data = np.array([1.0, 2.0])
+
+    energy = 3 * u.TeV
+    assert_allclose(m.interp_by_coord({"energy": energy}), 1.5, rtol=1e-3)
+    assert len(m._interpolators) == 1
+
+    m.set_by_idx((0, 0, 1), 4.0)
+    assert m._interpolators == {}
+    assert_allclose(m.interp_by_coord({"energy": energy}), 2.5, rtol=1e-3)
@@ -0,0 +1,309 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import html
+import numpy as np
+import scipy.sparse
+from astropy.io import fits
+from astropy.table import Table
+from astropy.utils import lazyproperty
+from gammapy.utils.scripts import make_path
+from .core import Map
+from .utils import INVALID_INDEX
+
+__all__ = ["Reprojector"]
+
+
+def get_upsampling_factor(geom, geom_out, precision_factor=10):
+    """Upsampling factor of a geometry required to reproject it onto another.
+
+    Parameters
+    ----------
+    geom : `~gammapy.maps.Geom`
+        Input geometry.
+    geom_out : `~gammapy.maps.Geom`
+        Output geometry.
+    precision_factor : int, optional
+        Minimal factor between the bin size of the output geometry and the
+        oversampled input geometry. Default is 10.
+
+    Returns
+    -------
+    factor : int or None
+        Upsampling factor. None if no upsampling is required.
+    """
+    from .hpx import HpxGeom
+    from .region import RegionGeom
+
+    if isinstance(geom_out, RegionGeom):
+        base_factor = (
+            geom_out.to_wcs_geom().pixel_scales.min() / geom.pixel_scales.min()
+        )
+    elif isinstance(geom, RegionGeom):
+        base_factor = (
+            geom_out.pixel_scales.min() / geom.to_wcs_geom().pixel_scales.min()
+        )
+    else:
+        base_factor = geom_out.pixel_scales.min() / geom.pixel_scales.min()
+
+    if base_factor >= precision_factor:
+        return None
+
+    factor = precision_factor / base_factor
+
+    if isinstance(geom, HpxGeom):
+        return int(2 ** np.ceil(np.log(factor) / np.log(2)))
+
+    return int(np.ceil(factor))
+
+
+class Reprojector:
+    """Reproject maps from one spatial geometry onto another.
+
+    The pixel mapping between the two geometries is computed once and stored
+    as a sparse resampling matrix. Reprojecting a map then amounts to a single
+    sparse matrix product for all its image planes, so that the same
+    reprojector can be applied to any number of maps sharing the input
+    geometry, such as the counts, exposure and background maps of many
+    observations.
+
+    The resampling follows `~gammapy.maps.Map.reproject_to_geom`: the input
+    geometry is oversampled until its pixels are smaller than the output
+    pixels by at least ``precision_factor``, and the oversampled pixels are
+    assigned to the output pixel containing their center.
+
+    Parameters
+    ----------
+    geom : `~gammapy.maps.Geom`
+        Input geometry. Only the spatial part is used.
+    geom_out : `~gammapy.maps.Geom`
+        Output geometry. Only the spatial part is used.
+    preserve_counts : bool, optional
+        Preserve the integral over each bin. This should be True
+        if the map is an integral quantity (e.g. counts) and False if
+        the map is a differential quantity (e.g. intensity). Default is False.
+    precision_factor : int, optional
+        Minimal factor between the bin size of the output map and the
+        oversampled input map. Default is 10.
+
+    Examples
+    --------
+    >>> from gammapy.maps import Map, Reprojector, WcsGeom
+    >>> geom = WcsGeom.create(npix=100, binsz=0.02, frame="icrs", skydir=(83.6, 22.0))
+    >>> geom_out = WcsGeom.create(npix=50, binsz=0.05, frame="galactic", skydir=(184.6, -5.8))
+    >>> reprojector = Reprojector(geom, geom_out, preserve_counts=True)
+    >>> m = Map.from_geom(geom, data=1.0)
+    >>> m_out = reprojector.reproject(m)
+    """
+
+    def __init__(self, geom, geom_out, preserve_counts=False, precision_factor=10):
+        self._geom = geom.to_image()
+        self._geom_out = geom_out.to_image()
+        self._preserve_counts = bool(preserve_counts)
+        self._precision_factor = precision_factor
+
+    def __str__(self):
+        return (
+            f"{self.__class__.__name__}\n\n"
+            f"\tinput npix      : {self._npix}\n"
+            f"\toutput npix     : {self._npix_out}\n"
+            f"\tpreserve_counts : {self.preserve_counts}\n"
+            f"\tprecision_factor: {self.precision_factor}\n"
+        )
+
+    def _repr_html_(self):
+        try:
+            return self.to_html()
+        except AttributeError:
+            return f"<pre>{html.escape(str(self))}</pre>"
+
+    @property
+    def geom(self):
+        """Input image geometry."""
+        return self._geom
+
+    @property
+    def geom_out(self):
+        """Output image geometry."""
+        return self._geom_out
+
+    @property
+    def preserve_counts(self):
+        """Whether the integral over each bin is preserved."""
+        return self._preserve_counts
+
+    @property
+    def precision_factor(self):
+        """Minimal factor between the output and oversampled input bin size."""
+        return self._precision_factor
+
+    @property
+    def _npix(self):
+        return int(np.prod(self.geom.data_shape))
+
+    @property
+    def _npix_out(self):
+        return int(np.prod(self.geom_out.data_shape))
+
+    @lazyproperty
+    def matrix(self):
+        """Resampling matrix as a `~scipy.sparse.csr_matrix`.
+
+        The matrix has shape ``(npix_out, npix)``, where the pixels of the
+        input and output images are flattened in data order.
+        """
+        factor = get_upsampling_factor(
+            self.geom, self.geom_out, precision_factor=self.precision_factor
+        )
+
+        # the oversampled image stores the flat index of its parent pixel
+        index = np.arange(self._npix, dtype=float).reshape(self.geom.data_shape)
+        index = Map.from_geom(self.geom, data=index)
+        weights = Map.from_geom(self.geom, data=np.ones(self.geom.data_shape))
+
+        if factor is not None:
+            index = index.upsample(factor=factor, preserve_counts=False)
+            weights = weights.upsample(
+                factor=factor, preserve_counts=self.preserve_counts
+            )
+
+        coords = index.geom.get_coord()
+        idx = self.geom_out.coord_to_idx(coords)
+
+        if self.geom_out.is_hpx:
+            idx = self.geom_out.global_to_local(idx)
+
+        idx = np.broadcast_arrays(*idx)
+        valid = np.all([_ != INVALID_INDEX.int for _ in idx], axis=0)
+
+        rows = np.ravel_multi_index(
+            tuple(_[valid] for _ in idx[::-1]), self.geom_out.data_shape
+        )
+        cols = np.rint(index.data[valid]).astype(int)
+
+        if self.preserve_counts:
+            values = weights.data[valid].astype(float)
+        else:
+            # average of the oversampled pixels in each output pixel
+            counts = np.bincount(rows, minlength=self._npix_out)
+            values = 1.0 / counts[rows]
+
+        return scipy.sparse.csr_matrix(
+            (values, (rows, cols)), shape=(self._npix_out, self._npix)
+        )
+
+    def reproject(self, map_):
+        """Reproject a map.
+
+        Parameters
+        ----------
+        map_ : `~gammapy.maps.Map`
+            Map to reproject. Its spatial geometry must be the input geometry
+            of the reprojector. Non-spatial axes are kept.
+
+        Returns
+        -------
+        map_out : `~gammapy.maps.Map`
+            Reprojected map.
+        """
+        if map_.geom.to_image() != self.geom:
+            raise ValueError(
+                "The spatial geometry of the map does not match the input "
+                "geometry of the reprojector."
+            )
+
+        geom = self.geom_out.to_cube(map_.geom.axes)
+
+        data = map_.data.reshape((-1, self._npix))
+        data = (self.matrix @ data.T).T
+
+        map_out = map_._init_copy(geom=geom, data=None)
+        map_out.data[...] = data.reshape(geom.data_shape)
+        return map_out
+
+    def to_hdulist(self):
+        """Convert to `~astropy.io.fits.HDUList`.
+
+        The resampling matrix is stored in coordinate format in the
+        ``REPROJECTION`` HDU, the input and output geometries as mask maps in
+        the ``GEOM`` and ``GEOM_OUT`` HDUs.
+
+        Returns
+        -------
+        hdulist : `~astropy.io.fits.HDUList`
+            HDU list.
+        """
+        matrix = self.matrix.tocoo()
+        table = Table()
+        table["ROW"] = matrix.row
+        table["COL"] = matrix.col
+        table["WEIGHT"] = matrix.data
+        table.meta["PRESERVE"] = self.preserve_counts
+        table.meta["PRECFACT"] = self.precision_factor
+
+        hdulist = fits.HDUList([fits.PrimaryHDU()])
+        hdulist.append(fits.BinTableHDU(table, name="REPROJECTION"))
+
+        for name, geom in zip(["GEOM", "GEOM_OUT"], [self.geom, self.geom_out]):
+            mask = Map.from_geom(geom, dtype=bool)
+            hdulist.extend(mask.to_hdulist(hdu=name)[1:])
+
+        return hdulist
+
+    @classmethod
+    def from_hdulist(cls, hdulist):
+        """Create from `~astropy.io.fits.HDUList`.
+
+        Parameters
+        ----------
+        hdulist : `~astropy.io.fits.HDUList`
+            HDU list.
+
+        Returns
+        -------
+        reprojector : `Reprojector`
+            Reprojector.
+        """
+        geom = Map.from_hdulist(hdulist, hdu="GEOM").geom
+        geom_out = Map.from_hdulist(hdulist, hdu="GEOM_OUT").geom
+
+        table = Table.read(hdulist["REPROJECTION"])
+        reprojector = cls(
+            geom=geom,
+            geom_out=geom_out,
+            preserve_counts=table.meta["PRESERVE"],
+            precision_factor=table.meta["PRECFACT"],
+        )
+        values = table["WEIGHT"].data.astype(float)
+        rows, cols = table["ROW"].data.astype(int), table["COL"].data.astype(int)
+        reprojector.matrix = scipy.sparse.csr_matrix(
+            (values, (rows, cols)), shape=(reprojector._npix_out, reprojector._npix)
+        )
+        return reprojector
+
+    def write(self, filename, overwrite=False):
+        """Write to a FITS file.
+
+        Parameters
+        ----------
+        filename : str or `~pathlib.Path`
+            Filename.
+        overwrite : bool, optional
+            Overwrite existing file. Default is False.
+        """
+        self.to_hdulist().writeto(make_path(filename), overwrite=overwrite)
+
+    @classmethod
+    def read(cls, filename):
+        """Read from a FITS file.
+
+        Parameters
+        ----------
+        filename : str or `~pathlib.Path`
+            Filename.
+
+        Returns
+        -------
+        reprojector : `Reprojector`
+            Reprojector.
+        """
+        with fits.open(make_path(filename), memmap=False) as hdulist:
+            return cls.from_hdulist(hdulist)
@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
 import numpy as np
+import scipy
 from numpy.testing import assert_allclose, assert_equal
 import astropy.units as u
 from astropy.table import Table
@@ -444,6 +445,31 @@ def test_mapaxis_coord_to_idx(nodes, interp, node_type):
     assert_allclose(np.arange(axis.nbin, dtype=int), axis.coord_to_idx(axis.center))
 
 
+@pytest.mark.parametrize("interp", ["lin", "log", "sqrt"])
+@pytest.mark.parametrize(
+    "nodes",
+    [np.logspace(0, 2, 11), np.linspace(1, 10, 4), [0.25, 0.75, 1.0, 2.0], [4, 2, 1]],
+)
+def test_mapaxis_coord_to_pix_extrapolate(nodes, interp):
+    axis = MapAxis(nodes, interp=interp, node_type="center")
+
+    coord = np.array([0.1, 0.5, 1.3, 2.0, 3.7, 50.0, 200.0, np.nan])
+    interp_fn = scipy.interpolate.interp1d(
+        x=axis._transform.x, y=np.arange(axis.nbin), fill_value="extrapolate"
+    )
+    expected = interp_fn(axis._transform.scale(coord))
+
+    assert_allclose(axis.coord_to_pix(coord), expected, rtol=1e-12)
+    assert_allclose(axis._coord_to_pix(coord), expected, rtol=1e-12)
+    assert_equal(axis.coord_to_pix(nodes), np.arange(axis.nbin))
+    assert_allclose(axis.pix_to_coord(expected), coord, rtol=1e-12)
+
+    coord = np.append(coord, np.inf)
+    idx = axis.coord_to_idx(coord * axis.unit)
+    assert_equal(axis._coord_to_idx(coord), idx)
+    assert_equal(idx[-2:], [-1, -1])
+
+
 @pytest.mark.parametrize(("nodes", "interp", "node_type"), MAP_AXIS_NODE_TYPES)
 def test_mapaxis_slice(nodes, interp, node_type):
     axis = MapAxis(nodes, interp=interp, node_type=node_type)
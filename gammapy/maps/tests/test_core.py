@@ -1038,3 +1038,100 @@ def test_make_mask_geom():
         mask_energy.sum_over_axes(["phase", "freq"]).data.sum(),
         48,
     )
+
+
+@pytest.mark.parametrize(
+    "geom",
+    [
+        WcsGeom.create(binsz=1, width=8, axes=map_axes),
+        HpxGeom.create(nside=4, axes=map_axes),
+        RegionGeom.create("icrs;circle(0, 0, 1)", axes=map_axes),
+    ],
+)
+def test_map_from_geom_memmap(tmp_path, monkeypatch, geom):
+    monkeypatch.setattr("gammapy.maps.core.MEMMAP_CHUNK_SIZE", 64)
+
+    m_ref = Map.from_geom(geom, unit="cm-2")
+    m_ref.data = np.random.default_rng(0).uniform(size=m_ref.data.shape)
+
+    filename = tmp_path / "map.npy"
+    m = Map.from_geom(m_ref.geom, unit="cm-2", filename=filename)
+    assert m.is_memmap
+    assert not m_ref.is_memmap
+    assert_allclose(m.data, 0)
+
+    m.data[...] = m_ref.data
+    m.data.flush()
+    assert_allclose(np.load(filename), m_ref.data.astype("float32"))
+
+    m_sum = m.sum_over_axes(keepdims=False)
+    assert not m_sum.is_memmap
+    assert_allclose(m_sum.data, m_ref.sum_over_axes(keepdims=False).data, rtol=1e-6)
+
+    weights = np.arange(m_ref.geom.axes["time"].nbin).reshape((-1, 1, 1, 1))
+    if geom.is_hpx:
+        weights = weights[..., 0]
+
+    m_reduced = m.reduce("time", func=np.add, weights=weights, keepdims=True)
+    assert_allclose(
+        m_reduced.data,
+        m_ref.reduce("time", func=np.add, weights=weights, keepdims=True).data,
+        rtol=1e-6,
+    )
+
+    m_image = m.get_image_by_idx((1, 2))
+    assert_allclose(m_image.data, m_ref.get_image_by_idx((1, 2)).data, rtol=1e-6)
+
+    m *= 2 * u.Unit("cm2")
+    assert m.is_memmap
+    assert m.unit == ""
+    assert_allclose(m.data, 2 * m_ref.data, rtol=1e-6)
+
+    m += np.ones(m.data.shape)
+    assert_allclose(np.load(filename), 2 * m_ref.data + 1, rtol=1e-6)
+
+
+def test_map_from_geom_memmap_cutout(tmp_path):
+    geom = WcsGeom.create(binsz=0.1, width=(20, 10), axes=map_axes[:1])
+    m = Map.from_geom(geom, filename=tmp_path / "map.npy")
+    m.data[...] = np.arange(m.data.size).reshape(m.data.shape)
+
+    m_ref = Map.from_geom(geom, data=np.array(m.data))
+
+    position = SkyCoord(1, 1, unit="deg", frame="icrs")
+    cutout = m.cutout(position=position, width=1 * u.deg)
+    assert cutout.data.shape == (3, 10, 10)
+    assert not cutout.is_memmap
+    assert_allclose(cutout.data, m_ref.cutout(position=position, width=1 * u.deg).data)
+
+    with pytest.raises(ValueError):
+        Map.from_geom(geom, data=m.data, filename=tmp_path / "other.npy")
+
+
+def test_map_memmap_copies(tmp_path):
+    geom = WcsGeom.create(binsz=1, width=4, axes=map_axes[:1])
+    m = Map.from_geom(geom, filename=tmp_path / "map.npy")
+    m.data[...] = 1
+
+    assert not m.copy().is_memmap
+    assert not (m * 2).is_memmap
+    assert not m.slice_by_idx({"energy": slice(0, 2)}).copy().is_memmap
+
+    m_slice = m.slice_by_idx({"energy": slice(0, 2)})
+    assert m_slice.is_memmap
+    assert np.shares_memory(m_slice.data, m.data)
+
+
+def test_map_memmap_int_arithmetics(tmp_path):
+    geom = WcsGeom.create(binsz=1, width=4)
+    data = np.full(geom.data_shape, 3, dtype=np.int64)
+    Map.from_geom(geom, data=data).write(tmp_path / "map.fits")
+
+    m_ref = Map.read(tmp_path / "map.fits")
+    m_ref *= 0.5
+
+    m = Map.read(tmp_path / "map.fits", memmap=True)
+    assert m.is_memmap
+    m *= 0.5
+    assert m.data.dtype == m_ref.data.dtype
+    assert_allclose(m.data, 1.5)
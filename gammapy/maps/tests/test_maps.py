@@ -53,6 +53,40 @@ def test_maps_read_write(map_dictionary):
     assert_allclose(new_maps["map2"].data, 2)
 
 
+def test_maps_read_lazy(map_dictionary, tmp_path):
+    maps = Maps(**map_dictionary)
+    maps["mask"] = Map.from_geom(maps.geom, dtype=bool)
+    maps.write(tmp_path / "maps.fits")
+
+    hdulist = maps.to_hdulist()
+    assert [hdu.name for hdu in hdulist].count("BANDS") == 1
+
+    new_maps = Maps.read(tmp_path / "maps.fits", lazy=True)
+
+    assert new_maps.geom == maps.geom
+    assert list(new_maps) == ["map1", "map2", "mask"]
+    assert "map2" in new_maps
+    assert not isinstance(new_maps._data["map2"], Map)
+
+    assert_allclose(new_maps["map2"].data, 2)
+    assert isinstance(new_maps._data["map2"], Map)
+    assert new_maps["map2"].geom is new_maps["map1"].geom
+    assert new_maps["mask"].data.dtype == bool
+
+
+def test_maps_read_names(map_dictionary, tmp_path):
+    maps = Maps(**map_dictionary)
+    maps.write(tmp_path / "maps.fits")
+
+    new_maps = Maps.read(tmp_path / "maps.fits", names=["MAP2"])
+
+    assert list(new_maps) == ["map2"]
+    assert_allclose(new_maps["map2"].data, 2)
+
+    with pytest.raises(KeyError):
+        Maps.read(tmp_path / "maps.fits", names=["map3"])
+
+
 def test_maps_region():
     axis = MapAxis.from_edges([1, 2, 3, 4], name="axis", unit="cm")
     map1 = RegionNDMap.create(region=None, axes=[axis])
@@ -0,0 +1,97 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+import astropy.units as u
+from astropy.coordinates import SkyCoord
+from regions import CircleSkyRegion
+from gammapy.maps import HpxGeom, Map, MapAxis, RegionGeom, Reprojector, WcsGeom
+from gammapy.utils.testing import requires_dependency
+
+
+@pytest.fixture()
+def geom():
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2)
+    return WcsGeom.create(
+        npix=(20, 15), binsz=0.1, skydir=(83.6, 22.0), frame="icrs", axes=[axis]
+    )
+
+
+@pytest.fixture()
+def geom_out():
+    return WcsGeom.create(
+        npix=(12, 10), binsz=0.15, skydir=(184.56, -5.78), frame="galactic"
+    )
+
+
+@pytest.mark.parametrize("preserve_counts", [True, False])
+def test_reprojector(geom, geom_out, preserve_counts):
+    data = np.random.default_rng(0).random(geom.data_shape)
+    m = Map.from_geom(geom, data=data, unit="cm-2")
+
+    reprojector = Reprojector(geom, geom_out, preserve_counts=preserve_counts)
+    m_out = reprojector.reproject(m)
+
+    assert m_out.geom == geom_out.to_cube(geom.axes)
+    assert m_out.unit == "cm-2"
+    assert reprojector.matrix.shape == (120, 300)
+
+    expected = m.reproject_to_geom(geom_out, preserve_counts=preserve_counts)
+    assert_allclose(m_out.data, expected.data)
+
+    m_out = reprojector.reproject(m.slice_by_idx({"energy": 0}))
+    assert_allclose(m_out.data, expected.data[0])
+
+
+def test_reprojector_preserve_counts(geom):
+    geom_out = geom.to_image().to_binsz(0.05)
+    m = Map.from_geom(geom, data=1.0)
+
+    reprojector = Reprojector(geom, geom_out, preserve_counts=True)
+    m_out = reprojector.reproject(m)
+    assert_allclose(m_out.data.sum(axis=(1, 2)), 300, rtol=1e-5)
+
+    reprojector = Reprojector(geom, geom_out, preserve_counts=False)
+    m_out = reprojector.reproject(m)
+    assert_allclose(m_out.data, 1, rtol=1e-5)
+
+
+def test_reprojector_wrong_geom(geom, geom_out):
+    reprojector = Reprojector(geom, geom_out)
+
+    with pytest.raises(ValueError):
+        reprojector.reproject(Map.from_geom(geom_out))
+
+
+@requires_dependency("healpy")
+def test_reprojector_hpx_region(geom):
+    region = CircleSkyRegion(SkyCoord(83.6, 22.0, unit="deg"), 0.5 * u.deg)
+    geom_region = RegionGeom.create(region)
+    geom_hpx = HpxGeom.create(nside=64, skydir=(83.6, 22.0), width=2, frame="icrs")
+    m = Map.from_geom(geom, data=1.0)
+
+    m_hpx = Reprojector(geom, geom_hpx, preserve_counts=False).reproject(m)
+    assert m_hpx.geom.is_hpx
+    assert_allclose(m_hpx.data, 1, rtol=1e-5)
+
+    m_region = Reprojector(geom_hpx, geom_region, preserve_counts=True).reproject(m_hpx)
+    # number of HEALPix pixels within the region
+    expected = (np.pi * (0.5 * u.deg) ** 2 / geom_hpx.solid_angle()).to_value("")[0]
+    assert_allclose(m_region.data.squeeze(), expected, rtol=2e-2)
+
+
+def test_reprojector_write_read(geom, geom_out, tmp_path):
+    reprojector = Reprojector(geom, geom_out, preserve_counts=True)
+    reprojector.write(tmp_path / "reprojector.fits")
+
+    reprojector_read = Reprojector.read(tmp_path / "reprojector.fits")
+    assert reprojector_read.geom == reprojector.geom
+    assert reprojector_read.geom_out == reprojector.geom_out
+    assert reprojector_read.preserve_counts
+    assert reprojector_read.precision_factor == 10
+    assert_allclose(
+        reprojector_read.matrix.toarray(), reprojector.matrix.toarray(), rtol=1e-7
+    )
+
+    with pytest.raises(OSError):
+        reprojector.write(tmp_path / "reprojector.fits")
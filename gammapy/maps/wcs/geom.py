@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import copy
+import hashlib
 from functools import lru_cache
 import numpy as np
 import astropy.units as u
@@ -17,6 +18,7 @@ from astropy.wcs.utils import (
 )
 from regions import RectangleSkyRegion
 from gammapy.utils.array import round_up_to_even, round_up_to_odd
+from gammapy.utils.cache import ArrayCache
 from gammapy.utils.compat import COPY_IF_NEEDED
 from ..axes import MapAxes
 from ..coord import MapCoord, skycoord_to_lonlat
@@ -80,12 +82,22 @@ class WcsGeom(Geom):
         Reference pixel coordinate in each image plane.
     axes : list
         Axes for non-spatial dimensions.
+
+    Notes
+    -----
+    Coordinate grids, solid angles and separations of regular geometries are
+    stored in the process-wide `WcsGeom.cache`, keyed on the WCS header and the
+    number of pixels. Equal geometries, e.g. created by `WcsGeom.cutout`,
+    `WcsGeom.to_image` or `WcsGeom.squash`, therefore share these arrays. The
+    cached arrays are read-only. Use ``WcsGeom.cache.info()`` to get the number
+    of hits and misses and ``WcsGeom.cache.max_nbytes`` to cap its memory usage.
     """
 
     _slice_spatial_axes = slice(0, 2)
     _slice_non_spatial_axes = slice(2, None)
     is_hpx = False
     is_region = False
+    cache = ArrayCache()
 
     def __init__(self, wcs, npix=None, cdelt=None, crpix=None, axes=None):
         self._wcs = wcs
@@ -634,6 +646,25 @@ class WcsGeom(Geom):
 
         pix = self._get_pix_all(idx=idx, mode=mode, sparse=sparse, axis_name=axis_name)
 
+        if (
+            idx is None
+            and self.is_regular
+            and isinstance(frame, str)
+            and set(axis_name).isdisjoint(self.axes.names)
+        ):
+            lon, lat = self._get_image_lonlat(
+                edges_lon=mode == "edges" and "lon" in axis_name,
+                edges_lat=mode == "edges" and "lat" in axis_name,
+                frame=frame,
+            )
+            shape = np.broadcast_shapes(pix[0].shape, pix[1].shape)
+            lon = np.broadcast_to(lon, shape, subok=True)
+            lat = np.broadcast_to(lat, shape, subok=True)
+            data = (lon, lat) + self.axes.pix_to_coord(
+                pix[self._slice_non_spatial_axes]
+            )
+            return MapCoord.create(data=data, frame=frame, axis_names=self.axes.names)
+
         data = self.pix_to_coord(pix)
 
         coords = MapCoord.create(
@@ -641,6 +672,30 @@ class WcsGeom(Geom):
         )
         return coords.to_frame(frame)
 
+    @lazyproperty
+    def _cache_key(self):
+        """Stable hash of the image geometry, used as key in `WcsGeom.cache`."""
+        npix = (int(np.max(self._npix[0])), int(np.max(self._npix[1])))
+        header = self.wcs.to_header_string()
+        return hashlib.sha1(f"{header}{npix}".encode()).hexdigest()
+
+    def _get_image_lonlat(self, edges_lon=False, edges_lat=False, frame=None):
+        """Get cached image longitude and latitude arrays of a regular geometry."""
+
+        def compute():
+            pix = [
+                np.arange(-0.5, nbin) if edges else np.arange(nbin, dtype=float)
+                for nbin, edges in zip(self._shape[:2], [edges_lon, edges_lat])
+            ]
+            pix = np.meshgrid(*pix[::-1], indexing="ij")[::-1]
+            lon, lat = self._wcs.wcs_pix2world(pix[0], pix[1], 0)
+            data = (u.Quantity(lon, unit="deg"), u.Quantity(lat, unit="deg"))
+            coords = MapCoord.create(data=data, frame=self.frame).to_frame(frame)
+            return coords.lon, coords.lat
+
+        key = (self._cache_key, "lonlat", edges_lon, edges_lat, frame)
+        return self.cache.get_or_compute(key, compute)
+
     def coord_to_pix(self, coords):
         coords = MapCoord.create(coords, frame=self.frame, axis_names=self.axes.names)
 
@@ -817,6 +872,15 @@ class WcsGeom(Geom):
 
     @lazyproperty
     def _solid_angle(self):
+        if self.is_regular:
+            key = (self._cache_key, "solid_angle")
+            func = self.to_image()._compute_solid_angle
+            value = self.cache.get_or_compute(key, func)
+            return value.reshape(self.data_shape_image)
+
+        return self._compute_solid_angle()
+
+    def _compute_solid_angle(self):
         if self.is_regular:
             coord = self.to_image().get_coord(mode="edges").skycoord
         else:
@@ -882,8 +946,21 @@ class WcsGeom(Geom):
         separation : `~astropy.coordinates.Angle`
             Separation angle array (2D).
         """
-        coord = self.to_image().get_coord()
-        return center.separation(coord.skycoord)
+
+        def compute():
+            coord = self.to_image().get_coord()
+            return center.separation(coord.skycoord)
+
+        if not (self.is_regular and center.isscalar):
+            return compute()
+
+        frame_attrs = tuple(
+            (name, str(getattr(center.frame, name)))
+            for name in center.frame.frame_attributes
+        )
+        lonlat = (float(center.spherical.lon.deg), float(center.spherical.lat.deg))
+        key = (self._cache_key, "separation", center.frame.name, frame_attrs, lonlat)
+        return self.cache.get_or_compute(key, compute)
 
     def cutout(self, position, width, mode="trim", odd_npix=False, min_npix=1):
         """
@@ -93,6 +93,11 @@ class WcsNDMap(WcsMap):
             WCS map.
         """
         geom = WcsGeom.from_header(hdu.header, hdu_bands, format=format)
+        return cls._from_hdu_and_geom(hdu, geom)
+
+    @classmethod
+    def _from_hdu_and_geom(cls, hdu, geom):
+        """Make a WcsNDMap object from a FITS HDU and its already parsed geometry."""
         shape = geom.axes.shape
         shape_wcs = tuple([np.max(geom.npix[0]), np.max(geom.npix[1])])
 
@@ -166,22 +171,7 @@ class WcsNDMap(WcsMap):
         if not self.geom.is_regular:
             raise ValueError("interp_by_pix only supported for regular geom.")
 
-        grid_pix = [np.arange(n, dtype=float) for n in self.data.shape[::-1]]
-
-        if np.any(np.isfinite(self.data)):
-            data = self.data.copy().T
-            data[~np.isfinite(data)] = 0.0
-        else:
-            data = self.data.T
-
-        fn = ScaledRegularGridInterpolator(
-            grid_pix,
-            data,
-            fill_value=None,
-            bounds_error=False,
-            method=method,
-            values_scale=values_scale,
-        )
+        fn = self._get_interpolator(method=method, values_scale=values_scale)
         interp_data = fn(tuple(pix), clip=False)
 
         if fill_value is not None:
@@ -195,6 +185,35 @@ class WcsNDMap(WcsMap):
 
         return interp_data
 
+    def _get_interpolator(self, method="linear", values_scale="lin"):
+        """Get the interpolator of the data on the pixel grid.
+
+        The interpolator is cached until the data are modified.
+        """
+        key = (method, values_scale)
+        fn = self._interpolators.get(key)
+
+        if fn is None:
+            grid_pix = [np.arange(n, dtype=float) for n in self.data.shape[::-1]]
+
+            if np.any(np.isfinite(self.data)):
+                data = self.data.copy().T
+                data[~np.isfinite(data)] = 0.0
+            else:
+                data = self.data.T
+
+            fn = ScaledRegularGridInterpolator(
+                grid_pix,
+                data,
+                fill_value=None,
+                bounds_error=False,
+                method=method,
+                values_scale=values_scale,
+            )
+            self._interpolators[key] = fn
+
+        return fn
+
     def _interp_by_coord_griddata(self, coords, method="linear"):
         grid_coords = self.geom.get_coord()
 
@@ -233,6 +252,7 @@ class WcsNDMap(WcsMap):
             weights /= np.bincount(idx_inv).astype(self.data.dtype)
 
         self.data.T.flat[idx] += weights
+        self._clear_interpolators()
 
     def fill_by_idx(self, idx, weights=None):
         return self._resample_by_idx(idx, weights=weights, preserve_counts=True)
@@ -240,6 +260,7 @@ class WcsNDMap(WcsMap):
     def set_by_idx(self, idx, vals):
         idx = pix_tuple_to_idx(idx)
         self.data.T[idx] = vals
+        self._clear_interpolators()
 
     def _pad_spatial(
         self, pad_width, axis_name=None, mode="constant", cval=0, method="linear"
@@ -1103,3 +1124,4 @@ class WcsNDMap(WcsMap):
                 raise ValueError("Incompatible spatial geoms between map and weights")
             data = data * weights.data[cutout_slices]
         self.data[parent_slices] += data
+        self._clear_interpolators()
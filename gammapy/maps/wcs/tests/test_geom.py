@@ -9,6 +9,7 @@ from astropy.time import Time
 from regions import CircleSkyRegion
 from gammapy.maps import Map, MapAxis, TimeMapAxis, WcsGeom
 from gammapy.maps.utils import _check_binsz, _check_width
+from gammapy.utils.cache import MAX_NBYTES_DEFAULT
 from gammapy.utils.scripts import make_path
 from gammapy.utils.testing import requires_data
 
@@ -251,6 +252,48 @@ def test_wcsgeom_solid_angle_ait():
     assert np.isnan(solid_angle[0, 0])
 
 
+def test_wcsgeom_cache():
+    WcsGeom.cache.clear()
+
+    geom = WcsGeom.create(
+        skydir=(0, 0), npix=10, binsz=0.1, frame="galactic", axes=axes1
+    )
+    solid_angle = geom.solid_angle()
+    coord = geom.get_coord(frame="icrs")
+    assert not solid_angle.flags.writeable
+
+    info = WcsGeom.cache.info()
+    assert info.hits == 0
+
+    geom_equal = geom.squash("energy").to_image()
+    assert geom_equal._cache_key == geom._cache_key
+    assert solid_angle.shape == (1, 10, 10)
+    assert geom_equal.solid_angle().shape == (10, 10)
+    assert np.shares_memory(geom_equal.solid_angle(), solid_angle)
+    assert np.shares_memory(geom_equal.get_coord(frame="icrs")["lon"], coord["lon"])
+
+    info = WcsGeom.cache.info()
+    assert info.hits == 2
+    assert info.misses == 3
+
+    geom_cutout = geom.cutout(geom.center_skydir, width=0.5 * u.deg)
+    assert geom_cutout._cache_key != geom._cache_key
+
+    coord_ref = geom.pix_to_coord(geom._get_pix_all())
+    assert coord["lon"].shape == (2, 10, 10)
+    assert_allclose(coord.skycoord.galactic.l, coord_ref[0])
+    assert_allclose(coord["energy"], coord_ref[2])
+
+    coord = geom.get_coord(mode="edges", sparse=True)
+    assert coord["lon"].shape == (1, 11, 11)
+    assert coord["energy"].shape == (2, 1, 1)
+
+    WcsGeom.cache.max_nbytes = 0
+    assert len(WcsGeom.cache) == 0
+    WcsGeom.cache.max_nbytes = MAX_NBYTES_DEFAULT
+    WcsGeom.cache.clear()
+
+
 def test_wcsgeom_separation():
     geom = WcsGeom.create(
         skydir=(0, 0),
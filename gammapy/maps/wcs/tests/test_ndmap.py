@@ -1,4 +1,5 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import pickle
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose, assert_equal
@@ -111,6 +112,30 @@ def test_wcsndmap_write_checksum(tmp_path, npix, binsz, frame, proj, skydir, axe
         assert "DATASUM" in hdu.header
 
 
+def test_wcsndmap_read_memmap(tmp_path):
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
+    geom = WcsGeom.create(npix=(20, 10), binsz=0.1, axes=[axis])
+    path = tmp_path / "tmp.fits"
+
+    m0 = WcsNDMap(geom, unit="cm-2")
+    m0.data = np.arange(m0.data.size).reshape(m0.data.shape)
+    m0.write(path)
+
+    m1 = Map.read(path, memmap=True)
+    assert m1.is_memmap
+    assert not Map.read(path).is_memmap
+    assert m1.unit == "cm-2"
+    assert_allclose(m1.data, m0.data)
+
+    m1.data[0, 0, 0] = -1
+    assert_allclose(Map.read(path).data[0, 0, 0], 0)
+
+    cutout = m1.cutout(position=geom.center_skydir, width=0.5 * u.deg)
+    assert_allclose(
+        cutout.data, m0.cutout(position=geom.center_skydir, width=0.5 * u.deg).data
+    )
+
+
 def test_wcsndmap_read_write_fgst(tmp_path):
     path = tmp_path / "tmp.fits"
 
@@ -357,6 +382,48 @@ def test_wcsndmap_interp_by_coord_fill_value():
     assert_allclose(m.interp_by_coord((99, 0)), 42)
 
 
+def test_wcsndmap_interp_cache():
+    m = Map.create(npix=(3, 3))
+    m.data += np.arange(9).reshape((3, 3))
+    coords = {"lon": 0.07, "lat": 0.03}
+
+    assert_allclose(m.interp_by_coord(coords), 4.2)
+    fn = m._interpolators[("linear", "lin")]
+
+    assert_allclose(m.interp_by_coord(coords), 4.2)
+    assert m._interpolators[("linear", "lin")] is fn
+
+    m.interp_by_coord(coords, method="nearest")
+    assert len(m._interpolators) == 2
+
+    m.set_by_idx((1, 1), 0)
+    assert m._interpolators == {}
+    expected = Map.from_geom(m.geom, data=m.data.copy()).interp_by_coord(coords)
+    assert_allclose(m.interp_by_coord(coords), expected)
+
+    m.data = np.ones((3, 3))
+    assert_allclose(m.interp_by_coord(coords), 1.0)
+
+    m.stack(Map.create(npix=(3, 3)) + 1)
+    assert_allclose(m.interp_by_coord(coords), 2.0)
+
+    m2 = pickle.loads(pickle.dumps(m))
+    assert m2._interpolators == {}
+    assert_allclose(m2.interp_by_coord(coords), 2.0)
+
+
+def test_wcsndmap_interp_cache_memmap(tmp_path):
+    m = Map.from_geom(WcsGeom.create(npix=(3, 3)), filename=tmp_path / "map.npy")
+    m.data[...] = 1
+    coords = {"lon": 0.07, "lat": 0.03}
+
+    assert_allclose(m.interp_by_coord(coords), 1.0)
+
+    m *= 3
+    assert m.is_memmap
+    assert_allclose(m.interp_by_coord(coords), 3.0)
+
+
 @pytest.mark.parametrize(
     ("npix", "binsz", "frame", "proj", "skydir", "axes"), wcs_test_geoms
 )
@@ -1,9 +1,12 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import copy
 import html
 import itertools
 import logging
+from itertools import repeat
 import numpy as np
 from astropy.table import Table
+import gammapy.utils.parallel as parallel
 from gammapy.utils.pbar import progress_bar
 from gammapy.modeling.utils import _parse_datasets
 from .covariance import Covariance
@@ -13,7 +16,15 @@ from .iminuit import (
     covariance_iminuit,
     optimize_iminuit,
 )
-from .scipy import confidence_scipy, optimize_scipy
+from .scipy import (
+    _contour_angles,
+    _contour_point_scipy,
+    _contour_result,
+    confidence_scipy,
+    contour_scipy,
+    optimize_scipy,
+)
+from .parameter import Parameters
 from .sherpa import optimize_sherpa
 
 __all__ = ["Fit", "FitResult", "OptimizeResult", "CovarianceResult"]
@@ -48,6 +59,10 @@ class Registry:
             # "sherpa": confidence_sherpa,
             "scipy": confidence_scipy,
         },
+        "contour": {
+            "minuit": contour_iminuit,
+            "scipy": contour_scipy,
+        },
     }
 
     @classmethod
@@ -66,7 +81,45 @@ class Registry:
 registry = Registry()
 
 
-class Fit:
+def _optimize_fixed_from_pool(key, fit, indices, values):
+    """Optimize the shared datasets with fixed parameters."""
+    datasets = parallel.get_shared_data(key)
+
+    with datasets.parameters.restore_status():
+        parameters = [datasets.parameters[idx] for idx in indices]
+        result = fit._optimize_fixed(datasets, parameters, values)
+
+    # the minuit object holds a reference to the datasets
+    result._minuit = None
+    return result
+
+
+def _confidence_from_pool(key, fit, index, sigma, reoptimize):
+    """Estimate the confidence interval of a parameter of the shared datasets."""
+    datasets = parallel.get_shared_data(key)
+    parameter = datasets.parameters[index]
+    return fit._confidence(datasets, parameter, sigma, reoptimize)
+
+
+def _contour_point_from_pool(key, indices, angle, sigma, kwargs):
+    """Compute a contour point of the shared datasets."""
+    datasets = parallel.get_shared_data(key)
+    parameters = datasets.parameters
+    x, y = [parameters[idx] for idx in indices]
+
+    with parameters.restore_status():
+        return _contour_point_scipy(
+            parameters=parameters,
+            function=datasets.stat_sum,
+            x=x,
+            y=y,
+            angle=angle,
+            sigma=sigma,
+            **kwargs,
+        )
+
+
+class Fit(parallel.ParallelMixin):
     """Fit class.
 
     The fit class provides a uniform interface to multiple fitting backends.
@@ -109,8 +162,24 @@ class Fit:
         a ``maxcall`` option. For the scipy backend ``confidence_opts`` are forwarded
         to `~scipy.optimize.brentq`. If the confidence estimation fails, the bracketing
         interval can be adapted by modifying the upper bound of the interval (``b``) value.
+    contour_opts : dict
+        Contour options used by `Fit.stat_contour`. The ``"backend"`` entry
+        selects ``"minuit"`` (`iminuit.Minuit.mncontour`) or ``"scipy"``, the
+        other entries are passed to the contour function of the backend.
+        Default is ``{"backend": "minuit"}``, independently of ``backend``.
     store_trace : bool
         Whether to store the trace of the fit.
+    n_jobs : int, optional
+        Number of processes used to compute the re-optimized points of
+        `Fit.stat_profile` and `Fit.stat_surface`, the confidence intervals of
+        several parameters in `Fit.confidence` and the contour points of the
+        scipy backend in `Fit.stat_contour` in parallel. The worker processes
+        start from the current parameter values and errors, typically the best
+        fit and its covariance. Default is one, unless
+        `~gammapy.utils.parallel.N_JOBS_DEFAULT` was modified.
+    parallel_backend : {"multiprocessing", "ray"}, optional
+        Which backend to use for multiprocessing.
+        Defaults to `~gammapy.utils.parallel.BACKEND_DEFAULT`.
     """
 
     def __init__(
@@ -119,10 +188,15 @@ class Fit:
         optimize_opts=None,
         covariance_opts=None,
         confidence_opts=None,
+        contour_opts=None,
         store_trace=False,
+        n_jobs=None,
+        parallel_backend=None,
     ):
         self.store_trace = store_trace
         self.backend = backend
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
 
         if optimize_opts is None:
             optimize_opts = {"backend": backend}
@@ -133,9 +207,13 @@ class Fit:
         if confidence_opts is None:
             confidence_opts = {"backend": backend}
 
+        if contour_opts is None:
+            contour_opts = {"backend": "minuit"}
+
         self.optimize_opts = optimize_opts
         self.covariance_opts = covariance_opts
         self.confidence_opts = confidence_opts
+        self.contour_opts = contour_opts
         self._minuit = None
 
     def _repr_html_(self):
@@ -310,12 +388,15 @@ class Fit:
         confidence estimation fails, the bracketing interval can be adapted by modifying the
         upper bound of the interval (``b``) value.
 
+        If several parameters are given, their confidence intervals are
+        computed independently, in parallel if ``n_jobs`` is larger than one.
+
         Parameters
         ----------
         datasets : `Datasets` or list of `Dataset`
             Datasets to optimize.
-        parameter : `~gammapy.modeling.Parameter`
-            Parameter of interest.
+        parameter : `~gammapy.modeling.Parameter` or list of `~gammapy.modeling.Parameter`
+            Parameter or parameters of interest.
         sigma : float, optional
             Number of standard deviations for the confidence level. Default is 1.
         reoptimize : bool, optional
@@ -324,11 +405,39 @@ class Fit:
 
         Returns
         -------
-        result : dict
-            Dictionary with keys "errp", 'errn", "success" and "nfev".
+        result : dict or list of dict
+            Dictionary with keys "errp", 'errn", "success" and "nfev". A list
+            of dictionaries, one per parameter, if several parameters are given.
         """
         datasets, parameters = _parse_datasets(datasets=datasets)
 
+        if not isinstance(parameter, (list, tuple, Parameters)):
+            return self._confidence(datasets, parameter, sigma, reoptimize)
+
+        parameter = [parameters[par] for par in parameter]
+
+        if self._run_serial(datasets):
+            return [
+                self._confidence(datasets, par, sigma, reoptimize)
+                for par in progress_bar(parameter, desc="Confidence")
+            ]
+
+        return self._run_pool(
+            datasets,
+            _confidence_from_pool,
+            zip(
+                repeat(self._copy_for_pool()),
+                [parameters.index(par) for par in parameter],
+                repeat(sigma),
+                repeat(reoptimize),
+            ),
+            task_name="Confidence",
+        )
+
+    def _confidence(self, datasets, parameter, sigma, reoptimize):
+        """Estimate the confidence interval of a single parameter."""
+        parameters = datasets.parameters
+
         kwargs = self.confidence_opts.copy()
         backend = kwargs.pop("backend", self.backend)
 
@@ -349,6 +458,62 @@ class Fit:
         result["errn"] *= parameter.scale
         return result
 
+    def _optimize_fixed(self, datasets, parameters, values):
+        """Optimize the other free parameters with the given parameters fixed."""
+        for par, value in zip(parameters, values):
+            par.value, par.frozen = value, True
+
+        return self.optimize(datasets=datasets)
+
+    def _optimize_scan(self, datasets, parameters, values):
+        """Optimize the other free parameters for each row of parameter values.
+
+        The scan points are optimized one after the other, starting from the
+        best fit of the previous point, or in parallel if ``n_jobs`` is larger
+        than one, each starting from the current parameter values. In the
+        latter case the `OptimizeResult.minuit` objects are not returned.
+        """
+        if self._run_serial(datasets):
+            return [
+                self._optimize_fixed(datasets, parameters, row)
+                for row in progress_bar(values, desc="Scan values")
+            ]
+
+        indices = [datasets.parameters.index(par) for par in parameters]
+
+        return self._run_pool(
+            datasets,
+            _optimize_fixed_from_pool,
+            zip(repeat(self._copy_for_pool()), repeat(indices), values),
+            task_name="Scan values",
+        )
+
+    def _run_serial(self, datasets):
+        """Whether independent fits of the datasets are run in this process."""
+        from gammapy.datasets.actors import DatasetsActor
+
+        return self.n_jobs == 1 or isinstance(datasets, DatasetsActor)
+
+    def _copy_for_pool(self):
+        """Copy of the fit to be sent to the worker processes."""
+        fit = copy.copy(self)
+        fit._minuit, fit.n_jobs = None, 1
+        return fit
+
+    def _run_pool(self, datasets, func, inputs, task_name):
+        """Run a function on the datasets shared with the worker processes.
+
+        The function receives the key of the shared datasets as first argument.
+        """
+        with parallel.shared_data(datasets) as shared:
+            return parallel.run_multiprocessing(
+                func,
+                [(shared.key,) + tuple(args) for args in inputs],
+                backend=self.parallel_backend,
+                pool_kwargs=dict(processes=self.n_jobs, **shared.pool_kwargs),
+                task_name=task_name,
+            )
+
     def stat_profile(self, datasets, parameter, reoptimize=False):
         """Compute fit statistic profile.
 
@@ -399,19 +564,15 @@ class Fit:
         parameter = parameters[parameter]
         values = parameter.scan_values
 
-        stats = []
         fit_results = []
         with parameters.restore_status():
-            for value in progress_bar(values, desc="Scan values"):
-                parameter.value = value
-                if reoptimize:
-                    parameter.frozen = True
-                    result = self.optimize(datasets=datasets)
-                    stat = result.total_stat
-                    fit_results.append(result)
-                else:
-                    stat = datasets.stat_sum()
-                stats.append(stat)
+            if reoptimize:
+                fit_results = self._optimize_scan(
+                    datasets, [parameter], values[:, np.newaxis]
+                )
+                stats = [result.total_stat for result in fit_results]
+            else:
+                stats = datasets.stat_sum_batch([parameter], values[:, np.newaxis])
 
         idx = datasets.parameters.index(parameter)
         name = datasets.models.parameters_unique_names[idx]
@@ -483,24 +644,15 @@ class Fit:
         x = parameters[x]
         y = parameters[y]
 
-        stats = []
         fit_results = []
+        values = np.array(list(itertools.product(x.scan_values, y.scan_values)))
 
         with parameters.restore_status():
-            for x_value, y_value in progress_bar(
-                itertools.product(x.scan_values, y.scan_values), desc="Trial values"
-            ):
-                x.value, y.value = x_value, y_value
-
-                if reoptimize:
-                    x.frozen, y.frozen = True, True
-                    result = self.optimize(datasets=datasets)
-                    stat = result.total_stat
-                    fit_results.append(result)
-                else:
-                    stat = datasets.stat_sum()
-
-                stats.append(stat)
+            if reoptimize:
+                fit_results = self._optimize_scan(datasets, [x, y], values)
+                stats = [result.total_stat for result in fit_results]
+            else:
+                stats = datasets.stat_sum_batch([x, y], values)
 
         shape = (len(x.scan_values), len(y.scan_values))
         stats = np.array(stats).reshape(shape)
@@ -522,7 +674,12 @@ class Fit:
     def stat_contour(self, datasets, x, y, numpoints=10, sigma=1):
         """Compute stat contour.
 
-        Calls ``iminuit.Minuit.mncontour``.
+        Calls ``iminuit.Minuit.mncontour`` for the "minuit" backend. For the
+        "scipy" backend the contour is found along rays from the best fit,
+        equally spaced in angle in units of the parameter errors. These
+        contour points are independent and computed in parallel if ``n_jobs``
+        is larger than one. The backend is taken from ``contour_opts`` and
+        falls back to "minuit" if it is not given.
 
         This is a contouring algorithm for a 2D function
         which is not simply the fit statistic function.
@@ -581,15 +738,32 @@ class Fit:
         name_x = datasets.models.parameters_unique_names[i1]
         name_y = datasets.models.parameters_unique_names[i2]
 
-        with parameters.restore_status():
-            result = contour_iminuit(
-                parameters=parameters,
-                function=datasets.stat_sum,
-                x=x,
-                y=y,
-                numpoints=numpoints,
-                sigma=sigma,
+        kwargs = self.contour_opts.copy()
+        backend = kwargs.pop("backend", "minuit")
+
+        if backend == "scipy" and not self._run_serial(datasets):
+            angles = _contour_angles(numpoints)
+            indices = [parameters.index(x), parameters.index(y)]
+            points = self._run_pool(
+                datasets,
+                _contour_point_from_pool,
+                zip(repeat(indices), angles, repeat(sigma), repeat(kwargs)),
+                task_name="Contour points",
             )
+            result = _contour_result(points)
+        else:
+            compute = registry.get("contour", backend)
+
+            with parameters.restore_status():
+                result = compute(
+                    parameters=parameters,
+                    function=datasets.stat_sum,
+                    x=x,
+                    y=y,
+                    numpoints=numpoints,
+                    sigma=sigma,
+                    **kwargs,
+                )
 
         x = result["x"] * x.scale
         y = result["y"] * y.scale
@@ -7,6 +7,7 @@ from .likelihood import Likelihood
 
 __all__ = [
     "confidence_scipy",
+    "contour_scipy",
     "covariance_scipy",
     "optimize_scipy",
     "stat_profile_ul_scipy",
@@ -132,6 +133,116 @@ def confidence_scipy(parameters, parameter, function, sigma, reoptimize=True, **
     return result
 
 
+def _contour_point_scipy(
+    parameters, function, x, y, angle, sigma, reoptimize=True, **kwargs
+):
+    """Find the crossing of the contour along a ray starting at the current values.
+
+    The direction of the ray is given by ``angle``, in units of the errors of
+    ``x`` and ``y``. Both parameters are frozen along the ray, the other free
+    parameters are re-optimized at each step if ``reoptimize`` is True.
+    """
+    stat_null = function()
+    x0, y0 = x.factor, y.factor
+
+    steps = []
+    for par, direction in zip([x, y], [np.cos(angle), np.sin(angle)]):
+        error = par.error / par.scale
+        if error == 0 or not np.isfinite(error):
+            error = 1
+        steps.append(direction * error)
+
+    # largest distance allowed by the parameter limits
+    t_max = np.inf
+    for par, start, step in zip([x, y], [x0, y0], steps):
+        limit = par.factor_max if step > 0 else par.factor_min
+        if step != 0 and np.isfinite(limit):
+            t_max = min(t_max, (limit - start) / step)
+
+    x.frozen, y.frozen = True, True
+    reoptimize = reoptimize and len(parameters.free_parameters) > 0
+
+    def fcn(t):
+        x.factor, y.factor = x0 + t * steps[0], y0 + t * steps[1]
+        if reoptimize:
+            optimize_scipy(parameters, function, method="L-BFGS-B")
+        return function() - stat_null - sigma**2
+
+    lower_bound, upper_bound = 0, min(sigma, t_max)
+
+    for _ in range(30):
+        if fcn(upper_bound) > 0 or upper_bound >= t_max:
+            break
+        lower_bound, upper_bound = upper_bound, min(2 * upper_bound, t_max)
+
+    kwargs.setdefault("nbin", 1)
+    roots, res = find_roots(
+        fcn, lower_bound=lower_bound, upper_bound=upper_bound, **kwargs
+    )
+    t = roots[0]
+    return x0 + t * steps[0], y0 + t * steps[1], res[0].iterations
+
+
+def contour_scipy(parameters, function, x, y, numpoints, sigma, **kwargs):
+    """Compute a contour by finding its crossing along rays from the best fit.
+
+    The rays are equally spaced in angle, in units of the parameter errors.
+    Each point is computed independently, starting from the current parameter
+    values.
+
+    Parameters
+    ----------
+    parameters : `~gammapy.modeling.Parameters`
+        Parameters at the best fit.
+    function : callable
+        Likelihood function.
+    x, y : `~gammapy.modeling.Parameter`
+        Parameters of interest.
+    numpoints : int
+        Number of contour points.
+    sigma : float
+        Number of standard deviations for the confidence level.
+    **kwargs : dict
+        Keyword arguments passed to `~gammapy.utils.roots.find_roots`.
+
+    Returns
+    -------
+    result : dict
+        Dictionary with the factors of the contour points "x" and "y", the
+        boolean flag "success" and the number of root finding iterations "nfev".
+    """
+    points = []
+    for angle in _contour_angles(numpoints):
+        with parameters.restore_status():
+            points.append(
+                _contour_point_scipy(
+                    parameters=parameters,
+                    function=function,
+                    x=x,
+                    y=y,
+                    angle=angle,
+                    sigma=sigma,
+                    **kwargs,
+                )
+            )
+
+    return _contour_result(points)
+
+
+def _contour_angles(numpoints):
+    return np.linspace(0, 2 * np.pi, numpoints, endpoint=False)
+
+
+def _contour_result(points):
+    x, y, nfev = np.array(points).T
+    return {
+        "success": bool(np.all(np.isfinite(x) & np.isfinite(y))),
+        "x": x,
+        "y": y,
+        "nfev": int(nfev.sum()),
+    }
+
+
 # TODO: implement, e.g. with numdifftools.Hessian
 def covariance_scipy(parameters, function):
     raise NotImplementedError
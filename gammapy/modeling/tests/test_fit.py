@@ -2,6 +2,7 @@
 """Unit tests for the Fit class"""
 
 import pytest
+import numpy as np
 from numpy.testing import assert_allclose
 from astropy.table import Table
 from gammapy.datasets import Dataset, Datasets, SpectrumDatasetOnOff
@@ -203,6 +204,28 @@ def test_confidence(backend):
     assert_allclose(dataset.models.parameters["x"].value, 2)
 
 
+@pytest.mark.parametrize("backend", ["minuit"])
+def test_confidence_multiple(backend):
+    dataset = MyDataset()
+    fit = Fit(backend=backend)
+    fit.optimize([dataset])
+    results = fit.confidence(datasets=[dataset], parameter=["x", "z"])
+
+    assert len(results) == 2
+    for result in results:
+        assert_allclose(result["errp"], 1, rtol=1e-3)
+        assert_allclose(result["errn"], 1, rtol=1e-3)
+
+    fit.n_jobs = 2
+    results_parallel = fit.confidence(datasets=[dataset], parameter=["x", "z"])
+
+    for result, result_parallel in zip(results, results_parallel):
+        assert_allclose(result_parallel["errp"], result["errp"])
+        assert_allclose(result_parallel["errn"], result["errn"])
+
+    assert_allclose(dataset.models.parameters["x"].value, 2, rtol=1e-3)
+
+
 @pytest.mark.parametrize("backend", ["minuit"])
 def test_confidence_frozen(backend):
     dataset = MyDataset()
@@ -231,6 +254,21 @@ def test_stat_profile():
     assert_allclose(dataset.models.parameters["x"].value, 2)
 
 
+def test_stat_profile_progress_bar(monkeypatch):
+    descs = []
+
+    def progress_bar(iterable, desc=None):
+        descs.append(desc)
+        return iterable
+
+    monkeypatch.setattr("gammapy.datasets.core.progress_bar", progress_bar)
+
+    dataset = MyDataset()
+    dataset.models.parameters["x"].scan_n_values = 3
+    Fit().stat_profile(datasets=[dataset], parameter="x")
+    assert descs == ["Scan values"]
+
+
 def test_stat_profile_reoptimize():
     dataset = MyDataset()
     fit = Fit()
@@ -302,6 +340,28 @@ def test_stat_surface_reoptimize():
     )
 
 
+def test_stat_surface_reoptimize_parallel():
+    dataset = MyDataset()
+    fit = Fit(n_jobs=2)
+    fit.run([dataset])
+
+    dataset.models.parameters["z"].value = 0
+    dataset.models.parameters["x"].scan_values = [1, 2, 3]
+    dataset.models.parameters["y"].scan_values = [2e2, 3e2, 4e2]
+
+    result = fit.stat_surface(datasets=[dataset], x="x", y="y", reoptimize=True)
+
+    expected_stat = [
+        [1.0001e04, 1.0000e00, 1.0001e04],
+        [1.0000e04, 0.0000e00, 1.0000e04],
+        [1.0001e04, 1.0000e00, 1.0001e04],
+    ]
+    assert_allclose(list(result["stat_scan"]), expected_stat, atol=1e-7)
+    assert result["fit_results"].shape == (3, 3)
+    assert_allclose(dataset.models.parameters["z"].value, 0)
+    assert not dataset.models.parameters["x"].frozen
+
+
 def test_stat_contour():
     dataset = MyDataset()
     dataset.models.parameters["x"].frozen = True
@@ -325,6 +385,46 @@ def test_stat_contour():
     assert_allclose(dataset.models.parameters["y"].value, 300)
 
 
+@pytest.mark.parametrize("backend", ["scipy", "sherpa"])
+def test_stat_contour_default_backend(backend):
+    dataset = MyDataset()
+    dataset.models.parameters["x"].frozen = True
+    Fit().optimize([dataset])
+
+    fit = Fit(backend=backend)
+    result = fit.stat_contour(datasets=[dataset], x="y", y="z", numpoints=4)
+    result_minuit = Fit().stat_contour(datasets=[dataset], x="y", y="z", numpoints=4)
+
+    assert_allclose(result["test.y"], result_minuit["test.y"])
+    assert_allclose(result["test.z"], result_minuit["test.z"])
+
+
+def test_stat_contour_scipy():
+    dataset = MyDataset()
+    dataset.models.parameters["x"].frozen = True
+    fit = Fit(contour_opts={"backend": "scipy"})
+    fit.run([dataset])
+    result = fit.stat_contour(datasets=[dataset], x="y", y="z", numpoints=8)
+
+    assert result["success"]
+
+    x, y = result["test.y"], result["test.z"]
+    assert len(x) == 8
+    assert_allclose(x[:3], [301, 300.707107, 300], rtol=1e-5)
+    assert_allclose(y[:3], [0.04, 0.747107, 1.04], rtol=1e-5)
+    assert_allclose(np.hypot(x - 300, y - 0.04), 1, rtol=1e-5)
+
+    fit.n_jobs = 2
+    result_parallel = fit.stat_contour(datasets=[dataset], x="y", y="z", numpoints=8)
+    assert_allclose(result_parallel["test.y"], x)
+    assert_allclose(result_parallel["test.z"], y)
+
+    # Check that original value state wasn't changed
+    assert_allclose(dataset.models.parameters["y"].value, 300)
+    assert dataset.models.parameters["x"].frozen
+    assert not dataset.models.parameters["y"].frozen
+
+
 @requires_data()
 def test_write(tmpdir):
     datasets = Datasets()
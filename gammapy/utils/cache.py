@@ -0,0 +1,158 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Process-wide caching of derived arrays."""
+import logging
+import threading
+from collections import OrderedDict, namedtuple
+import numpy as np
+
+log = logging.getLogger(__name__)
+
+__all__ = ["ArrayCache", "CacheInfo", "MAX_NBYTES_DEFAULT"]
+
+MAX_NBYTES_DEFAULT = 256 * 1024**2
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "n_items", "nbytes", "max_nbytes"]
+)
+
+
+def _get_arrays(value):
+    """Get the list of arrays contained in a cached value."""
+    if isinstance(value, np.ndarray):
+        return [value]
+    elif isinstance(value, (tuple, list)):
+        return [array for item in value for array in _get_arrays(item)]
+    else:
+        raise TypeError(f"Cannot cache value of type {type(value)!r}")
+
+
+class ArrayCache:
+    """Size-bounded least recently used cache of arrays.
+
+    The cache stores `~numpy.ndarray` objects (including
+    `~astropy.units.Quantity`), or tuples of them, under hashable keys.
+    Stored arrays are set read-only, as they are shared between all users of
+    the cache. When the total size of the stored arrays exceeds
+    ``max_nbytes``, the least recently used entries are evicted.
+
+    Parameters
+    ----------
+    max_nbytes : int, optional
+        Maximum total size of the cached arrays in bytes. Setting it to zero
+        disables the cache. Default is `MAX_NBYTES_DEFAULT`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from gammapy.utils.cache import ArrayCache
+    >>> cache = ArrayCache(max_nbytes=1024)
+    >>> value = cache.get_or_compute("ones", lambda: np.ones(10))
+    >>> value = cache.get_or_compute("ones", lambda: np.ones(10))
+    >>> cache.info()
+    CacheInfo(hits=1, misses=1, n_items=1, nbytes=80, max_nbytes=1024)
+    """
+
+    def __init__(self, max_nbytes=MAX_NBYTES_DEFAULT):
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+        self._max_nbytes = int(max_nbytes)
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_nbytes(self):
+        """Maximum total size of the cached arrays in bytes."""
+        return self._max_nbytes
+
+    @max_nbytes.setter
+    def max_nbytes(self, value):
+        with self._lock:
+            self._max_nbytes = int(value)
+            self._evict()
+
+    @property
+    def nbytes(self):
+        """Total size of the cached arrays in bytes."""
+        return self._nbytes
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def info(self):
+        """Cache statistics.
+
+        Returns
+        -------
+        info : `CacheInfo`
+            Named tuple with the number of hits and misses, the number of
+            cached items, their total size and the maximum size in bytes.
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                n_items=len(self._data),
+                nbytes=self._nbytes,
+                max_nbytes=self._max_nbytes,
+            )
+
+    def clear(self):
+        """Remove all items and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def _evict(self):
+        while self._nbytes > self._max_nbytes and self._data:
+            key, (_, nbytes) = self._data.popitem(last=False)
+            self._nbytes -= nbytes
+            log.debug(f"Evicted {key!r} from cache")
+
+    def get_or_compute(self, key, func):
+        """Get a cached value or compute and cache it.
+
+        Parameters
+        ----------
+        key : hashable
+            Cache key.
+        func : callable
+            Function without arguments computing the value if it is not cached.
+
+        Returns
+        -------
+        value : `~numpy.ndarray` or tuple of `~numpy.ndarray`
+            Cached value.
+        """
+        with self._lock:
+            item = self._data.get(key)
+
+            if item is not None:
+                self._data.move_to_end(key)
+                self._hits += 1
+                return item[0]
+
+            self._misses += 1
+
+        value = func()
+        arrays = _get_arrays(value)
+        nbytes = sum(array.nbytes for array in arrays)
+
+        if nbytes > self._max_nbytes:
+            return value
+
+        for array in arrays:
+            array.flags.writeable = False
+
+        with self._lock:
+            if key not in self._data:
+                self._data[key] = (value, nbytes)
+                self._nbytes += nbytes
+                self._evict()
+
+        return value
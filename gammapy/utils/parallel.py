@@ -2,6 +2,7 @@
 """Multiprocessing and multithreading setup."""
 import importlib
 import logging
+import uuid
 from enum import Enum
 from gammapy.utils.pbar import progress_bar
 
@@ -49,6 +50,9 @@ POOL_KWARGS_DEFAULT = dict(processes=N_JOBS_DEFAULT)
 METHOD_DEFAULT = PoolMethodEnum.starmap
 METHOD_KWARGS_DEFAULT = {}
 
+# data shared with the tasks of a pool, by key, see `shared_data`
+_SHARED_DATA = {}
+
 
 def get_multiprocessing():
     """Get multiprocessing module."""
@@ -149,6 +153,75 @@ class multiprocessing_manager:
         N_JOBS_DEFAULT = self._n_jobs
 
 
+def _set_shared_data(key, data):
+    """Set shared data in the current process, used as pool initializer."""
+    _SHARED_DATA[key] = data
+
+
+def get_shared_data(key):
+    """Get data shared with the tasks of a pool, see `shared_data`.
+
+    Parameters
+    ----------
+    key : str
+        Key of the shared data.
+
+    Returns
+    -------
+    data : object
+        Shared data.
+    """
+    return _SHARED_DATA[key]
+
+
+class shared_data:
+    """Context manager to share data with the tasks run by `run_multiprocessing`.
+
+    The data are registered under a unique key in the current process and,
+    using the ``pool_kwargs`` of this object, once in each worker process
+    instead of being sent with every task. The tasks only receive the key and
+    get the data with `get_shared_data`. As the key is unique, nested or
+    concurrent runs sharing different data do not interfere.
+
+    Parameters
+    ----------
+    data : object
+        Data to share.
+
+    Examples
+    --------
+    ::
+
+        import gammapy.utils.parallel as parallel
+
+        def task(key, idx):
+            return parallel.get_shared_data(key)[idx]
+
+        with parallel.shared_data(datasets) as shared:
+            results = parallel.run_multiprocessing(
+                task,
+                [(shared.key, idx) for idx in range(len(datasets))],
+                pool_kwargs=dict(processes=2, **shared.pool_kwargs),
+            )
+    """
+
+    def __init__(self, data):
+        self.key = uuid.uuid4().hex
+        self.data = data
+
+    @property
+    def pool_kwargs(self):
+        """Pool keyword arguments setting the data in the worker processes (dict)."""
+        return dict(initializer=_set_shared_data, initargs=(self.key, self.data))
+
+    def __enter__(self):
+        _set_shared_data(self.key, self.data)
+        return self
+
+    def __exit__(self, type, value, traceback):
+        _SHARED_DATA.pop(self.key, None)
+
+
 class ParallelMixin:
     """Mixin class to handle parallel processing."""
 
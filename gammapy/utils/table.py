@@ -13,7 +13,7 @@ __all__ = [
 ]
 
 
-def hstack_columns(table, table_other):
+def hstack_columns(table, table_other, *tables):
     """Stack the column data horizontally.
 
     Parameters
@@ -22,6 +22,8 @@ def hstack_columns(table, table_other):
         Input table.
     table_other : `~astropy.table.Table`
         Other input table.
+    *tables : `~astropy.table.Table`
+        Additional input tables, stacked in order.
 
     Returns
     -------
@@ -29,9 +31,10 @@ def hstack_columns(table, table_other):
         Stacked table.
     """
     stacked = Table()
+    tables = (table, table_other) + tables
 
     for column in table.colnames:
-        data = np.hstack([table[column].data[0], table_other[column].data[0]])
+        data = np.hstack([_[column].data[0] for _ in tables])
         stacked[column] = data[np.newaxis, :]
     return stacked
 
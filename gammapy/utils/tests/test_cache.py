@@ -0,0 +1,47 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import pytest
+import numpy as np
+from numpy.testing import assert_allclose
+import astropy.units as u
+from gammapy.utils.cache import ArrayCache
+
+
+def test_array_cache():
+    cache = ArrayCache(max_nbytes=200)
+
+    value = cache.get_or_compute("a", lambda: np.ones(10))
+    assert not value.flags.writeable
+
+    value = cache.get_or_compute("a", lambda: np.zeros(10))
+    assert_allclose(value, 1)
+
+    value = cache.get_or_compute("b", lambda: (np.ones(5) * u.m, np.ones(5)))
+    assert value[0].unit == "m"
+    assert "b" in cache
+
+    info = cache.info()
+    assert info.hits == 1
+    assert info.misses == 2
+    assert info.n_items == 2
+    assert info.nbytes == 160
+
+    # least recently used item is evicted
+    cache.get_or_compute("a", lambda: np.ones(10))
+    cache.get_or_compute("c", lambda: np.ones(10))
+    assert "b" not in cache
+    assert len(cache) == 2
+
+    # items larger than the cache are not stored
+    value = cache.get_or_compute("d", lambda: np.ones(100))
+    assert value.flags.writeable
+    assert "d" not in cache
+
+    cache.max_nbytes = 100
+    assert len(cache) == 1
+    assert cache.nbytes == 80
+
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 0, 100)
+
+    with pytest.raises(TypeError):
+        cache.get_or_compute("e", lambda: 1)
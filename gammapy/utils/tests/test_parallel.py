@@ -78,6 +78,34 @@ def test_run_multiprocessing_simple_apply_async():
     assert task.sum_squared == N * (N + 1) * (2 * N + 1) / 6
 
 
+def shared_item(key, idx):
+    return parallel.get_shared_data(key)[idx]
+
+
+def nested_shared_sum(key, idx):
+    with parallel.shared_data([idx, 10 * idx]) as shared:
+        values = parallel.run_loop(
+            shared_item, [(shared.key, 0), (shared.key, 1)], method_kwargs={}
+        )
+    return sum(values) + parallel.get_shared_data(key)[idx]
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_run_multiprocessing_shared_data(processes):
+    data = [1, 2, 3]
+
+    with parallel.shared_data(data) as shared:
+        result = parallel.run_multiprocessing(
+            func=nested_shared_sum,
+            inputs=[(shared.key, idx) for idx in range(len(data))],
+            pool_kwargs=dict(processes=processes, **shared.pool_kwargs),
+        )
+        assert parallel.get_shared_data(shared.key) is data
+
+    assert result == [1, 13, 25]
+    assert shared.key not in parallel._SHARED_DATA
+
+
 @requires_dependency("ray")
 def test_run_multiprocessing_simple_ray_starmap():
     N = 10